@@ -0,0 +1,163 @@
+import tempfile
+from types import SimpleNamespace
+import unittest
+
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from webweaver_node.core.common.enums import CacheMode
+from webweaver_node.core.webscraping.middleware.spider_request import SpiderRequest
+from webweaver_node.core.webscraping.spiders.aiohttp_api import AiohttpAPI
+from webweaver_node.core.webscraping.spiders.http_cache import HttpCache, cache_key
+
+
+HTML_HEADERS = {'Content-Type': 'text/html; charset=utf-8', 'ETag': '"v1"'}
+
+
+def evict_all(cache:HttpCache):
+    """Evicts every entry, as a concurrent store() can between a lookup and a read."""
+    cache.max_size = 0
+    with cache.index_lock:
+        cache._evict()
+
+
+class FakeResponse:
+    """The parts of aiohttp.ClientResponse HttpCache reads."""
+
+    def __init__(self, url:str, status:int, body:bytes=b'', headers:dict=None, content_length:int=None):
+        self.url = URL(url)
+        self.status = status
+        self.body = body
+        self.headers = CIMultiDictProxy(CIMultiDict(headers or {}))
+        self.content_length = content_length
+        self.released = False
+
+    async def read(self) -> bytes:
+        return self.body
+
+    def release(self):
+        self.released = True
+
+
+class TestHttpCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = HttpCache(
+            directory=self.directory.name,
+            mode=CacheMode.REVALIDATE,
+            max_size=250,
+            max_entry_size=100,
+            ttl=0,
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def store(self, url:str, body:bytes):
+        return await self.cache.store(cache_key(url), url, 200, HTML_HEADERS, body)
+
+    async def test_store_and_lookup(self):
+        url = "https://example.com/page"
+        await self.store(url, b"<html>page</html>")
+        entry = await self.cache.lookup(cache_key(url))
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry.url, url)
+        self.assertEqual(entry.etag, '"v1"')
+        self.assertEqual(await self.cache.hit(entry), b"<html>page</html>")
+        self.assertEqual(self.cache.stats.hits, 1)
+        self.assertEqual(self.cache.stats.stored, 1)
+
+    async def test_least_recently_used_entry_is_evicted(self):
+        await self.store("https://example.com/1", b"1" * 100)
+        await self.store("https://example.com/2", b"2" * 100)
+        await self.cache.read_body(await self.cache.lookup(cache_key("https://example.com/1")))
+        await self.store("https://example.com/3", b"3" * 100)  # 300 bytes > max_size
+        self.assertIsNone(await self.cache.lookup(cache_key("https://example.com/2")))
+        self.assertIsNotNone(await self.cache.lookup(cache_key("https://example.com/1")))
+        self.assertIsNotNone(await self.cache.lookup(cache_key("https://example.com/3")))
+        self.assertEqual(self.cache.stats.evicted, 1)
+        self.assertEqual(self.cache.total_size, 200)
+
+    async def test_store_refuses_body_over_max_entry_size(self):
+        self.assertTrue(self.cache.is_cacheable(200, HTML_HEADERS, size=None))
+        self.assertIsNone(await self.store("https://example.com/big", b"x" * 101))
+        self.assertIsNone(await self.cache.lookup(cache_key("https://example.com/big")))
+        self.assertEqual(self.cache.total_size, 0)
+
+    async def test_entry_evicted_after_lookup_is_a_miss(self):
+        url = "https://example.com/page"
+        await self.store(url, b"<html>page</html>")
+        entry = await self.cache.lookup(cache_key(url))
+        evict_all(self.cache)
+        self.assertIsNone(await self.cache.hit(entry))
+        self.assertIsNone(await self.cache.revalidated(entry))
+        self.assertEqual((self.cache.stats.hits, self.cache.stats.revalidated), (0, 0))
+
+
+class TestAiohttpCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = HttpCache(directory=self.directory.name, mode=CacheMode.REVALIDATE, max_entry_size=100, ttl=0)
+        self.sent_headers = []
+        self.responses:list[FakeResponse] = []
+        self.api = AiohttpAPI.__new__(AiohttpAPI)
+        self.api.http_cache = self.cache
+        self.api.spider = SimpleNamespace(cache_ttl=None)
+        self.api._get = self.fake_get
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def fake_get(self, url:str, use_proxy:bool=True, **kwargs) -> FakeResponse:
+        self.sent_headers.append(kwargs.get('headers', {}))
+        return self.responses.pop(0)
+
+    async def test_304_serves_the_cached_body(self):
+        url = "https://example.com/page"
+        await self.cache.store(cache_key(url), url, 200, HTML_HEADERS, b"<html>cached</html>")
+        response = FakeResponse(url, 304)
+        self.responses = [response]
+        res = await self.api._get_cached(SpiderRequest(url, 'aiohttp', 'spider'))
+        self.assertEqual(self.sent_headers[-1]['If-None-Match'], '"v1"')
+        self.assertTrue(response.released)
+        self.assertEqual(res.status, 200)
+        self.assertEqual(await res.read(), b"<html>cached</html>")
+        self.assertEqual(self.cache.stats.revalidated, 1)
+
+    async def test_oversized_chunked_response_is_not_cached(self):
+        url = "https://example.com/chunked"
+        self.responses = [FakeResponse(url, 200, b"x" * 101, HTML_HEADERS, content_length=None)]
+        res = await self.api._get_cached(SpiderRequest(url, 'aiohttp', 'spider'))
+        self.assertFalse(res.from_cache)
+        self.assertEqual(await res.read(), b"x" * 101)
+        self.assertIsNone(await self.cache.lookup(cache_key(url)))
+
+    async def test_fresh_entry_evicted_after_lookup_goes_to_the_network(self):
+        url = "https://example.com/page"
+        await self.cache.store(cache_key(url), url, 200, HTML_HEADERS, b"<html>cached</html>")
+        self.api.spider.cache_ttl = 3600
+        request = SpiderRequest(url, 'aiohttp', 'spider')
+        request.meta['cache_entry'] = await self.cache.lookup(cache_key(url))
+        evict_all(self.cache)
+        self.responses = [FakeResponse(url, 200, b"<html>new</html>", HTML_HEADERS)]
+        res = await self.api._get_cached(request)
+        self.assertNotIn('If-None-Match', self.sent_headers[-1])
+        self.assertEqual(await res.read(), b"<html>new</html>")
+
+    async def test_304_for_an_evicted_entry_requests_the_page_again(self):
+        url = "https://example.com/page"
+        await self.cache.store(cache_key(url), url, 200, HTML_HEADERS, b"<html>cached</html>")
+        request = SpiderRequest(url, 'aiohttp', 'spider')
+        request.meta['cache_entry'] = await self.cache.lookup(cache_key(url))
+        evict_all(self.cache)
+        self.responses = [FakeResponse(url, 304), FakeResponse(url, 200, b"<html>new</html>", HTML_HEADERS)]
+        res = await self.api._get_cached(request)
+        self.assertEqual(self.sent_headers[0]['If-None-Match'], '"v1"')
+        self.assertNotIn('If-None-Match', self.sent_headers[1])
+        self.assertEqual(await res.read(), b"<html>new</html>")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from webweaver_node.core.webscraping.spiders.lxml_soup import LxmlSoup
+from webweaver_node.core.webscraping.spiders.soup_base import SpiderSoup
+
+
+MARKUP = """
+<html><body>
+  <div class="p"><div class="inner">x</div><span>A</span><div class="inner last">y</div></div>
+  <div class="q"><p>B</p></div>
+</body></html>
+"""
+
+SELECTORS = ('div', 'div.inner', 'div > div', 'div div', 'span, div', 'p', 'html', 'body > div')
+
+
+def describe(tags) -> list[tuple[str, str]]:
+    """(name, class) of each tag. bs4 splits the class attribute into a list, lxml does not."""
+    described = []
+    for tag in tags:
+        classes = tag.get('class') or ''
+        described.append((tag.name, ' '.join(classes) if isinstance(classes, list) else classes))
+    return described
+
+
+class TestLxmlSoupParity(unittest.TestCase):
+    """LxmlSoup and LxmlTag must select the same elements as SpiderSoup and SpiderTag."""
+
+    def setUp(self):
+        self.bs4 = SpiderSoup("spider", MARKUP)
+        self.lxml = LxmlSoup("spider", MARKUP)
+
+    def test_document_select(self):
+        for selector in SELECTORS:
+            with self.subTest(selector=selector):
+                self.assertEqual(describe(self.lxml.select(selector)), describe(self.bs4.select(selector)))
+
+    def test_element_select_does_not_match_the_element_itself(self):
+        bs4_tag, lxml_tag = self.bs4.select_one('div.p'), self.lxml.select_one('div.p')
+        for selector in SELECTORS:
+            with self.subTest(selector=selector):
+                self.assertEqual(describe(lxml_tag.select(selector)), describe(bs4_tag.select(selector)))
+                self.assertEqual(describe(filter(None, [lxml_tag.select_one(selector)])),
+                                 describe(filter(None, [bs4_tag.select_one(selector)])))
+        self.assertEqual(lxml_tag.select_one_text('div'), "x")
+        self.assertEqual(bs4_tag.select_one_text('div'), "x")
+
+    def test_select_one_and_decompose_keeps_the_element(self):
+        for soup in (self.bs4, self.lxml):
+            with self.subTest(soup=soup.__class__.__name__):
+                tag = soup.select_one('div.p')
+                tag.select_one_and_decompose('div')
+                self.assertEqual(describe(soup.select('div.p div')), [('div', 'inner last')])
+                self.assertIsNotNone(soup.select_one('div.p'))
+
+
+if __name__ == '__main__':
+    unittest.main()
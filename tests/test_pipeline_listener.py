@@ -0,0 +1,77 @@
+import asyncio
+from types import SimpleNamespace
+import unittest
+from unittest.mock import MagicMock
+
+from webweaver_node.core.config import PIPELINE_WORKER_QUEUE_SIZE, SENTINEL
+from webweaver_node.core.webscraping.pipelines.pipeline_listener import PipelineListener
+from webweaver_node.core.webscraping.spiders.spider_data import SpiderData
+
+
+FAILING_SPIDER_ID = 1
+HEALTHY_SPIDER_ID = 2
+
+
+class FakePipeline:
+
+    def __init__(self, spider_id:int):
+        self.spider_id = spider_id
+        self.data_to_save = None
+        self.batch_to_save = []
+
+    async def validate_data(self):
+        self.data_to_save = {}
+
+    async def validate_batch(self, batch:list[SpiderData]):
+        self.batch_to_save = batch
+
+    async def save_data(self):
+        if self.spider_id == FAILING_SPIDER_ID:
+            raise RuntimeError("database is down")
+
+    async def save_batch(self):
+        if self.spider_id == FAILING_SPIDER_ID:
+            raise RuntimeError("database is down")
+
+
+class TestPipelineListener(unittest.IsolatedAsyncioTestCase):
+
+    def listener(self, batch_size:int) -> PipelineListener:
+        listener = PipelineListener(
+            asyncio.Queue(),
+            scraping_registry=MagicMock(),
+            batch_size=batch_size,
+            flush_interval=0.05,
+            worker_count=2,
+        )
+        listener.get_spider_asset = lambda spider_id: SimpleNamespace(id=spider_id, spider_name=f"spider_{spider_id}")
+        listener.get_pipeline_object = lambda sa, spider_data=None: FakePipeline(sa.id)
+        return listener
+
+    async def run_listener(self, listener:PipelineListener, items_per_spider:int):
+        for i in range(items_per_spider):
+            await listener.queue.put(SpiderData({'i': i}, FAILING_SPIDER_ID))
+            await listener.queue.put(SpiderData({'i': i}, HEALTHY_SPIDER_ID))
+        await listener.queue.put(SENTINEL)
+        await asyncio.wait_for(listener.listen(), timeout=10)
+
+    async def test_failed_save_batch_is_dropped_and_run_finishes(self):
+        listener = self.listener(batch_size=10)
+        items = PIPELINE_WORKER_QUEUE_SIZE * 3  # enough to fill the failing worker's queue
+        with self.assertLogs("scraping", level="ERROR"):
+            await self.run_listener(listener, items)
+        self.assertEqual(listener.items_saved[HEALTHY_SPIDER_ID], items)
+        self.assertEqual(listener.items_saved[FAILING_SPIDER_ID], 0)
+        self.assertEqual(listener.items_dropped[FAILING_SPIDER_ID], items)
+
+    async def test_failed_save_data_is_dropped_and_run_finishes(self):
+        listener = self.listener(batch_size=1)
+        items = PIPELINE_WORKER_QUEUE_SIZE * 3
+        with self.assertLogs("scraping", level="ERROR"):
+            await self.run_listener(listener, items)
+        self.assertEqual(listener.items_saved[HEALTHY_SPIDER_ID], items)
+        self.assertEqual(listener.items_dropped[FAILING_SPIDER_ID], items)
+
+
+if __name__ == '__main__':
+    unittest.main()
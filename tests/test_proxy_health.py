@@ -0,0 +1,130 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from webweaver_node.core.webscraping.proxy.endpoint_health import EndpointHealth
+from webweaver_node.core.webscraping.proxy.proxy_manager import ProxyManager
+
+
+ENDPOINT = "gate.proxy.com:10001"
+
+
+@patch('webweaver_node.core.webscraping.proxy.endpoint_health.time.monotonic', return_value=1000.0)
+class TestEndpointHealth(unittest.TestCase):
+
+    def health(self) -> EndpointHealth:
+        return EndpointHealth(
+            ENDPOINT,
+            alpha=0.5,
+            ban_window=60,
+            ban_count=2,
+            min_success_rate=0.5,
+            min_requests=4,
+            cooldown=10,
+        )
+
+    def test_unused_endpoint_scores_zero(self, monotonic):
+        self.assertEqual(self.health().score(), 0.0)
+
+    def test_score_is_latency_scaled_by_bans_and_success_rate(self, monotonic):
+        health = self.health()
+        health.record_response(200, latency=1.0)
+        health.record_response(200, latency=3.0)
+        self.assertEqual(health.latency, 2.0)  # EWMA with alpha 0.5
+        self.assertEqual(health.score(), 2.0)
+        health.record_response(429, latency=2.0)
+        self.assertEqual(health.success_rate, 0.5)
+        self.assertEqual(health.score(), 2.0 * 2 / 0.5)
+
+    def test_site_errors_are_not_held_against_the_endpoint(self, monotonic):
+        health = self.health()
+        health.record_response(404, latency=1.0)
+        health.record_response(500, latency=1.0)
+        self.assertEqual(health.success_rate, 1.0)
+        self.assertEqual(health.recent_bans, 0)
+
+    def test_quarantine_on_recent_bans(self, monotonic):
+        health = self.health()
+        health.record_response(403, latency=1.0)
+        self.assertFalse(health.should_quarantine())
+        health.record_response(429, latency=1.0)
+        self.assertTrue(health.should_quarantine())
+        monotonic.return_value += 61  # the bans fall out of the window
+        self.assertEqual(health.recent_bans, 0)
+        self.assertFalse(health.should_quarantine())
+
+    def test_quarantine_on_low_success_rate_after_min_requests(self, monotonic):
+        health = self.health()
+        for _ in range(3):
+            health.record_failure()
+        self.assertLess(health.success_rate, 0.5)
+        self.assertFalse(health.should_quarantine())  # only 3 requests so far
+        health.record_failure()
+        self.assertTrue(health.should_quarantine())
+
+    def test_quarantine_doubles_until_restored(self, monotonic):
+        health = self.health()
+        self.assertEqual([health.quarantine() for _ in range(3)], [10, 20, 40])
+        self.assertTrue(health.is_quarantined)
+        health.record_response(429, latency=5.0)
+        health.restore(latency=0.5)
+        self.assertFalse(health.is_quarantined)
+        self.assertEqual((health.latency, health.success_rate, health.requests, health.recent_bans), (0.5, 1.0, 0, 0))
+        self.assertEqual(health.quarantine(), 10)
+
+
+class TestProxyManagerHeap(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.manager = ProxyManager()
+        self.manager.endpoints.sticky = ["a:1", "b:2", "c:3"]
+        self.manager.free_endpoints = []
+        async with self.manager.endpoint_lock:
+            for endpoint in self.manager.endpoints.sticky:
+                self.manager._free_endpoint(endpoint)
+
+    async def asyncTearDown(self):
+        await self.manager.close()
+
+    async def take_all(self) -> list[str]:
+        return [await self.manager.get_sticky_endpoint() for _ in self.manager.endpoints.sticky]
+
+    async def test_unused_endpoints_are_handed_out_in_order(self):
+        self.assertEqual(await self.take_all(), ["a:1", "b:2", "c:3"])
+
+    async def test_best_scoring_endpoint_is_handed_out_first(self):
+        endpoints = await self.take_all()
+        for endpoint, latency in zip(endpoints, (3.0, 1.0, 2.0)):
+            self.manager.get_health(endpoint).record_response(200, latency)
+            await self.manager.release_sticky_endpoint(endpoint)
+        self.assertEqual(await self.take_all(), ["b:2", "c:3", "a:1"])
+
+    async def test_waits_for_a_released_endpoint(self):
+        await self.take_all()
+        waiting = asyncio.create_task(self.manager.get_sticky_endpoint())
+        await asyncio.sleep(0)
+        self.assertFalse(waiting.done())
+        await self.manager.release_sticky_endpoint("b:2")
+        self.assertEqual(await asyncio.wait_for(waiting, timeout=1), "b:2")
+
+    async def test_banned_endpoint_is_quarantined_until_its_retest_passes(self):
+        health = self.manager.health["a:1"] = EndpointHealth("a:1", ban_count=1, cooldown=0.01)
+        checked = asyncio.Event()
+        async def check_endpoint(endpoint:str) -> float:
+            checked.set()
+            return 0.5
+        self.manager.check_endpoint = check_endpoint
+        endpoint = await self.manager.get_sticky_endpoint()
+        health.record_response(403, latency=1.0)
+        with self.assertLogs("scraping", level="WARNING"):
+            await self.manager.release_sticky_endpoint(endpoint)
+        self.assertNotIn("a:1", [free for _, _, free in self.manager.free_endpoints])
+        await asyncio.wait_for(checked.wait(), timeout=1)
+        await asyncio.gather(*self.manager.retests)
+        self.assertFalse(health.is_quarantined)
+        self.assertEqual(health.latency, 0.5)
+        self.assertIn("a:1", [free for _, _, free in self.manager.free_endpoints])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta, timezone
+import email.utils
+import unittest
+from unittest.mock import patch
+
+from webweaver_node.core.webscraping.spiders.rate_limiter import (
+    DomainRateLimiter,
+    parse_retry_after,
+    retry_after_seconds,
+)
+
+
+DOMAIN = "example.com"
+
+
+class FakeClock:
+    """Stands in for time.monotonic() and asyncio.sleep(), so sleeping only moves the clock."""
+
+    def __init__(self, now:float=1000.0):
+        self.now = now
+        self.sleeps:list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds:float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestParseRetryAfter(unittest.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(parse_retry_after("120"), 120)
+        self.assertEqual(parse_retry_after(" 7 "), 7)
+
+    def test_http_date(self):
+        retry_at = datetime.now(tz=timezone.utc) + timedelta(seconds=30)
+        self.assertIn(parse_retry_after(email.utils.format_datetime(retry_at, usegmt=True)), (29, 30, 31))
+
+    def test_http_date_in_the_past_is_zero(self):
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+
+    def test_invalid_header(self):
+        with self.assertRaises(ValueError):
+            parse_retry_after("soon")
+        self.assertIsNone(retry_after_seconds({'Retry-After': "soon"}))
+        self.assertIsNone(retry_after_seconds({}))
+        self.assertEqual(retry_after_seconds({'retry-after': "3"}), 3)
+
+
+class TestDomainRateLimiter(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        for target, replacement in (('time.monotonic', self.clock.monotonic), ('asyncio.sleep', self.clock.sleep)):
+            patcher = patch(f'webweaver_node.core.webscraping.spiders.rate_limiter.{target}', replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.limiter = DomainRateLimiter(
+            initial_rate=4.0,
+            min_rate=0.5,
+            max_rate=5.0,
+            burst=2,
+            increase=0.5,
+            decrease=0.5,
+            decrease_cooldown=2.0,
+            enabled=True,
+        )
+
+    def test_additive_increase_up_to_max_rate(self):
+        self.limiter.record_status(DOMAIN, 200)
+        self.assertEqual(self.limiter.rate(DOMAIN), 4.5)
+        for _ in range(5):
+            self.limiter.record_status(DOMAIN, 200)
+        self.assertEqual(self.limiter.rate(DOMAIN), 5.0)
+
+    def test_multiplicative_decrease_down_to_min_rate(self):
+        for expected in (2.0, 1.0, 0.5, 0.5):
+            self.limiter.record_status(DOMAIN, 429)
+            self.assertEqual(self.limiter.rate(DOMAIN), expected)
+            self.clock.now += 2.0
+
+    def test_decrease_only_once_per_cooldown(self):
+        self.limiter.record_status(DOMAIN, 503)
+        self.limiter.record_status(DOMAIN, 429)
+        self.clock.now += 1.9
+        self.limiter.record_status(DOMAIN, 429)
+        self.assertEqual(self.limiter.rate(DOMAIN), 2.0)
+        self.clock.now += 0.1
+        self.limiter.record_status(DOMAIN, 429)
+        self.assertEqual(self.limiter.rate(DOMAIN), 1.0)
+
+    def test_other_errors_leave_the_rate_alone(self):
+        self.limiter.record_status(DOMAIN, 404)
+        self.limiter.record_status(DOMAIN, 500)
+        self.assertEqual(self.limiter.rate(DOMAIN), 4.0)
+
+    async def test_acquire_waits_for_a_token(self):
+        await self.limiter.acquire(DOMAIN)
+        await self.limiter.acquire(DOMAIN)  # burst of 2
+        self.assertEqual(self.clock.sleeps, [])
+        await self.limiter.acquire(DOMAIN)
+        self.assertEqual(self.clock.sleeps, [0.25])  # 1 token at 4 requests/s
+
+    async def test_retry_after_blocks_the_domain(self):
+        self.limiter.record_status(DOMAIN, 429, retry_after=30)
+        start = self.clock.now
+        await self.limiter.acquire(DOMAIN)
+        self.assertGreaterEqual(self.clock.now - start, 30)
+        self.assertEqual(self.clock.sleeps[0], 30)
+        sleeps = len(self.clock.sleeps)
+        await self.limiter.acquire("other.com")  # other domains are not blocked
+        self.assertEqual(len(self.clock.sleeps), sleeps)
+
+    async def test_retry_after_block_outlasts_the_decrease_cooldown(self):
+        self.limiter.record_status(DOMAIN, 429)
+        self.limiter.record_status(DOMAIN, 429, retry_after=10)  # inside the cooldown, still blocks
+        start = self.clock.now
+        await self.limiter.acquire(DOMAIN)
+        self.assertGreaterEqual(self.clock.now - start, 10)
+        self.assertEqual(self.limiter.rate(DOMAIN), 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
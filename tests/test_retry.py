@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import patch
+
+from webweaver_node.core.webscraping.proxy.circuit_breaker import CircuitBreaker
+from webweaver_node.core.webscraping.spiders.retry import RetryBudget, RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_backoff_doubles_each_attempt(self):
+        policy = RetryPolicy(base=0.5, max_wait=100)
+        self.assertEqual([policy.backoff(n) for n in range(4)], [0.5, 1, 2, 4])
+
+    def test_delay_is_between_half_and_full_backoff(self):
+        policy = RetryPolicy(base=1, max_wait=100)
+        for attempt in range(6):
+            backoff = policy.backoff(attempt)
+            for _ in range(20):
+                self.assertTrue(backoff / 2 <= policy.delay(attempt) <= backoff)
+
+    def test_delay_is_none_once_backoff_passes_max_wait(self):
+        policy = RetryPolicy(base=1, max_wait=8)
+        self.assertIsNotNone(policy.delay(3))  # backoff 8
+        self.assertIsNone(policy.delay(4))  # backoff 16
+
+
+class TestRetryBudget(unittest.TestCase):
+
+    def test_spend_until_exhausted(self):
+        budget = RetryBudget(max_retries=2)
+        self.assertTrue(budget.spend())
+        self.assertTrue(budget.spend())
+        self.assertEqual(budget.remaining, 0)
+        self.assertFalse(budget.spend())
+        self.assertEqual(budget.spent, 2)
+
+    def test_zero_budget_never_retries(self):
+        self.assertFalse(RetryBudget(max_retries=0).spend())
+
+
+@patch('webweaver_node.core.webscraping.proxy.circuit_breaker.time.monotonic')
+class TestCircuitBreaker(unittest.TestCase):
+
+    def trip(self, breaker:CircuitBreaker):
+        for _ in range(breaker.threshold):
+            breaker.record_failure()
+
+    def test_opens_at_threshold(self, monotonic):
+        monotonic.return_value = 100.0
+        breaker = CircuitBreaker("proxy:8000", threshold=3, cooldown=10)
+        breaker.record_failure()
+        breaker.record_failure()
+        self.assertFalse(breaker.is_open)
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open)
+        self.assertEqual(breaker.open_until, 110.0)
+        monotonic.return_value = 110.0
+        self.assertFalse(breaker.is_open)
+
+    def test_cooldown_doubles_on_each_trip(self, monotonic):
+        monotonic.return_value = 0.0
+        breaker = CircuitBreaker("proxy:8000", threshold=2, cooldown=10)
+        cooldowns = []
+        for _ in range(3):
+            self.trip(breaker)
+            cooldowns.append(breaker.open_until - monotonic.return_value)
+            monotonic.return_value = breaker.open_until
+        self.assertEqual(cooldowns, [10, 20, 40])
+
+    def test_success_resets_the_cooldown(self, monotonic):
+        monotonic.return_value = 0.0
+        breaker = CircuitBreaker("proxy:8000", threshold=2, cooldown=10)
+        self.trip(breaker)
+        self.trip(breaker)
+        breaker.record_success()
+        monotonic.return_value = 100.0
+        self.trip(breaker)
+        self.assertEqual(breaker.open_until, 110.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
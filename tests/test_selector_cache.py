@@ -0,0 +1,29 @@
+import unittest
+
+from lxml import etree
+
+from webweaver_node.core.exceptions import InvalidSelectorError
+from webweaver_node.core.webscraping.spiders.selector_cache import compile_match
+
+
+class TestCompileMatch(unittest.TestCase):
+
+    def test_compound_selectors_match_the_element_itself(self):
+        element = etree.fromstring('<li class="product" data-sku="1"/>')
+        self.assertTrue(compile_match('li.product[data-sku]')(element))
+        self.assertTrue(compile_match('div, li:not(.sold-out)')(element))
+        self.assertFalse(compile_match('li.sold-out')(element))
+
+    def test_combinators_are_rejected(self):
+        for selector in ('ul li', 'ul > li', 'h2 + p', 'h2 ~ p', 'li:not(ul > li)'):
+            with self.subTest(selector=selector), self.assertRaises(InvalidSelectorError):
+                compile_match(selector)
+
+    def test_positional_pseudo_classes_are_rejected(self):
+        for selector in ('li:first-child', 'li:LAST-CHILD', 'li:nth-child(2)', 'tr:nth-of-type(odd)', 'li:not(:first-child)'):
+            with self.subTest(selector=selector), self.assertRaises(InvalidSelectorError):
+                compile_match(selector)
+
+
+if __name__ == '__main__':
+    unittest.main()
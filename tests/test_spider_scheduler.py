@@ -0,0 +1,90 @@
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+import unittest
+
+from webweaver_node.core.common.enums import SpiderEngine
+from webweaver_node.core.webscraping.spiders.spider_scheduler import SpiderScheduler
+
+
+def spider(name:str, domain:str=None) -> SimpleNamespace:
+    return SimpleNamespace(spider_name=name, domain=domain or f"{name}.com")
+
+
+class TestSpiderScheduler(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.started:list[str] = []
+        self.peak_running = 0
+        self.peak_by_engine:Counter[SpiderEngine] = Counter()
+        self.peak_by_domain:Counter[str] = Counter()
+
+    async def run_scheduler(self, scheduler:SpiderScheduler):
+        async def launch(spider_asset):
+            self.started.append(spider_asset.spider_name)
+            self.peak_running = max(self.peak_running, scheduler.running)
+            self.peak_by_engine |= scheduler.running_by_engine
+            self.peak_by_domain |= scheduler.running_by_domain
+            await asyncio.sleep(0.01)
+        await asyncio.wait_for(scheduler.run(launch), timeout=5)
+
+    async def test_lower_priority_first_then_fifo(self):
+        scheduler = SpiderScheduler(max_running=1)
+        for name, priority in (("a", 1), ("b", 0), ("c", 1), ("d", 0), ("e", -1)):
+            scheduler.submit(spider(name), SpiderEngine.AIOHTTP, priority=priority)
+        await self.run_scheduler(scheduler)
+        self.assertEqual(self.started, ["e", "b", "d", "a", "c"])
+        self.assertEqual(scheduler.metrics().completed, 5)
+
+    async def test_global_limit(self):
+        scheduler = SpiderScheduler(max_running=2)
+        for i in range(6):
+            scheduler.submit(spider(f"s{i}"), SpiderEngine.AIOHTTP)
+        await self.run_scheduler(scheduler)
+        self.assertEqual(self.peak_running, 2)
+        self.assertEqual(len(self.started), 6)
+
+    async def test_engine_limit(self):
+        scheduler = SpiderScheduler(
+            max_running=10,
+            engine_limits={SpiderEngine.PLAYWRIGHT: 1, SpiderEngine.AIOHTTP: 3},
+        )
+        for i in range(4):
+            scheduler.submit(spider(f"pw{i}"), SpiderEngine.PLAYWRIGHT)
+            scheduler.submit(spider(f"aio{i}"), SpiderEngine.AIOHTTP)
+        await self.run_scheduler(scheduler)
+        self.assertEqual(self.peak_by_engine[SpiderEngine.PLAYWRIGHT], 1)
+        self.assertEqual(self.peak_by_engine[SpiderEngine.AIOHTTP], 3)
+        self.assertEqual(len(self.started), 8)
+
+    async def test_busy_domain_does_not_block_other_domains(self):
+        scheduler = SpiderScheduler(max_running=10, domain_limit=1)
+        for name in ("a1", "a2", "a3"):
+            scheduler.submit(spider(name, "a.com"), SpiderEngine.AIOHTTP)
+        scheduler.submit(spider("b1", "b.com"), SpiderEngine.AIOHTTP)
+        await self.run_scheduler(scheduler)
+        self.assertEqual(self.peak_by_domain["a.com"], 1)
+        self.assertEqual(self.started[:2], ["a1", "b1"])
+        self.assertEqual(scheduler.metrics().running_by_domain, {})
+
+    async def test_failed_spider_cancels_the_running_ones(self):
+        scheduler = SpiderScheduler(max_running=3)
+        for name in ("slow1", "broken", "slow2"):
+            scheduler.submit(spider(name), SpiderEngine.AIOHTTP)
+        cancelled = []
+        async def launch(spider_asset):
+            if spider_asset.spider_name == "broken":
+                raise RuntimeError("spider broke")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(spider_asset.spider_name)
+                raise
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(scheduler.run(launch), timeout=5)
+        self.assertEqual(sorted(cancelled), ["slow1", "slow2"])
+        self.assertEqual(scheduler.running, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,36 @@ class SpiderState(Enum):
     ERROR = "ERROR"
 
 
+class SpiderEngine(Enum):
+    AIOHTTP = "aiohttp"
+    PLAYWRIGHT = "playwright"
+
+
+class ParserBackend(Enum):
+    BS4 = "bs4"
+    LXML = "lxml"
+
+
+class CacheMode(Enum):
+    OFF = "off"
+    REVALIDATE = "revalidate"  # conditional GETs with ETag/Last-Modified once an entry's TTL has passed
+    OFFLINE = "offline"  # serve cached entries without ever going to the network, for development runs
+
+
+class ReplayMode(Enum):
+    OFF = "off"
+    RECORD = "record"  # archive every request/response a spider run makes
+    REPLAY = "replay"  # serve every request from the archive through the local ReplayServer
+
+
+class JobStatus(Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETE = "COMPLETE"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
 class LogLevel(Enum):
     EXCEPTION = "exception"
     CRITICAL = "critical"
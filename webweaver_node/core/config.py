@@ -14,6 +14,16 @@ USE_PROXY = False
 PROXY_URL = 'dc.smartproxy.com'
 PROXY_ROTATING_PORT = 10000
 PROXY_STATIC_PORT_RANGE = (10001, 10100)
+PROXY_BREAKER_THRESHOLD = 5  # consecutive failures before an endpoint's circuit opens
+PROXY_BREAKER_COOLDOWN = 30  # seconds an open endpoint is paused for
+PROXY_HEALTH_EWMA_ALPHA = 0.2  # weight of the newest request in an endpoint's latency and success rate averages
+PROXY_HEALTH_BAN_WINDOW = 300  # seconds a 403/429 response counts against an endpoint
+PROXY_QUARANTINE_BAN_COUNT = 3  # 403/429 responses within the window before an endpoint is quarantined
+PROXY_QUARANTINE_SUCCESS_RATE = 0.5  # success rate under which an endpoint is quarantined
+PROXY_QUARANTINE_MIN_REQUESTS = 10  # requests through an endpoint before its success rate counts
+PROXY_QUARANTINE_COOLDOWN = 120  # seconds before a quarantined endpoint is re-tested, doubled after each failed retest
+PROXY_HEALTH_CHECK_URL = 'https://ip.smartproxy.com/json'  # fetched through a quarantined endpoint to re-test it
+PROXY_HEALTH_CHECK_TIMEOUT = 15  # seconds
 
 # Debug Status
 # =================================================
@@ -25,6 +35,8 @@ DEBUG = True
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 LOG_DIR = os.path.join(ROOT_DIR, "log")
 SCRAPING_MODULES_DIR = os.path.join(ROOT_DIR, "scraping_modules")
+HTTP_CACHE_DIR = os.path.join(ROOT_DIR, "http_cache")
+REPLAY_ARCHIVES_DIR = os.path.join(ROOT_DIR, "replay_archives")
 
 # Env Vars & Constants
 # =================================================
@@ -37,7 +49,11 @@ else:
 HTTP_TIMEOUT = 5
 SPIDER_MAX_ERRORS = 5
 ACCEPTABLE_SPIDER_DURATION = 10.0 #seconds
-SPIDER_DATA_BATCH_SIZE = 1
+SPIDER_DATA_BATCH_SIZE = 1  # >1 turns on PipelineListener's batching mode
+SPIDER_DATA_FLUSH_INTERVAL = 2.0  # max seconds a partial batch waits before being saved
+SCRAPE_QUEUE_MAXSIZE = 1000  # spiders block on the scrape queue once it holds this many items
+PIPELINE_WORKER_COUNT = 4  # PipelineListener worker coroutines
+PIPELINE_WORKER_QUEUE_SIZE = 100  # items buffered per PipelineWorker
 SCRAPING_MODULES = Path("webweaver.scraping_modules")
 SENTINEL = "__SENTINEL_VALUE__"  # value passed into async Queue to stop PipelineListener from listening.
 RETURN_EXCEPTIONS = os.getenv("RETURN_EXCEPTIONS")  # for asyncio.gather() calls in SpiderLauncher
@@ -53,10 +69,89 @@ POSTGRES_DB = f"postgres://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 # Requests:
 REQUEST_WAIT_MAX = 3600  # 1 hour
 REQUEST_WAIT_BASE = 30  # 30 seconds
-
-# Semaphores (not yet implemented):
-SEMAPHORE_COUNT = 5
-PLAYWRIGHT_COUNT = 5
+AIOHTTP_RETRY_BASE = 2  # seconds
+AIOHTTP_RETRY_MAX_WAIT = 60  # give up once the backoff would exceed this many seconds
+SPIDER_RETRY_BUDGET = 20  # retries allowed per spider run
+
+# Per-domain rate limiting (DomainRateLimiter):
+RATE_LIMIT_ENABLED = True
+RATE_LIMIT_INITIAL_RATE = 5.0  # requests per second to a domain not seen before
+RATE_LIMIT_MIN_RATE = 0.05  # a throttled domain never drops below one request every 20 seconds
+RATE_LIMIT_MAX_RATE = 50.0
+RATE_LIMIT_BURST = 5  # tokens a bucket holds, so short bursts are not delayed
+RATE_LIMIT_INCREASE = 0.05  # additive increase in requests/second per successful response
+RATE_LIMIT_DECREASE = 0.5  # multiplicative decrease on a 429/503 response
+RATE_LIMIT_DECREASE_COOLDOWN = 2.0  # seconds; a burst of 429s only cuts the rate once
+
+# aiohttp connection pool (SessionPool):
+AIOHTTP_CONNECTION_LIMIT = 100  # open connections across all spiders
+AIOHTTP_CONNECTION_LIMIT_PER_HOST = 10  # open connections to the same host
+AIOHTTP_DNS_CACHE_TTL = 300  # seconds
+AIOHTTP_KEEPALIVE_TIMEOUT = 30  # seconds
+
+# Metrics (MetricsRegistry):
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)  # histogram upper bounds, in seconds
+
+# HTTP cache (HttpCache):
+HTTP_CACHE_MODE = os.getenv("HTTP_CACHE_MODE", "off")  # off | revalidate | offline
+HTTP_CACHE_MAX_SIZE = 1024 * 1024 * 1024  # least recently used entries are evicted past this many bytes
+HTTP_CACHE_MAX_ENTRY_SIZE = 10 * 1024 * 1024  # bigger responses are never cached
+HTTP_CACHE_TTL = 0  # seconds an entry is served without revalidating, override with Spider.cache_ttl
+HTTP_CACHE_CONTENT_TYPES = ["text/html", "application/json", "application/xml", "text/xml", "text/plain"]
+
+# Record & replay (ReplayManager):
+REPLAY_MODE = os.getenv("REPLAY_MODE", "off")  # off | record | replay
+REPLAY_ARCHIVE = os.getenv("REPLAY_ARCHIVE", "default")  # archive directory name inside REPLAY_ARCHIVES_DIR
+REPLAY_HOST = "127.0.0.1"
+REPLAY_PORT = 0  # 0 picks a free port, so each scrape process gets its own ReplayServer
+
+# Downloads (Downloader):
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes read from the response stream at a time
+DOWNLOAD_MAX_SIZE = 50 * 1024 * 1024  # downloads larger than this are aborted
+DOWNLOAD_SPOOL_SIZE = 1024 * 1024  # downloads larger than this are spooled to disk
+DOWNLOAD_CONCURRENCY = 4  # concurrent downloads per spider
+
+# Playwright browser pool (BrowserPool):
+BROWSER_POOL_SIZE = 2  # warm browsers per engine
+BROWSER_CONTEXT_MAX_PAGES = 50  # pages opened before a SpiderContext gets a fresh BrowserContext
+BROWSER_CONTEXT_MAX_MEMORY_MB = 512  # JS heap before a SpiderContext gets a fresh BrowserContext (chromium only)
+BROWSER_CONTEXT_MEMORY_CHECK_INTERVAL = 10  # pages opened between two JS heap checks
+
+# Playwright resource blocking (ResourcePolicy.default()):
+BLOCKED_RESOURCE_TYPES = ["image", "font", "media"]
+BLOCKED_URL_PATTERNS = [
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"doubleclick\.net",
+    r"facebook\.net",
+    r"hotjar\.com",
+    r"segment\.(io|com)",
+]
+RESOURCE_SIZE_ESTIMATES_KB = {  # used to estimate bandwidth saved by blocked requests
+    "image": 60,
+    "font": 40,
+    "media": 500,
+    "stylesheet": 30,
+    "script": 80,
+    "other": 5,
+}
+
+# Scrape jobs (JobManager):
+MAX_CONCURRENT_JOBS = 4  # scrape jobs running at once, the rest wait as PENDING
+JOB_HISTORY_SIZE = 100  # finished jobs kept around for status polling
+SCRAPE_PROCESS_COUNT = 1  # >1 shards a job's spiders across this many worker processes
+
+# HTML parsing (ParsePool):
+PARSE_POOL_WORKERS = max((os.cpu_count() or 2) - 1, 1)  # parse worker processes
+PARSE_POOL_MIN_SIZE = 100 * 1024  # markup smaller than this (chars/bytes) is parsed on the event loop
+SELECTOR_CACHE_SIZE = 2048  # compiled CSS selectors kept per process, per backend
+STREAM_PARSE_CHUNK_SIZE = 16 * 1024  # bytes fed to StreamParser at a time
+
+# Semaphores (SpiderScheduler concurrency limits):
+SEMAPHORE_COUNT = 5  # spiders running at once, across all engines
+PLAYWRIGHT_COUNT = 5  # Playwright spiders running at once
+AIOHTTP_COUNT = 5  # aiohttp spiders running at once
+DOMAIN_COUNT = 2  # spiders running against the same domain at once
 
 # Logging
 # ====================================================
@@ -123,11 +218,12 @@ sending_logger.addHandler(stream_handler)
 # =================================================
 
 REQUEST_MIDDLEWARES = [
-
+    'webweaver_node.core.webscraping.middleware.modules.http_cache.HttpCacheMiddleware',
+    'webweaver_node.core.webscraping.middleware.modules.rate_limit.RateLimitMiddleware',
 ]
 
 RESPONSE_MIDDLEWARES = [
-    'webweaver.webscraping.middleware.modules.status_code.StatusCodeMiddleware',
+    'webweaver_node.core.webscraping.middleware.modules.status_code.StatusCodeMiddleware',
 ]
 
 
@@ -146,6 +242,18 @@ core_models = [
 
 all_models = core_models
 
+TORTOISE_ORM = {
+    'connections': {
+        'default': POSTGRES_DB
+    },
+    'apps': {
+        'models': {
+            'models': all_models,
+            'default_connection': 'default',
+        },
+    },
+}
+
 # Routes
 # =================================================
 ROUTES = RouteMap
@@ -160,6 +160,10 @@ class BrokenSpidersError(SpiderLaunchError):
     """Raised when 1 or more spiders raises an error and fails to scrape."""
     pass
 
+class ScrapeProcessError(SpiderLaunchError):
+    """Raised when 1 or more scrape worker processes crash in multi-process mode."""
+    pass
+
 # class SlowSpidersWarning(SpiderLaunchError):
 #     """Raised when the spiders take too long to finish their job.
 #     Acceptable time to complete is defined in config.py as 
@@ -184,6 +188,16 @@ class SpiderRetryTimeout(SpiderError):
     """
     pass
 
+class SpiderRetryBudgetExceeded(SpiderError):
+    """Raised when a spider has used up all the retries allowed for 
+    a single run, as defined by Spider.retry_budget.
+    """
+    pass
+
+class DownloadTooLarge(SpiderError):
+    """Raised when a download is bigger than the Downloader's size cap."""
+    pass
+
 class SpiderTimeoutError(SpiderError):
     """Raised when HTTP request times out"""
     pass
@@ -214,6 +228,21 @@ class BadMarkupError(SpiderSoupError):
         self.error_details = error_details
         super().__init__(f"{self.spider_name}: {self.error_details}")
 
+    def __reduce__(self):
+        """Lets the error be pickled back from a ParsePool worker process."""
+        return (self.__class__, (self.spider_name, self.error_details))
+
+
+class InvalidSelectorError(SpiderSoupError):
+    """Raised when a CSS selector can not be compiled."""
+    def __init__(self, selector, error_details):
+        self.selector = selector
+        self.error_details = error_details
+        super().__init__(f"'{self.selector}': {self.error_details}")
+
+    def __reduce__(self):
+        return (self.__class__, (self.selector, self.error_details))
+
 
 # Pipeline Exceptions
 # ========================================================
@@ -6,4 +6,7 @@ class RouteMap:
     CREATE_SPIDER = "/scrape/create_spider"
     # CREATE_PARAMS = "/scrape/create_params"
     LAUNCH_SPIDER = "/scrape/launch_spider"
+    JOBS = "/scrape/jobs"
+    JOB_STATUS = "/scrape/jobs/{job_id}"
+    CANCEL_JOB = "/scrape/jobs/{job_id}/cancel"
 
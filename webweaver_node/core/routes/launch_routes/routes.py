@@ -8,10 +8,13 @@ from webweaver_node.core.config import USE_PROXY
 from webweaver_node.core.schema.pydantic_schemas import (
     SpiderAssetSchema, 
     LaunchSpiderSchema,
+    LaunchSpidersSchema,
+    ScrapeJobSchema,
+    SpiderProgressSchema,
 )
 from webweaver_node.scripts.create_module_files import create_spider_module_files
+from webweaver_node.core.webscraping.jobs.job_manager import job_manager, ScrapeJob
 from webweaver_node.core.webscraping.spiders.models import SpiderAsset
-from webweaver_node.core.webscraping.webscrape import WebScrape
 
 
 logger = logging.getLogger('scraping')
@@ -30,14 +33,64 @@ router = APIRouter()
 
 
 
+def job_schema(job:ScrapeJob) -> ScrapeJobSchema:
+    return ScrapeJobSchema(
+        job_id=job.id,
+        status=job.status.value,
+        spider_id=job.spider_ids[0],
+        spider_ids=job.spider_ids,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        error=job.error,
+        spiders=[SpiderProgressSchema(**vars(progress)) for progress in job.progress()],
+    )
+
+
 @router.post("/launch_spider")
 # async def launch_spider(launch_data:LaunchSpiderSchema, user:User = Depends((AuthRoute.spider_launch))):
 async def launch_spider(launch_data:LaunchSpiderSchema):
 
-    webscrape = WebScrape(launch_data=launch_data, use_proxy=USE_PROXY)
-    await webscrape.scrape()
+    job = job_manager.submit(launch_data=launch_data, use_proxy=USE_PROXY)
+
+    return {"job_id": job.id, "status": job.status.value}
+
+
+@router.post("/launch_spiders")
+async def launch_spiders(launch_data:LaunchSpidersSchema):
+    """Launches several spiders as one job. With SCRAPE_PROCESS_COUNT > 1 
+    they are sharded across that many worker processes.
+    """
+    if not launch_data.spiders:
+        raise HTTPException(status_code=400, detail="No spiders to launch")
+
+    job = job_manager.submit(launch_data=launch_data.spiders, use_proxy=USE_PROXY)
+
+    return {"job_id": job.id, "status": job.status.value}
+
+
+@router.get("/jobs")
+async def list_jobs() -> list[ScrapeJobSchema]:
+    return [job_schema(job) for job in job_manager.list()]
+
+
+@router.get("/jobs/{job_id}")
+async def job_status(job_id:str) -> ScrapeJobSchema:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Scrape job not found")
+    return job_schema(job)
+
 
-    return {"asdffdsa": "fdafdsaf scrapppe"}
+@router.post("/jobs/{job_id}/cancel")
+async def cancel_job(job_id:str) -> ScrapeJobSchema:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Scrape job not found")
+    if job.is_finished:
+        raise HTTPException(status_code=409, detail=f"Scrape job already {job.status.value}")
+    job_manager.cancel(job_id)
+    return job_schema(job)
 
 
 # @router.post("/test_spider")
@@ -18,7 +18,7 @@ class SpiderParamSchema(BaseModel):
     param_description:Optional[str] = None
     param_values: List[ParameterValueSchema]
 
-    @field_validator('param_type', pre=True)
+    @field_validator('param_type', mode='before')
     def transform_enum_to_string(cls, value):
         if isinstance(value, Enum):
             return value.value
@@ -30,7 +30,7 @@ class SpiderParameterSchema(BaseModel):
     param_type: str
     param_description:Optional[str] = None
 
-    @field_validator('param_type', pre=True)
+    @field_validator('param_type', mode='before')
     def transform_enum_to_string(cls, value):
         if isinstance(value, Enum):
             return value.value
@@ -69,4 +69,27 @@ class ParamKeyValueSchema(BaseModel):
 
 class LaunchSpiderSchema(BaseModel):
     id: int
-    params: Optional[List[ParamKeyValueSchema]]
\ No newline at end of file
+    params: Optional[List[ParamKeyValueSchema]]
+
+
+class LaunchSpidersSchema(BaseModel):
+    spiders: List[LaunchSpiderSchema]
+
+class SpiderProgressSchema(BaseModel):
+    spider_id: int
+    spider_name: str
+    state: str
+    items_scraped: int
+    items_saved: int
+
+
+class ScrapeJobSchema(BaseModel):
+    job_id: str
+    status: str
+    spider_id: int  # first spider of the job
+    spider_ids: List[int] = []
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    spiders: List[SpiderProgressSchema] = []
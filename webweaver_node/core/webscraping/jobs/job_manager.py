@@ -0,0 +1,126 @@
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timezone
+import logging
+import uuid
+
+from webweaver_node.core.common.enums import JobStatus
+from webweaver_node.core.config import MAX_CONCURRENT_JOBS, JOB_HISTORY_SIZE
+from webweaver_node.core.exceptions import WebScrapingError
+from webweaver_node.core.schema.pydantic_schemas import LaunchSpiderSchema
+from webweaver_node.core.webscraping.webscrape import WebScrape, SpiderProgress
+
+
+logger = logging.getLogger('scraping')
+
+
+class ScrapeJob:
+    """A scrape launched through the API. Holds the WebScrape running in the
+    background so its status and per-spider progress can be polled.
+    """
+    def __init__(self, launch_data:LaunchSpiderSchema | list[LaunchSpiderSchema], use_proxy:bool):
+        self.id = uuid.uuid4().hex
+        self.launch_data = launch_data
+        self.use_proxy = use_proxy
+        self.status = JobStatus.PENDING
+        self.error:str = None
+        self.created_at = datetime.now(tz=timezone.utc)
+        self.started_at:datetime = None
+        self.finished_at:datetime = None
+        self.webscrape:WebScrape = None
+        self.task:asyncio.Task = None
+
+
+    @property
+    def spider_ids(self) -> list[int]:
+        launch_data = self.launch_data if isinstance(self.launch_data, list) else [self.launch_data]
+        return [spider_launch_data.id for spider_launch_data in launch_data]
+
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.COMPLETE, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+    def progress(self) -> list[SpiderProgress]:
+        if self.webscrape is None:
+            return []
+        return self.webscrape.progress()
+
+
+    def finish(self, status:JobStatus, error:Exception=None):
+        self.status = status
+        self.finished_at = datetime.now(tz=timezone.utc)
+        if error is not None:
+            self.error = f"{error.__class__.__name__}: {error}"
+        return
+
+
+class JobManager:
+    """Runs scrape jobs in the background so launch routes can return a job ID
+    straight away. At most max_concurrent jobs scrape at once, the rest wait
+    as PENDING. The last max_history finished jobs are kept for status polling.
+    """
+    def __init__(self, max_concurrent:int=MAX_CONCURRENT_JOBS, max_history:int=JOB_HISTORY_SIZE):
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.max_history = max_history
+        self.jobs:OrderedDict[str, ScrapeJob] = OrderedDict()
+
+
+    def submit(self, launch_data:LaunchSpiderSchema | list[LaunchSpiderSchema], use_proxy:bool) -> ScrapeJob:
+        """Creates a ScrapeJob and schedules it on the running event loop."""
+        job = ScrapeJob(launch_data, use_proxy)
+        job.task = asyncio.create_task(self._run(job))
+        self.jobs[job.id] = job
+        self._trim_history()
+        logger.info(f"Scrape job {job.id} submitted (spiders {job.spider_ids})")
+        return job
+
+
+    def get(self, job_id:str) -> ScrapeJob | None:
+        return self.jobs.get(job_id)
+
+
+    def list(self) -> list[ScrapeJob]:
+        return list(self.jobs.values())
+
+
+    def cancel(self, job_id:str) -> ScrapeJob | None:
+        """Cancels a pending or running job. Returns None if the job does not exist."""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        if not job.is_finished:
+            job.task.cancel()
+        return job
+
+
+    async def _run(self, job:ScrapeJob):
+        try:
+            async with self.semaphore:
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.now(tz=timezone.utc)
+                job.webscrape = WebScrape(launch_data=job.launch_data, use_proxy=job.use_proxy)
+                await job.webscrape.scrape()
+        except asyncio.CancelledError:
+            job.finish(JobStatus.CANCELLED)
+            logger.warning(f"Scrape job {job.id} cancelled")
+            return
+        except (Exception, WebScrapingError) as e:
+            job.finish(JobStatus.FAILED, error=e)
+            logger.error(f"Scrape job {job.id} failed: {job.error}", exc_info=True)
+            return
+        job.finish(JobStatus.COMPLETE)
+        logger.info(f"Scrape job {job.id} complete")
+        return
+
+
+    def _trim_history(self):
+        """Forgets the oldest finished jobs once there are more than self.max_history."""
+        finished = [job_id for job_id, job in self.jobs.items() if job.is_finished]
+        for job_id in finished[:max(len(finished) - self.max_history, 0)]:
+            del self.jobs[job_id]
+        return
+
+
+job_manager = JobManager()
@@ -0,0 +1,256 @@
+import bisect
+from contextlib import contextmanager
+import time
+from types import SimpleNamespace
+from typing import Iterator
+
+import aiohttp
+
+from webweaver_node.core.config import METRICS_LATENCY_BUCKETS
+
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value:str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labelnames:tuple[str, ...], labelvalues:LabelValues, extra:str=None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value:float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind:str = None
+
+    def __init__(self, name:str, documentation:str, labelnames:tuple[str, ...]=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values:dict[LabelValues, object] = {}
+
+
+    def _key(self, labels:dict[str, str]) -> LabelValues:
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"{self.name} is missing label {e}") from None
+
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(Metric):
+    """Monotonically increasing count, ie: retries or bytes transferred."""
+    kind = "counter"
+
+    def inc(self, amount:float=1, **labels:str):
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+
+    def get(self, **labels:str) -> float:
+        return self.values.get(self._key(labels), 0)
+
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for key, value in self.values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+    def merge(self, values:dict[LabelValues, float]):
+        for key, value in values.items():
+            self.values[key] = self.values.get(key, 0) + value
+
+
+class HistogramValue:
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self, bucket_count:int):
+        self.counts = [0] * bucket_count  # per bucket, not cumulative. The last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(Metric):
+    """Distribution of durations, in seconds, over fixed buckets."""
+    kind = "histogram"
+
+    def __init__(
+            self,
+            name:str,
+            documentation:str,
+            labelnames:tuple[str, ...]=(),
+            buckets:tuple[float, ...]=METRICS_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+
+    def observe(self, value:float, **labels:str):
+        key = self._key(labels)
+        histogram = self.values.get(key)
+        if histogram is None:
+            histogram = self.values[key] = HistogramValue(len(self.buckets))
+        histogram.counts[bisect.bisect_left(self.buckets, value)] += 1
+        histogram.sum += value
+        histogram.count += 1
+
+
+    @contextmanager
+    def time(self, **labels:str) -> Iterator[None]:
+        """Observes how long the block takes, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+
+    def get(self, **labels:str) -> HistogramValue | None:
+        return self.values.get(self._key(labels))
+
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for key, histogram in self.values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram.counts):
+                cumulative += count
+                le = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(histogram.sum)}")
+            lines.append(f"{self.name}_count{labels} {histogram.count}")
+        return lines
+
+
+    def merge(self, values:dict[LabelValues, tuple[list[int], float, int]]):
+        for key, (counts, total, count) in values.items():
+            histogram = self.values.get(key)
+            if histogram is None:
+                histogram = self.values[key] = HistogramValue(len(self.buckets))
+            histogram.counts = [a + b for a, b in zip(histogram.counts, counts)]
+            histogram.sum += total
+            histogram.count += count
+
+
+class MetricsRegistry:
+    """Process-wide collection of counters and histograms, exposed in the
+    Prometheus text format on the /metrics route.
+
+    Scrape worker processes send a snapshot() of their metrics back with their
+    ShardResult, which the parent merges into its own registry.
+    """
+    def __init__(self):
+        self.metrics:dict[str, Counter | Histogram] = {}
+
+
+    def _register(self, metric:Counter | Histogram) -> Counter | Histogram:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+
+
+    def counter(self, name:str, documentation:str, labelnames:tuple[str, ...]=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+
+    def histogram(self, name:str, documentation:str, labelnames:tuple[str, ...]=(), **kwargs) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, **kwargs))
+
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+    def snapshot(self) -> dict[str, dict]:
+        """Picklable copy of every metric's values."""
+        snapshot = {}
+        for name, metric in self.metrics.items():
+            if isinstance(metric, Histogram):
+                snapshot[name] = {key: (list(h.counts), h.sum, h.count) for key, h in metric.values.items()}
+            else:
+                snapshot[name] = dict(metric.values)
+        return snapshot
+
+
+    def merge(self, snapshot:dict[str, dict]):
+        for name, values in snapshot.items():
+            metric = self.metrics.get(name)
+            if metric is not None:
+                metric.merge(values)
+        return
+
+
+    def clear(self):
+        for metric in self.metrics.values():
+            metric.values.clear()
+        return
+
+
+metrics = MetricsRegistry()
+
+http_fetch_seconds = metrics.histogram(
+    "webweaver_http_fetch_seconds", "aiohttp request time until the response headers arrive", ("spider_name", "domain"),
+)
+playwright_goto_seconds = metrics.histogram(
+    "webweaver_playwright_goto_seconds", "Playwright page.goto() time", ("spider_name",),
+)
+parse_seconds = metrics.histogram(
+    "webweaver_parse_seconds", "Time to build a soup and run its extraction", ("spider_name", "backend"),
+)
+queue_wait_seconds = metrics.histogram(
+    "webweaver_queue_wait_seconds", "Time scraped items wait in the queues before their pipeline picks them up", ("spider_name",),
+)
+validation_seconds = metrics.histogram(
+    "webweaver_validation_seconds", "Pipeline schema validation time, per item or batch", ("spider_name",),
+)
+save_seconds = metrics.histogram(
+    "webweaver_save_seconds", "Pipeline save time, per item or batch", ("spider_name",),
+)
+bytes_transferred = metrics.counter(
+    "webweaver_bytes_transferred_total", "Response body bytes received", ("spider_name", "transport"),
+)
+http_retries = metrics.counter(
+    "webweaver_http_retries_total", "aiohttp requests retried after a connection error", ("spider_name", "domain"),
+)
+http_responses = metrics.counter(
+    "webweaver_http_responses_total", "Responses received, by status code", ("spider_name", "transport", "status"),
+)
+
+
+async def _on_response_chunk_received(
+        session:aiohttp.ClientSession,
+        context:SimpleNamespace,
+        params:aiohttp.TraceResponseChunkReceivedParams,
+):
+    spider_name = (context.trace_request_ctx or {}).get('spider_name')
+    if spider_name:
+        bytes_transferred.inc(len(params.chunk), spider_name=spider_name, transport='aiohttp')
+
+
+def metrics_trace_config() -> aiohttp.TraceConfig:
+    """Counts the body bytes of every response read with read()/text()/json() on a
+    session, for requests made with trace_request_ctx={'spider_name': ...}.
+    Streamed bodies are counted where they are streamed.
+    """
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_response_chunk_received.append(_on_response_chunk_received)
+    return trace_config
@@ -1,4 +1,5 @@
 
+from typing import Any
 from playwright.async_api import Response as ResponsePlaywright
 from aiohttp import ClientResponse as ResponseAiohttp
 
@@ -6,12 +7,26 @@ class GenericResponse:
     """This class acts as an adapter for transforming Playwright's Response object
     and aiohttp's ClientResponse into a standard object that can be operated on
     by the middleware classes.
+
+    Built for every response, so it only keeps a reference to the original one.
+    The headers are read from it the first time a middleware asks for them: 
+    Playwright builds a new dict every time its Response.headers is read.
     """
-    def __init__(self, url:str, status_code:int, headers:dict):
+    __slots__ = ('url', 'status_code', 'retry_after', '_response', '_headers')
+
+    def __init__(self, url:str, status_code:int, response:Any=None, headers:dict=None):
         self.url = url
         self.status_code = status_code
-        self.headers = headers
         self.retry_after = None
+        self._response = response
+        self._headers = headers
+
+
+    @property
+    def headers(self) -> dict:
+        if self._headers is None:
+            self._headers = self._response.headers if self._response is not None else {}
+        return self._headers
 
 
     @classmethod
@@ -20,7 +35,7 @@ class GenericResponse:
         return cls(
             url=response.url,
             status_code=response.status,
-            headers=response.headers
+            response=response,
         )
     
     @classmethod
@@ -29,5 +44,5 @@ class GenericResponse:
         return cls(
             url=response.url,
             status_code=response.status,
-            headers=response.headers
-        )
\ No newline at end of file
+            response=response,
+        )
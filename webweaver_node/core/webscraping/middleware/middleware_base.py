@@ -1,44 +1,63 @@
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Any, TYPE_CHECKING
 from webweaver_node.core.common.enums import LogLevel
 from webweaver_node.core.exceptions import WebScrapingError
 from webweaver_node.core.webscraping.middleware.generic_response import GenericResponse
+from webweaver_node.core.webscraping.middleware.spider_request import SpiderRequest
 
 if TYPE_CHECKING:
     from webweaver_node.core.webscraping.spiders.spider_base import SpiderAPI
     from webweaver_node.core.webscraping.spiders.spider_page import RequestContextInterface
 
 
+@dataclass(slots=True)
+class MiddlewareContext:
+    """Who a response belongs to: the spider that made the request, and its 
+    RequestContext when the request was made through one.
+    """
+    spider_api: "SpiderAPI"
+    request_interface: "RequestContextInterface" = None
+
+
 class MiddlewareBase:
-    """Base class for all middleware modules.
+    """Base class for all response middleware modules, listed in RESPONSE_MIDDLEWARES.
 
     Middleware modules receive the GenericResponse object and operate on it by
     subclassing the handle_response() method.
 
-    Middleware modules are capable of accessing the Manager via the MiddlewareManagerInterface,
-    which in turn allows the middleware module to access the spider's SpiderInterface. This is
-    especially important for logging to the spider's module-level log files.
+    One instance of each is built per scrape by the MiddlewareManager, so middleware
+    modules must not keep per-response state on self. Everything about the response
+    comes in through the arguments of handle_response(): the MiddlewareContext 
+    gives access to the spider's SpiderAPI, which is especially important for 
+    logging to the spider's module-level log files.
     """
-    def __init__(
-            self, 
-            spider_api:"SpiderAPI",
-            request_interface:"RequestContextInterface",
-            response:GenericResponse,
-    ):
-        self.spider_api = spider_api
-        self.request_interface = request_interface
-        self.response = response
+    def log_warning_and_continue(self, context:MiddlewareContext, msg:str):
+        context.spider_api.log(msg, level=LogLevel.WARNING)
 
 
-    def log_warning_and_continue(self, msg:str):
-        self.spider_api.log(msg, level=LogLevel.WARNING)
+    def log_error_and_continue(self, context:MiddlewareContext, msg:str):
+        context.spider_api.log(msg)
 
 
-    def log_error_and_continue(self, msg:str):
-        self.spider_api.log(msg)
+    def log(self, context:MiddlewareContext, e:WebScrapingError=None, level:LogLevel=LogLevel.ERROR):
+        context.spider_api.log(e, level)
 
+    async def handle_response(self, response:GenericResponse, context:MiddlewareContext):
+        raise NotImplementedError("Middleware subclass has no handle_response method!")
 
-    def log(self, e:WebScrapingError=None, level:LogLevel=LogLevel.ERROR):
-        self.spider_api.log(e, level)
 
-    async def handle_response(response:GenericResponse):
-        raise NotImplementedError("Middleware subclass has no handle_response method!")
\ No newline at end of file
+class RequestMiddlewareBase:
+    """Base class for request middleware modules, listed in REQUEST_MIDDLEWARES.
+
+    One instance of each is built per scrape by the MiddlewareManager and handles
+    every request of every spider, through both aiohttp and Playwright. Any state 
+    kept on it is shared by all the spiders of the scrape.
+
+    process_request() runs, in REQUEST_MIDDLEWARES order, before the request is 
+    sent. Returning None passes the request on to the next middleware and then 
+    the transport. Returning anything else short-circuits the chain: it is 
+    handed back to the spider as the response and the request is never sent.
+    A middleware can also delay the request by awaiting before it returns.
+    """
+    async def process_request(self, request:SpiderRequest, spider_api:"SpiderAPI") -> Any | None:
+        raise NotImplementedError("Request middleware subclass has no process_request method!")
@@ -1,5 +1,6 @@
 
-from typing import TYPE_CHECKING, Any
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 from playwright.async_api import Response as ResponsePlaywright
 from aiohttp import ClientResponse as ResponseAiohttp
 
@@ -7,11 +8,17 @@ from webweaver_node.core.common.utils import import_class_from_string
 from webweaver_node.core.config import REQUEST_MIDDLEWARES, RESPONSE_MIDDLEWARES
 from webweaver_node.core.exceptions import ResponseUnsupported
 from webweaver_node.core.webscraping.middleware.generic_response import GenericResponse
+from webweaver_node.core.webscraping.middleware.middleware_base import MiddlewareContext
+from webweaver_node.core.webscraping.middleware.spider_request import SpiderRequest
+from webweaver_node.core.webscraping.spiders.http_cache import CachedResponse
 
 if TYPE_CHECKING:
     from webweaver_node.core.webscraping.spiders.spider_base import SpiderAPI
     from webweaver_node.core.webscraping.spiders.spider_page import RequestContextInterface
-    from webweaver_node.core.webscraping.middleware.middleware_base import MiddlewareBase
+    from webweaver_node.core.webscraping.middleware.middleware_base import MiddlewareBase, RequestMiddlewareBase
+
+
+logger = logging.getLogger('scraping')
 
 
 class MiddlewareAPI:
@@ -21,6 +28,34 @@ class MiddlewareAPI:
     def __init__(self, manager:"MiddlewareManager"):
         self.manager = manager
 
+    async def execute(
+            self,
+            request:SpiderRequest,
+            send:Callable[[SpiderRequest], Awaitable[Any]],
+            spider_api:"SpiderAPI",
+            request_interface:"RequestContextInterface"=None,
+    ) -> Any:
+        """Sends a request through the whole middleware chain: the request 
+        middlewares first, then send(request) unless one of them answered the
+        request itself, then the response middlewares. Both AiohttpAPI.get() 
+        and PlaywrightNavigation.goto() go through here.
+        """
+        response = await self.manager.run_request_middlewares(request, spider_api)
+        if response is not None:
+            return response
+        response = await send(request)
+        if response is None:
+            return response
+        try:
+            await self.handle_response(response, spider_api, request_interface)
+        except BaseException:
+            release = getattr(response, 'release', None)
+            if release is not None:
+                release()
+            raise
+        return response
+
+
     async def handle_response(
             self, 
             response:Any, 
@@ -33,39 +68,44 @@ class MiddlewareAPI:
         This design allows middleware modules to write to spider's module-level logs
             *Currently only have 1 lonely StatusCode middleware module
         """
-        if request_interface:
-            generic_response = self.manager.create_generic_response(response, spider_api)
-            await self.manager.run_response_middlewares(
-                generic_response=generic_response,
-                spider_api=spider_api,
-                request_interface=request_interface
-            )
+        generic_response = self.manager.create_generic_response(response, spider_api)
+        await self.manager.run_response_middlewares(
+            generic_response=generic_response,
+            context=MiddlewareContext(spider_api, request_interface),
+        )
 
 
 class MiddlewareManager:
 
     def __init__(self):
-        self.request_middlewares:list[MiddlewareBase] = [import_class_from_string(path) for path in REQUEST_MIDDLEWARES]
-        self.response_middlewares:list[MiddlewareBase] = [import_class_from_string(path) for path in RESPONSE_MIDDLEWARES]
+        self.request_middlewares:list[RequestMiddlewareBase] = [import_class_from_string(path)() for path in REQUEST_MIDDLEWARES]
+        self.response_middlewares:list[MiddlewareBase] = [import_class_from_string(path)() for path in RESPONSE_MIDDLEWARES]
         self.middleware_api = MiddlewareAPI(self)
 
 
+    async def run_request_middlewares(self, request:SpiderRequest, spider_api:"SpiderAPI") -> Any | None:
+        """Runs the request middlewares in order. Returns the response of the 
+        first one that short-circuits the request, or None if the request
+        should be sent.
+        """
+        for middleware in self.request_middlewares:
+            response = await middleware.process_request(request, spider_api)
+            if response is not None:
+                logger.debug(f"{middleware.__class__.__name__} answered {request.method} {request.url}")
+                return response
+        return None
+
+
     async def run_response_middlewares(
             self, 
             generic_response:GenericResponse, 
-            spider_api:"SpiderAPI",
-            request_interface:"RequestContextInterface"
+            context:MiddlewareContext,
         ):
         """This method runs the response middlewares"""
         if not isinstance(generic_response, GenericResponse):
             raise ResponseUnsupported(repr(generic_response))
-        for middleware_class in self.response_middlewares:
-            middleware = middleware_class(
-                spider_api = spider_api,
-                request_interface = request_interface,
-                response = generic_response
-            )
-            await middleware.handle_response()
+        for middleware in self.response_middlewares:
+            await middleware.handle_response(generic_response, context)
 
 
     def create_generic_response(self, response:Any, spider_api:"SpiderAPI") -> GenericResponse:
@@ -74,7 +114,7 @@ class MiddlewareManager:
         """
         if isinstance(response, ResponsePlaywright):
             generic_response = GenericResponse.from_playwright(response)
-        elif isinstance(response, ResponseAiohttp):
+        elif isinstance(response, (ResponseAiohttp, CachedResponse)):
             generic_response = GenericResponse.from_aiohttp(response)
         else:
             spider_api.log(ResponseUnsupported(
@@ -0,0 +1,37 @@
+from typing import TYPE_CHECKING
+
+from webweaver_node.core.webscraping.middleware.middleware_base import RequestMiddlewareBase
+from webweaver_node.core.webscraping.middleware.spider_request import SpiderRequest
+from webweaver_node.core.webscraping.replay.replay_manager import replay_manager
+from webweaver_node.core.webscraping.spiders.http_cache import CachedResponse, HttpCache, cache_key, http_cache
+
+if TYPE_CHECKING:
+    from webweaver_node.core.webscraping.spiders.spider_api import SpiderAPI
+
+
+class HttpCacheMiddleware(RequestMiddlewareBase):
+    """Answers aiohttp requests with a fresh HttpCache entry, before they wait
+    for a rate limit token or touch the network.
+
+    Stale entries are left in request.meta['cache_entry'] for AiohttpAPI to 
+    revalidate with a conditional GET, so the entry is only looked up once.
+    Playwright requests are cached per resource by the PlaywrightCache route instead.
+    """
+    def __init__(self, cache:HttpCache=http_cache):
+        self.cache = cache
+
+
+    async def process_request(self, request:SpiderRequest, spider_api:"SpiderAPI") -> CachedResponse | None:
+        spider = spider_api.spider
+        if request.transport != 'aiohttp' or not (self.cache.enabled and spider.use_cache and request.use_cache):
+            return None
+        if replay_manager.active:
+            return None
+        entry = await self.cache.lookup(cache_key(request.url, request.params))
+        request.meta['cache_entry'] = entry
+        if entry is not None and self.cache.should_serve(entry, spider.cache_ttl):
+            body = await self.cache.hit(entry)
+            if body is not None:
+                return CachedResponse.from_entry(entry, body)
+            request.meta['cache_entry'] = None  # evicted since the lookup, go to the network
+        return None
@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from webweaver_node.core.webscraping.middleware.middleware_base import RequestMiddlewareBase
+from webweaver_node.core.webscraping.middleware.spider_request import SpiderRequest
+from webweaver_node.core.webscraping.replay.replay_manager import replay_manager
+from webweaver_node.core.webscraping.spiders.rate_limiter import DomainRateLimiter, domain_rate_limiter
+
+if TYPE_CHECKING:
+    from webweaver_node.core.webscraping.spiders.spider_api import SpiderAPI
+
+
+class RateLimitMiddleware(RequestMiddlewareBase):
+    """Delays each request until its domain has a token in the DomainRateLimiter.
+    Replayed runs never reach the network, so they are not delayed.
+    """
+
+    def __init__(self, rate_limiter:DomainRateLimiter=domain_rate_limiter):
+        self.rate_limiter = rate_limiter
+
+
+    async def process_request(self, request:SpiderRequest, spider_api:"SpiderAPI") -> None:
+        if replay_manager.replaying:
+            return None
+        await self.rate_limiter.acquire(request.domain)
+        return None
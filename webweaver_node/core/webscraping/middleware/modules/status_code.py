@@ -1,16 +1,14 @@
-import asyncio
-from datetime import datetime, timezone
-import email.utils
-import math
+import logging
 
-from webweaver_node.core.config import REQUEST_WAIT_BASE, REQUEST_WAIT_MAX
+from webweaver_node.core.config import REQUEST_WAIT_MAX
 from webweaver_node.core.exceptions import RetryAfterHeaderMalformed, SpiderRetryTimeout
-from webweaver_node.core.webscraping.middleware.middleware_base import MiddlewareBase
+from webweaver_node.core.webscraping.middleware.generic_response import GenericResponse
+from webweaver_node.core.webscraping.middleware.middleware_base import MiddlewareBase, MiddlewareContext
+from webweaver_node.core.webscraping.spiders.rate_limiter import domain_of, domain_rate_limiter, parse_retry_after
 # from webscraping.proxy.proxy_base import RequestContext 
 
 
-#TODO:  retry_time = self.context.calculate_wait_time()
-        # -this line no good. need fix
+logger = logging.getLogger('scraping')
 
 
 """
@@ -34,64 +32,51 @@ from webweaver_node.core.webscraping.middleware.middleware_base import Middlewar
 
 class StatusCodeMiddleware(MiddlewareBase):
     """Manages spider behavior for different HTTP status codes.
-    Can influence the Spider/SpiderPage's actions by setting the
-    following attributes:
-        retry_after
+    429 and 503 responses cut the domain's rate in the DomainRateLimiter, 
+    which slows down every request to that domain, and a Retry-After header
+    blocks the domain for as long as it asks.
     """
 
-    async def handle_response(self):
+    async def handle_response(self, response:GenericResponse, context:MiddlewareContext):
         """The response is handled based on its status code"""
-        wait_time = None
-        print('status_code: ', self.response.status_code)
-        match self.response.status_code:
+        status_code = response.status_code
+        logger.debug("StatusCodeMiddleware: %s from '%s'", status_code, response.url)
+        match status_code:
             case 200:
                 return
             case 400| 401 | 403 | 404:
-                msg = f"Status code: {self.response.status_code} from '{self.response.url}'"
-                self.log_error_and_continue(msg)
+                msg = f"Status code: {status_code} from '{response.url}'"
+                self.log_error_and_continue(context, msg)
             case 429 | 503:
-                msg = f"Status code: {self.response.status_code} from '{self.response.url}'"
-                self.log_error_and_continue(msg)
-                wait_time = self.wait_time()
+                msg = f"Status code: {status_code} from '{response.url}'"
+                self.log_error_and_continue(context, msg)
+                self.throttle(response, context)
             case _:
-                msg = f"Unhandled status code: {self.response.status_code} from '{self.response.url}'"
-                self.log_warning_and_continue(msg)
+                msg = f"Unhandled status code: {status_code} from '{response.url}'"
+                self.log_warning_and_continue(context, msg)
 
-        if wait_time:
-            if wait_time > REQUEST_WAIT_MAX:
-                self.spider_api.log(SpiderRetryTimeout(f"Wait time of {wait_time} seconds is too long"))
-                raise SpiderRetryTimeout(f"Wait time of {wait_time} seconds is too long")
-            await asyncio.sleep(wait_time)
-            self.request_interface.increase_retry_count()
 
-
-    def calculate_wait_time(self) -> int:
-        """Retrieve the wait time with the exponential backoff algorithm,
-        based on self.retry_count value.
-        """
-        wait_time = self.exponential_backoff()
-        return wait_time
-
-
-    def exponential_backoff(self) -> int:
-        """Calculates the time (in seconds) this spider/proxy should wait 
-        before retrying using an exponential backoff algorithm.
-        """
-        return REQUEST_WAIT_BASE * (2 ** self.request_interface.retry_count)
+    def throttle(self, response:GenericResponse, context:MiddlewareContext):
+        """Slows down the whole domain instead of sleeping inside this request."""
+        retry_after = self.retry_after(response, context)
+        if retry_after and retry_after > REQUEST_WAIT_MAX:
+            context.spider_api.log(SpiderRetryTimeout(f"Wait time of {retry_after} seconds is too long"))
+            raise SpiderRetryTimeout(f"Wait time of {retry_after} seconds is too long")
+        domain_rate_limiter.penalize(domain_of(str(response.url)), retry_after)
+        if context.request_interface is not None:
+            context.request_interface.increase_retry_count()
+        return
 
 
-    def wait_time(self) -> int:
-        """Determines the length of time to wait before retrying"""
-        wait_time = 0
-        retry_header = self._get_retry_after_header()
+    def retry_after(self, response:GenericResponse, context:MiddlewareContext) -> int | None:
+        """The wait time in the Retry-After header, if there is one."""
+        retry_header = self._get_retry_after_header(response)
         if retry_header:
             try:
-                wait_time = self._read_retry_after_header(retry_header)
+                return self._read_retry_after_header(retry_header)
             except (ValueError, AttributeError) as e:
-                self.spider_api.log(RetryAfterHeaderMalformed(f"Retry-After header: {retry_header}"))
-        if wait_time == 0:
-            wait_time = self.calculate_wait_time()
-        return wait_time
+                context.spider_api.log(RetryAfterHeaderMalformed(f"Retry-After header: {retry_header}"))
+        return None
 
 
     def _read_retry_after_header(self, retry_header:str) -> int:
@@ -103,28 +88,17 @@ class StatusCodeMiddleware(MiddlewareBase):
         before sending more requests.
         """
         try:
-            if retry_header.isdigit():
-                return int(retry_header)
+            return parse_retry_after(retry_header)
         except AttributeError as e:
             raise AttributeError(f"Invalid Retry-After header format: {retry_header}") from e
-        else:
-            try:
-                retry_time = email.utils.parsedate_to_datetime(retry_header)
-                if retry_time.tzinfo is None or retry_time.tzinfo.utcoffset(retry_time) is None:
-                    retry_time = retry_time.replace(tzinfo=timezone.utc)
-                current_time = datetime.now(tz=timezone.utc)
-                delay = math.ceil((retry_time - current_time).total_seconds())
-                return max(delay, 0)
-            except (TypeError, ValueError, OverflowError) as e:
-                raise ValueError(f"Invalid Retry-After header format: {retry_header}") from e
 
 
-    def _get_retry_after_header(self) -> str|None:
+    def _get_retry_after_header(self, response:GenericResponse) -> str|None:
         """Check if there is a `Retry-After` header and return the result."""
-        retry_header = self.response.headers.get('Retry-After')
+        retry_header = response.headers.get('Retry-After')
         if retry_header is None:
-            retry_header = self.response.headers.get('retry-after')
+            retry_header = response.headers.get('retry-after')
         try:
             return retry_header.strip()
         except AttributeError:
-            return None
+            return None
\ No newline at end of file
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from webweaver_node.core.webscraping.spiders.rate_limiter import domain_of
+
+
+@dataclass(slots=True)
+class SpiderRequest:
+    """A request about to be sent by AiohttpAPI.get() or PlaywrightNavigation.goto(),
+    as seen by the request middlewares. A middleware may rewrite the url before 
+    the transport sends it.
+    """
+    url: str
+    transport: str  # "aiohttp" or "playwright"
+    spider_name: str
+    method: str = "GET"
+    params: dict | None = None
+    use_cache: bool = True  # False for streamed bodies, which must never be read into memory whole
+    meta: dict[str, Any] = field(default_factory=dict)  # scratch space shared by the middlewares
+
+    @property
+    def domain(self) -> str:
+        return domain_of(self.url)
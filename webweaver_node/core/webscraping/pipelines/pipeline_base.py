@@ -1,10 +1,11 @@
 import logging
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from pydantic_core import ValidationError
+from tortoise.transactions import in_transaction
 from typing import TYPE_CHECKING
 
 from webweaver_node.core.exceptions import SchemaValidationError, MethodNotSubclassed, SchemaNotFound
-from webweaver_node.core.webscraping.registry.scraping_registry import scraping_registry, SpiderState
+from webweaver_node.core.webscraping.registry.scraping_registry import ScrapingRegistry, SpiderState
 from webweaver_node.core.webscraping.spiders.spider_data import SpiderData
 from webweaver_node.core.webscraping.fuzzy_matching.fuzzy_handler import FuzzyHandler
 
@@ -13,44 +14,80 @@ if TYPE_CHECKING:
 
 
 logger = logging.getLogger("scraping")
+batch_adapters:dict[type[BaseModel], TypeAdapter] = {}
 
 
 class Pipeline:
 
     schema = None #override this in child class with pydantic schema
 
-    def __init__(self, spider_asset:"SpiderAsset", spider_data:SpiderData):
+    def __init__(self, spider_asset:"SpiderAsset", spider_data:SpiderData=None, scraping_registry:ScrapingRegistry=None):
         self.spider_data = spider_data
         self.spider_asset = spider_asset
+        self.scraping_registry = scraping_registry
         self.data_to_save = None
+        self.batch_to_save:list[BaseModel] = []
         self.fuzzy_handler = FuzzyHandler
 
     def get_spider_asset(self) -> "SpiderAsset":
-        return scraping_registry.get_spider_asset(self.spider_asset.id)
+        return self.scraping_registry.get_spider_asset(self.spider_asset.id)
 
 
     async def validate_data(self):
         if self.schema is None:
             message = f"SchemaNotFound({self.__class__.__name__})"
             logger.error(SchemaNotFound(message))
-            await scraping_registry.set_spider_state(self.spider_asset.id, SpiderState.ERROR)
+            await self.scraping_registry.set_spider_state(self.spider_asset.id, SpiderState.ERROR)
             return
         else:        
             self.data_to_save = await self.validate(self.spider_data.data, self.schema)
 
 
+    async def validate_batch(self, batch:list[SpiderData]):
+        """Validates a whole batch of SpiderData against the schema in one pass."""
+        if self.schema is None:
+            message = f"SchemaNotFound({self.__class__.__name__})"
+            logger.error(SchemaNotFound(message))
+            await self.scraping_registry.set_spider_state(self.spider_asset.id, SpiderState.ERROR)
+            return
+        else:
+            self.batch_to_save = await self.validate_many([spider_data.data for spider_data in batch], self.schema)
+
+
     async def save_data(self):
         """Subclass this method to write pipeline DB-saving logic"""
-        spider_name = scraping_registry.get_spider_name(self.spider_asset.id)
+        spider_name = self.scraping_registry.get_spider_name(self.spider_asset.id)
         logger.error(repr(MethodNotSubclassed(f"{spider_name} has no save_data() method!")))
         return
 
 
+    async def save_batch(self):
+        """Subclass this method to save self.batch_to_save in bulk, ie: with 
+        Model.bulk_create() inside a single transaction. 
+
+        By default each validated item is passed through save_data(), 
+        all inside one transaction.
+        """
+        async with in_transaction():
+            for instance in self.batch_to_save:
+                self.data_to_save = instance
+                await self.save_data()
+        return
+
+
     def _validate(self, data:dict, schema:BaseModel) -> BaseModel:
         """Validate the scraped data against the appropriate pydantic schema"""
         instance = schema(**data)
         return instance
 
+    def _validate_many(self, data_list:list[dict], schema:BaseModel) -> list[BaseModel]:
+        """Validate a list of scraped data in a single pydantic call."""
+        adapter = batch_adapters.get(schema)
+        if adapter is None:
+            adapter = TypeAdapter(list[schema])
+            batch_adapters[schema] = adapter
+        return adapter.validate_python(data_list)
+
     def _validate_or_log(self, data:dict, schema:BaseModel) -> BaseModel:
         """Wrapper for self._validate method to log error."""
         try:
@@ -69,7 +106,21 @@ class Pipeline:
         try:
             return self._validate_or_log(data, schema)
         except SchemaValidationError:
-            await scraping_registry.set_spider_state(self.spider_asset.id, SpiderState.ERROR)
+            await self.scraping_registry.set_spider_state(self.spider_asset.id, SpiderState.ERROR)
 
         return
-    
\ No newline at end of file
+
+
+    async def validate_many(self, data_list:list[dict], schema:BaseModel) -> list[BaseModel]:
+        """Batch version of self.validate. If any item fails validation the errors are
+        logged and the spider's state is updated so it will not continue scraping. 
+        The items that did pass validation are still returned.
+        """
+        try:
+            return self._validate_many(data_list, schema)
+        except ValidationError as e:
+            logger.error(e.errors())
+            logger.error(f"ValidationError count: {e.error_count()}")
+            await self.scraping_registry.set_spider_state(self.spider_asset.id, SpiderState.ERROR)
+            invalid = {error['loc'][0] for error in e.errors()}
+            return self._validate_many([data for i, data in enumerate(data_list) if i not in invalid], schema)
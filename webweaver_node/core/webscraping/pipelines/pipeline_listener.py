@@ -1,65 +1,313 @@
 import asyncio
+from collections import Counter
+from dataclasses import dataclass
 import logging
+import time
+from typing import TYPE_CHECKING
 
-from webweaver_node.core.config import SENTINEL
-from webweaver_node.core.webscraping.spiders.models import SpiderAsset
+from webweaver_node.core.config import (
+    SENTINEL,
+    SPIDER_DATA_BATCH_SIZE,
+    SPIDER_DATA_FLUSH_INTERVAL,
+    PIPELINE_WORKER_COUNT,
+    PIPELINE_WORKER_QUEUE_SIZE,
+)
+from webweaver_node.core.exceptions import WebScrapingError
+from webweaver_node.core.webscraping.metrics.metrics import queue_wait_seconds, save_seconds, validation_seconds
 from webweaver_node.core.webscraping.pipelines.pipeline_base import Pipeline
-from webweaver_node.core.webscraping.registry.scraping_registry import scraping_registry
+from webweaver_node.core.webscraping.registry.scraping_registry import ScrapingRegistry
 from webweaver_node.core.webscraping.spiders.spider_data import SpiderData
 
+if TYPE_CHECKING:
+    from webweaver_node.core.webscraping.spiders.models import SpiderAsset
+
 
 logger = logging.getLogger("scraping")
 
+# WebScrapingError derives from BaseException, so it is not covered by Exception
+PIPELINE_ERRORS = (Exception, WebScrapingError)
+
+
+@dataclass
+class PipelineLatency:
+    """Running totals of how long a spider's pipeline takes to validate and save."""
+    calls: int = 0
+    items: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def avg_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def record(self, seconds:float, items:int):
+        self.calls += 1
+        self.items += items
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+@dataclass
+class PipelineMetrics:
+    """Point-in-time snapshot of the PipelineListener's queues and latencies."""
+    queue_depth: int
+    worker_queue_depths: list[int]
+    latency: dict[str, PipelineLatency]
+
+
+class PipelineWorker:
+    """Consumes one partition of the scrape queue. Every SpiderData for a given
+    spider_id is routed to the same worker, so each spider's data is still
+    saved in the order it was scraped.
+
+    When batch_size is greater than 1, SpiderData is grouped by spider_id and each
+    batch is validated and saved at once, either when it reaches batch_size or when
+    it has been waiting for flush_interval seconds.
+
+    A SpiderData or batch whose pipeline fails is logged and dropped, and the 
+    worker keeps consuming. A worker that stopped would leave its bounded queue 
+    to fill up, and the dispatcher and every spider behind it blocked on put().
+    """
+    def __init__(self, worker_id:int, listener:"PipelineListener"):
+        self.worker_id = worker_id
+        self.listener = listener
+        self.queue = asyncio.Queue(maxsize=PIPELINE_WORKER_QUEUE_SIZE)
+        self.batch_size = listener.batch_size
+        self.flush_interval = listener.flush_interval
+        self.sentinel = listener.sentinel
+        self.batches:dict[int, list[SpiderData]] = {}
+        self.deadlines:dict[int, float] = {}
+
+
+    def add_to_batch(self, spider_data:SpiderData) -> bool:
+        """Adds the SpiderData to its spider's batch. Returns True once the batch is full."""
+        batch = self.batches.setdefault(spider_data.spider_id, [])
+        if not batch:
+            self.deadlines[spider_data.spider_id] = time.monotonic() + self.flush_interval
+        batch.append(spider_data)
+        return len(batch) >= self.batch_size
+
+
+    async def flush(self, spider_id:int):
+        """Saves and clears the spider's pending batch."""
+        batch = self.batches.pop(spider_id, None)
+        self.deadlines.pop(spider_id, None)
+        if batch:
+            try:
+                await self.listener.process_pipeline_batch(spider_id, batch)
+            except PIPELINE_ERRORS as e:
+                self.listener.record_failure(spider_id, e, items=len(batch))
+        return
+
+
+    async def flush_expired(self):
+        """Saves every batch that has been waiting longer than self.flush_interval"""
+        now = time.monotonic()
+        expired = [spider_id for spider_id, deadline in self.deadlines.items() if deadline <= now]
+        for spider_id in expired:
+            await self.flush(spider_id)
+        return
+
+
+    async def flush_all(self):
+        for spider_id in list(self.batches):
+            await self.flush(spider_id)
+        return
+
+
+    def _time_to_next_flush(self) -> float | None:
+        """Seconds until the oldest batch is due, or None if nothing is pending."""
+        if not self.deadlines:
+            return None
+        return max(min(self.deadlines.values()) - time.monotonic(), 0)
+
+
+    async def _listen_single(self):
+        """Processes each SpiderData as soon as it comes off the queue."""
+        while True:
+            spider_data:SpiderData = await self.queue.get()
+            if spider_data == self.sentinel:
+                break
+            try:
+                await self.listener.process_pipeline_data(spider_data)
+            except PIPELINE_ERRORS as e:
+                self.listener.record_failure(spider_data.spider_id, e)
+        return
+
+
+    async def _listen_batched(self):
+        """Collects SpiderData into per-spider batches and saves them when full or
+        when their flush deadline passes. Everything left is saved once the
+        sentinel value arrives.
+        """
+        while True:
+            try:
+                spider_data:SpiderData = await asyncio.wait_for(
+                    self.queue.get(),
+                    timeout=self._time_to_next_flush()
+                )
+            except asyncio.TimeoutError:
+                await self.flush_expired()
+                continue
+            if spider_data == self.sentinel:
+                await self.flush_all()
+                break
+            if self.add_to_batch(spider_data):
+                await self.flush(spider_data.spider_id)
+            await self.flush_expired()
+        return
+
+
+    async def run(self):
+        if self.batch_size > 1:
+            await self._listen_batched()
+        else:
+            await self._listen_single()
+        logger.debug(f"PipelineWorker {self.worker_id} terminated")
+        return
+
 
 class PipelineListener:
-    """This class handles listening to the queue for scraped data, 
+    """This class handles listening to the queue for scraped data,
     and then passing it to the appropriate Pineline subclass.
+
+    Data is spread across worker_count PipelineWorkers, keyed by spider_id, so a
+    slow pipeline only holds up the spiders that share its worker. The worker
+    queues are bounded, so when the pipelines fall behind the spiders block on
+    queue.put() instead of piling up data in memory.
     """
 
-    def __init__(self, queue:asyncio.Queue):
+    def __init__(
+            self,
+            queue:asyncio.Queue,
+            scraping_registry:ScrapingRegistry,
+            batch_size:int=SPIDER_DATA_BATCH_SIZE,
+            flush_interval:float=SPIDER_DATA_FLUSH_INTERVAL,
+            worker_count:int=PIPELINE_WORKER_COUNT,
+    ):
         self.queue = queue
+        self.scraping_registry = scraping_registry
         self.sentinel = SENTINEL
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.latency:dict[str, PipelineLatency] = {}
+        self.items_saved:Counter[int] = Counter()
+        self.items_dropped:Counter[int] = Counter()
+        self.workers = [PipelineWorker(worker_id, self) for worker_id in range(worker_count)]
 
 
-    def get_spider_asset(self, spider_id:int) -> SpiderAsset:
+    def get_spider_asset(self, spider_id:int) -> "SpiderAsset":
         """Returns the SpiderAsset from the spider registry"""
-        return scraping_registry.registry[spider_id].spider_asset
+        return self.scraping_registry.get_spider_asset(spider_id)
 
 
-    def get_pipeline_object(self, sa:SpiderAsset, spider_data:SpiderData=None) -> Pipeline | None:
+    def get_pipeline_object(self, sa:"SpiderAsset", spider_data:SpiderData=None) -> Pipeline | None:
         """Retrieves the pipeline class for the SpiderAsset"""
         pipeline = None
         PipelineClass = sa.get_pipeline()
         if PipelineClass:
-            pipeline = PipelineClass(spider_asset=sa, spider_data=spider_data)
+            pipeline = PipelineClass(
+                spider_asset=sa, 
+                scraping_registry=self.scraping_registry, 
+                spider_data=spider_data,
+            )
         return pipeline
 
 
+    def get_worker(self, spider_id:int) -> PipelineWorker:
+        """Returns the worker responsible for this spider's data."""
+        return self.workers[spider_id % len(self.workers)]
+
+
+    def record_latency(self, spider_name:str, start:float, items:int=1):
+        latency = self.latency.setdefault(spider_name, PipelineLatency())
+        latency.record(time.monotonic() - start, items)
+        return
+
+
+    def record_failure(self, spider_id:int, e:BaseException, items:int=1):
+        """Logs a pipeline failure. Its SpiderData is dropped."""
+        self.items_dropped[spider_id] += items
+        logger.error(
+            f"{e.__class__.__name__}: {e} (spider_id {spider_id}), dropped {items} item(s)",
+            exc_info=(type(e), e, e.__traceback__),
+        )
+        return
+
+
+    def metrics(self) -> PipelineMetrics:
+        """Returns the current queue depths and per-pipeline latencies."""
+        return PipelineMetrics(
+            queue_depth=self.queue.qsize(),
+            worker_queue_depths=[worker.queue.qsize() for worker in self.workers],
+            latency=dict(self.latency),
+        )
+
+
     async def process_pipeline_data(
-            self, 
+            self,
             spider_data:SpiderData
     ):
         spider_asset = self.get_spider_asset(spider_data.spider_id)
+        spider_name = spider_asset.spider_name
+        queue_wait_seconds.observe(time.monotonic() - spider_data.enqueued_at, spider_name=spider_name)
         pipeline = self.get_pipeline_object(sa=spider_asset, spider_data=spider_data)
         if pipeline is not None:
-            await pipeline.validate_data()
-            try:
+            start = time.monotonic()
+            with validation_seconds.time(spider_name=spider_name):
+                await pipeline.validate_data()
+            with save_seconds.time(spider_name=spider_name):
                 await pipeline.save_data()
-            except Exception as e:
-                logger.error(f"{e.__class__.__name__} ({spider_asset.spider_name})")
-                raise
+            self.record_latency(spider_asset.spider_name, start)
+            if pipeline.data_to_save is not None:
+                self.items_saved[spider_data.spider_id] += 1
         return
 
 
-    async def listen(self):
-        """Checking the queue for data and instantiating the 
-        appropriate Pipeline subclass for processing.
+    async def process_pipeline_batch(
+            self,
+            spider_id:int,
+            batch:list[SpiderData],
+    ):
+        spider_asset = self.get_spider_asset(spider_id)
+        spider_name = spider_asset.spider_name
+        now = time.monotonic()
+        for spider_data in batch:
+            queue_wait_seconds.observe(now - spider_data.enqueued_at, spider_name=spider_name)
+        pipeline = self.get_pipeline_object(sa=spider_asset)
+        if pipeline is not None:
+            start = time.monotonic()
+            with validation_seconds.time(spider_name=spider_name):
+                await pipeline.validate_batch(batch)
+            with save_seconds.time(spider_name=spider_name):
+                await pipeline.save_batch()
+            self.record_latency(spider_asset.spider_name, start, items=len(batch))
+            self.items_saved[spider_id] += len(pipeline.batch_to_save)
+        return
+
+
+    async def dispatch(self):
+        """Routes each SpiderData on the scrape queue to its spider's worker.
+        The sentinel value is passed on to every worker so they all shut down.
         """
         while True:
             spider_data:SpiderData = await self.queue.get()
             if spider_data == self.sentinel:
                 logger.info("Pipeline sentinel value received")
                 break
-            await self.process_pipeline_data(spider_data)  
+            await self.get_worker(spider_data.spider_id).queue.put(spider_data)
+
+        for worker in self.workers:
+            await worker.queue.put(self.sentinel)
+        return
 
+
+    async def listen(self):
+        """Checking the queue for data and instantiating the
+        appropriate Pipeline subclass for processing.
+        """
+        await asyncio.gather(
+            self.dispatch(),
+            *[worker.run() for worker in self.workers]
+        )
         logger.info("Pipeline terminated")
@@ -0,0 +1,59 @@
+import asyncio
+import logging
+import time
+
+from webweaver_node.core.config import PROXY_BREAKER_THRESHOLD, PROXY_BREAKER_COOLDOWN
+
+
+logger = logging.getLogger('scraping')
+
+
+class CircuitBreaker:
+    """Tracks consecutive failures for a single proxy endpoint. Once the failures
+    reach the threshold the breaker opens and every request through that endpoint 
+    waits out the cooldown, while traffic to other endpoints carries on.
+
+    After the cooldown the breaker lets requests through again. A success closes 
+    it, another failure re-opens it for a longer cooldown.
+    """
+    def __init__(
+            self, 
+            endpoint:str, 
+            threshold:int=PROXY_BREAKER_THRESHOLD, 
+            cooldown:float=PROXY_BREAKER_COOLDOWN,
+    ):
+        self.endpoint = endpoint
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return time.monotonic() < self.open_until
+
+
+    async def wait_until_closed(self):
+        """Sleeps until the endpoint's cooldown has passed."""
+        while self.is_open:
+            await asyncio.sleep(self.open_until - time.monotonic())
+        return
+
+
+    def record_success(self):
+        self.failures = 0
+        self.trips = 0
+
+
+    def record_failure(self):
+        """Opens the breaker when the failure threshold is reached. Each time 
+        it trips again without a success in between, the cooldown doubles.
+        """
+        self.failures += 1
+        if self.failures >= self.threshold:
+            cooldown = self.cooldown * (2 ** self.trips)
+            self.open_until = time.monotonic() + cooldown
+            self.trips += 1
+            self.failures = 0
+            logger.warning(f"Proxy endpoint '{self.endpoint}' circuit open for {cooldown} seconds")
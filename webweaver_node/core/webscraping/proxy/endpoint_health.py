@@ -0,0 +1,123 @@
+from collections import deque
+import time
+
+from webweaver_node.core.config import (
+    PROXY_HEALTH_EWMA_ALPHA,
+    PROXY_HEALTH_BAN_WINDOW,
+    PROXY_QUARANTINE_BAN_COUNT,
+    PROXY_QUARANTINE_SUCCESS_RATE,
+    PROXY_QUARANTINE_MIN_REQUESTS,
+    PROXY_QUARANTINE_COOLDOWN,
+)
+
+
+BAN_STATUS_CODES = (403, 429)
+
+
+class EndpointHealth:
+    """Health of a single proxy endpoint, fed by every ProxySession using it:
+    an EWMA of its latency and of its success rate, the 403/429 responses it
+    got within the last ban_window seconds, and its quarantine timer.
+
+    Connection errors and 403/429 responses count as failures. Any other 
+    response counts as a success, since a 404 or a 500 is the site's doing,
+    not the proxy's.
+
+    The CircuitBreaker reacts to consecutive connection errors within seconds.
+    EndpointHealth is slower: it decides which sticky endpoints are handed out
+    first, and which are quarantined until they pass a retest.
+    """
+    def __init__(
+            self,
+            endpoint:str,
+            alpha:float=PROXY_HEALTH_EWMA_ALPHA,
+            ban_window:float=PROXY_HEALTH_BAN_WINDOW,
+            ban_count:int=PROXY_QUARANTINE_BAN_COUNT,
+            min_success_rate:float=PROXY_QUARANTINE_SUCCESS_RATE,
+            min_requests:int=PROXY_QUARANTINE_MIN_REQUESTS,
+            cooldown:float=PROXY_QUARANTINE_COOLDOWN,
+    ):
+        self.endpoint = endpoint
+        self.alpha = alpha
+        self.ban_window = ban_window
+        self.ban_count = ban_count
+        self.min_success_rate = min_success_rate
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self.latency:float = None  # seconds, None until the first response
+        self.success_rate = 1.0
+        self.requests = 0
+        self.bans:deque[float] = deque()
+        self.quarantined_until = 0.0
+        self.quarantines = 0
+
+
+    @property
+    def recent_bans(self) -> int:
+        """403/429 responses within the last ban_window seconds."""
+        cutoff = time.monotonic() - self.ban_window
+        while self.bans and self.bans[0] < cutoff:
+            self.bans.popleft()
+        return len(self.bans)
+
+
+    @property
+    def is_quarantined(self) -> bool:
+        return time.monotonic() < self.quarantined_until
+
+
+    def score(self) -> float:
+        """Lower is better. Endpoints without any responses yet score 0, so 
+        they get tried before the known ones.
+        """
+        if self.latency is None:
+            return 0.0
+        return self.latency * (1 + self.recent_bans) / max(self.success_rate, 0.01)
+
+
+    def _observe(self, success:bool, latency:float=None):
+        self.requests += 1
+        self.success_rate += self.alpha * (float(success) - self.success_rate)
+        if latency is not None:
+            self.latency = latency if self.latency is None else self.latency + self.alpha * (latency - self.latency)
+        return
+
+
+    def record_response(self, status:int, latency:float):
+        banned = status in BAN_STATUS_CODES
+        if banned:
+            self.bans.append(time.monotonic())
+        self._observe(not banned, latency)
+        return
+
+
+    def record_failure(self):
+        self._observe(False)
+        return
+
+
+    def should_quarantine(self) -> bool:
+        if self.recent_bans >= self.ban_count:
+            return True
+        return self.requests >= self.min_requests and self.success_rate < self.min_success_rate
+
+
+    def quarantine(self) -> float:
+        """Starts the quarantine and returns its length in seconds. Each 
+        quarantine without a passed retest in between is twice as long.
+        """
+        cooldown = self.cooldown * (2 ** self.quarantines)
+        self.quarantined_until = time.monotonic() + cooldown
+        self.quarantines += 1
+        return cooldown
+
+
+    def restore(self, latency:float):
+        """The endpoint passed its retest: starts over with a clean record."""
+        self.latency = latency
+        self.success_rate = 1.0
+        self.requests = 0
+        self.bans.clear()
+        self.quarantined_until = 0.0
+        self.quarantines = 0
+        return
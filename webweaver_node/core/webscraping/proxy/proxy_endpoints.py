@@ -7,5 +7,5 @@ class ProxyEndpoints:
         self.PROXY_USER = os.environ.get('PROXY_USER')
         self.PROXY_PASS = os.environ.get('PROXY_PASS')
         self.rotating = f"{PROXY_URL}:{PROXY_ROTATING_PORT}"
-        self.sticky = [f"{PROXY_URL}:{i}" for i in range(PROXY_ROTATING_PORT[0], PROXY_ROTATING_PORT[1]+1)]
+        self.sticky = [f"{PROXY_URL}:{i}" for i in range(PROXY_STATIC_PORT_RANGE[0], PROXY_STATIC_PORT_RANGE[1]+1)]
         self.in_use = set()
\ No newline at end of file
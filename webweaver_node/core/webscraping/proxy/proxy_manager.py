@@ -1,10 +1,17 @@
 
 import asyncio 
+import heapq
+import itertools
 import logging
 import os
+import time
 
-from webweaver_node.core.config import USE_PROXY
-from webweaver_node.core.webscraping.proxy.proxy_session import ProxySession
+import aiohttp
+
+from webweaver_node.core.config import USE_PROXY, PROXY_HEALTH_CHECK_URL, PROXY_HEALTH_CHECK_TIMEOUT
+from webweaver_node.core.webscraping.proxy.circuit_breaker import CircuitBreaker
+from webweaver_node.core.webscraping.proxy.endpoint_health import EndpointHealth
+from webweaver_node.core.webscraping.proxy.proxy_session import ProxySession, proxy_url
 from webweaver_node.core.webscraping.proxy.proxy_endpoints import ProxyEndpoints
 
 
@@ -39,8 +46,23 @@ class SessionProxyManagerInterface:
         await self.manager.release_sticky_endpoint(endpoint)
 
 
+    def get_breaker(self, endpoint:str) -> CircuitBreaker:
+        return self.manager.get_breaker(endpoint)
+
+
+    def get_health(self, endpoint:str) -> EndpointHealth:
+        return self.manager.get_health(endpoint)
+
+
 class ProxyManager:
-    """This is the shared-state between all instances of ProxySession."""
+    """This is the shared-state between all instances of ProxySession.
+
+    Free sticky endpoints are kept in a heap ordered by their EndpointHealth 
+    score, so the fastest healthy endpoint is handed out first. An endpoint's
+    score only changes while a ProxySession holds it, so it is pushed back with
+    its new score when released. Endpoints released in bad health are 
+    quarantined instead, and come back to the heap once they pass a retest.
+    """
     def __init__(self):
 
         self.endpoint_lock = asyncio.Lock()
@@ -48,6 +70,14 @@ class ProxyManager:
         self.proxy_api = self._create_proxy_api()
         self.session_manager_interface = self._create_session_interface()
         self.endpoints = ProxyEndpoints()
+        self.breakers:dict[str, CircuitBreaker] = {}
+        self.health:dict[str, EndpointHealth] = {}
+        self.sequence = itertools.count()  # heap tie-breaker
+        self.free_endpoints:list[tuple[float, int, str]] = [
+            (0.0, next(self.sequence), endpoint) for endpoint in self.endpoints.sticky
+        ]
+        self.retests:set[asyncio.Task] = set()
+        self.health_check_session:aiohttp.ClientSession = None
 
 
     def _create_session_interface(self) -> SessionProxyManagerInterface:
@@ -61,28 +91,123 @@ class ProxyManager:
         return ProxyAPI(proxy_manager=self) if USE_PROXY else None
 
 
+    def get_breaker(self, endpoint:str) -> CircuitBreaker:
+        """Returns the endpoint's CircuitBreaker, which is shared by every 
+        ProxySession using that endpoint.
+        """
+        breaker = self.breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(endpoint)
+            self.breakers[endpoint] = breaker
+        return breaker
+
+
+    def get_health(self, endpoint:str) -> EndpointHealth:
+        """Returns the endpoint's EndpointHealth, which is shared by every 
+        ProxySession using that endpoint.
+        """
+        health = self.health.get(endpoint)
+        if health is None:
+            health = EndpointHealth(endpoint)
+            self.health[endpoint] = health
+        return health
+
+
     async def get_sticky_endpoint(self) -> str:
-        """Retrieve a sticky endpoint. If all endpoints are in use (in the self.endpoints.in_use set)
-        then this function will perform an async wait() until the resource has been freed.
+        """Retrieve the best scoring free sticky endpoint. If all endpoints are in use 
+        or quarantined then this function will perform an async wait() until one 
+        has been freed.
         """
         async with self.endpoint_condition:
-            while True:
-                for endpoint in self.endpoints.sticky:
-                    if endpoint not in self.endpoints.in_use:
-                        self.endpoints.in_use.add(endpoint)
-                        return endpoint
+            while not self.free_endpoints:
                 await self.endpoint_condition.wait()
+            _, _, endpoint = heapq.heappop(self.free_endpoints)
+            self.endpoints.in_use.add(endpoint)
+            return endpoint
 
 
     async def release_sticky_endpoint(self, endpoint:str):
-        """Release the sticky endpoint so that other ProxySessions can use it."""
+        """Release the sticky endpoint so that other ProxySessions can use it,
+        or quarantine it if its health says it should not be used for now.
+        """
         async with self.endpoint_lock:
             try:
                 self.endpoints.in_use.remove(endpoint)
             except KeyError as e:
                 logger.error(e, exc_info=True)
                 raise
-            self.endpoint_condition.notify()
+            health = self.get_health(endpoint)
+            if health.should_quarantine():
+                self._quarantine(endpoint)
+                return
+            self._free_endpoint(endpoint)
+
+
+    def _free_endpoint(self, endpoint:str):
+        """Must be called with the endpoint_lock held."""
+        heapq.heappush(self.free_endpoints, (self.get_health(endpoint).score(), next(self.sequence), endpoint))
+        self.endpoint_condition.notify()
+        return
+
+
+    def _quarantine(self, endpoint:str):
+        health = self.get_health(endpoint)
+        cooldown = health.quarantine()
+        logger.warning(
+            f"Proxy endpoint '{endpoint}' quarantined for {cooldown} seconds "
+            f"(success rate {health.success_rate:.2f}, {health.recent_bans} recent 403/429 responses)"
+        )
+        task = asyncio.create_task(self._retest(endpoint, cooldown))
+        self.retests.add(task)
+        task.add_done_callback(self.retests.discard)
+        return
+
+
+    async def _retest(self, endpoint:str, cooldown:float):
+        """Waits out the quarantine, then checks the endpoint again until it passes."""
+        health = self.get_health(endpoint)
+        while True:
+            await asyncio.sleep(cooldown)
+            latency = await self.check_endpoint(endpoint)
+            if latency is not None:
+                break
+            cooldown = health.quarantine()
+            logger.warning(f"Proxy endpoint '{endpoint}' failed its retest, quarantined for {cooldown} more seconds")
+        health.restore(latency)
+        async with self.endpoint_lock:
+            self._free_endpoint(endpoint)
+        logger.info(f"Proxy endpoint '{endpoint}' passed its retest in {latency:.2f} seconds")
+        return
+
+
+    async def check_endpoint(self, endpoint:str) -> float | None:
+        """Fetches PROXY_HEALTH_CHECK_URL through the endpoint. Returns how long 
+        it took, or None if it failed.
+        """
+        if self.health_check_session is None:
+            self.health_check_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=PROXY_HEALTH_CHECK_TIMEOUT)
+            )
+        start = time.perf_counter()
+        try:
+            async with self.health_check_session.get(PROXY_HEALTH_CHECK_URL, proxy=proxy_url(endpoint)) as res:
+                await res.read()
+                if res.status >= 400:
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+        return time.perf_counter() - start
+
+
+    async def close(self):
+        """Stops the retests still waiting on quarantined endpoints."""
+        for task in list(self.retests):
+            task.cancel()
+        await asyncio.gather(*self.retests, return_exceptions=True)
+        if self.health_check_session is not None:
+            await self.health_check_session.close()
+            self.health_check_session = None
+        return
 
 
     async def create_proxy_session(self, stateful:bool=False) -> ProxySession:
@@ -99,5 +224,6 @@ class ProxyManager:
         return ProxySession(
             endpoint=endpoint,
             manager_interface=self.session_manager_interface,
+            sticky=stateful,
         )
         
@@ -7,6 +7,11 @@ if TYPE_CHECKING:
     from webweaver_node.core.webscraping.proxy.proxy_manager import SessionProxyManagerInterface
 
 
+def proxy_url(endpoint:str) -> str:
+    """Includes the username/pass in the proxy endpoint"""
+    return f"http://{os.getenv('PROXY_USER')}:{os.getenv('PROXY_PASS')}@{endpoint}"
+
+
 class ProxySession:
     """This class governs the communication with the proxy service endpoint.
     If we have 100 IPs to scrape with then up to 100 ProxySessions will be made. 
@@ -16,29 +21,56 @@ class ProxySession:
 
     ProxySessions can also share state via the methods in their self.manager_interface
     class, which is an interface for getting/setting state in the ProxyManager object
-    that created them all.
+    that created them all. Every response and connection error through the session
+    is fed into its endpoint's CircuitBreaker and EndpointHealth, which are shared
+    by every ProxySession using the endpoint.
     """
     def __init__(
             self, 
             endpoint:str,
             manager_interface:"SessionProxyManagerInterface", 
+            sticky:bool=False,
             # request_context:Optional[RequestContext],
             ):
         self.endpoint = endpoint
         self.manager_interface = manager_interface
+        self.sticky = sticky
+        self.released = False
+        self.breaker = manager_interface.get_breaker(endpoint)
+        self.health = manager_interface.get_health(endpoint)
         # self.request_context = request_context
 
 
     @property
     def full_endpoint(self) -> str:
         """Includes the username/pass in the proxy endpoint"""
-        return f"http://{os.getenv('PROXY_USER')}:{os.getenv('PROXY_PASS')}@{self.endpoint}"
+        return proxy_url(self.endpoint)
+
+
+    async def wait_until_available(self):
+        """Waits out the endpoint's cooldown if its circuit is open."""
+        await self.breaker.wait_until_closed()
+
+
+    def record_response(self, status:int, latency:float):
+        """A response came back through the endpoint, latency is in seconds."""
+        self.breaker.record_success()
+        self.health.record_response(status, latency)
+
+
+    def record_failure(self):
+        """The request through the endpoint failed to get any response."""
+        self.breaker.record_failure()
+        self.health.record_failure()
 
 
     async def release(self):
-        """Releases the proxy endpoint so that other proxysession objects
-        may use it.
+        """Releases the sticky proxy endpoint so that other proxysession objects
+        may use it. The rotating endpoint is never held, so there is nothing to release.
         """
+        if not self.sticky or self.released:
+            return
+        self.released = True
         await self.manager_interface.release_endpoint(self.endpoint)
         return
 
@@ -13,19 +13,39 @@ logger = logging.getLogger('scraping')
 
 class RegistryBuilder:
 
-    def __init__(self, launch_data:LaunchSpiderSchema):
+    def __init__(self, launch_data:LaunchSpiderSchema=None):
         self.spider_details = []
-        self.spider_id = launch_data.id
+        self.spider_id = launch_data.id if launch_data else None
         self.spider_asset:SpiderAsset = None
-        self.params = {}
-        params_list = [param.model_dump() for param in launch_data.params]
-        for param in params_list:
-            self.params[param['param_name']] = param['param_value']
+        self.params = self._params(launch_data)
+
+    @staticmethod
+    def _params(launch_data:LaunchSpiderSchema=None) -> dict[str, str]:
+        params_list = [param.model_dump() for param in launch_data.params or []] if launch_data else []
+        return {param['param_name']: param['param_value'] for param in params_list}
 
     async def initialize_solo_scrape(self):
         self.spider_asset = await self._get_spider_asset()
         self.build_spider_details()
 
+    async def initialize_multi_scrape(self, launch_data:list[LaunchSpiderSchema]):
+        """Builds the spider details for every spider of a multi-spider launch."""
+        for spider_launch_data in launch_data:
+            self.spider_id = spider_launch_data.id
+            self.params = self._params(spider_launch_data)
+            self.spider_asset = await self._get_spider_asset()
+            self.build_spider_details()
+
+    async def initialize_shard(self, shard:list[tuple[int, dict[str, str]]]):
+        """Builds the spider details for a scrape worker process from the
+        (spider_id, params) pairs it was handed by the parent process.
+        """
+        for spider_id, params in shard:
+            self.spider_id = spider_id
+            self.params = params
+            self.spider_asset = await self._get_spider_asset()
+            self.build_spider_details()
+
     def build_spider_details(self):
         d = {
             'spider': self.spider_asset,
@@ -2,14 +2,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 from asyncio import Lock
 import logging
+from typing import TYPE_CHECKING
 
 from webweaver_node.core.common.enums import SpiderState
-from webweaver_node.core.webscraping.registry.builders import RegistryBuilder
-from webweaver_node.core.webscraping.spiders.models import SpiderAsset
+from webweaver_node.core.webscraping.spiders.module_cache import module_cache
+
+if TYPE_CHECKING:
+    from webweaver_node.core.webscraping.registry.builders import RegistryBuilder
+    from webweaver_node.core.webscraping.spiders.models import SpiderAsset
 
 
 logger = logging.getLogger('scraping')
-lock = Lock()
 
 
 @dataclass
@@ -32,15 +35,23 @@ class ScrapingRegistry:
     }
     -The keys (ints) are the SpiderAsset IDs. The values are the SpiderAssets and their states.
     -Spider's check_state() method checks the state and Pipeline's update_state() updates it.
+
+    Each scrape job builds its own ScrapingRegistry and passes it down to the
+    SpiderLauncher, Spiders, PipelineListener and Pipelines, so jobs running 
+    concurrently in the same event loop never see each other's state.
     """
-    registry: dict[int, SpiderRegistryItem] = {}
-    spiders: list[SpiderAsset] = None
+    def __init__(self):
+        self.registry:dict[int, SpiderRegistryItem] = {}
+        self.spiders:list[SpiderAsset] = []
+        self.lock = Lock()
+
 
     async def build(self,
             builder: RegistryBuilder = None,
     ):
         self.add_spiders(builder.spider_details)  
         self.spiders = self.create_spider_list(builder.spider_details)
+        module_cache.warm(self.spiders)
 
 
     def create_spider_list(self, spider_details: list) -> list[SpiderAsset]:
@@ -83,11 +94,11 @@ class ScrapingRegistry:
         """When a spider causes pipeline errors, the pipeline listener can
         set the spider's state the ERROR to stop webscraping from proceeding.
         """
-        async with lock:
+        async with self.lock:
             self._get_sri(spider_id).state = SpiderState.ERROR
 
     async def set_spider_state(self, spider_id: int, state: SpiderState):
-        async with lock:
+        async with self.lock:
             self._get_sri(spider_id).state = state
 
     def get_spider_name(self, spider_id: int) -> str:
@@ -101,7 +112,7 @@ class ScrapingRegistry:
         """Scrape job finished successfully!
         clear the registry.
         """
-        async with lock:
+        async with self.lock:
             # await self.increase_scrape_count(scrape_finished=True)
             self.clear()
             logger.info("Scraping successful")
@@ -111,8 +122,5 @@ class ScrapingRegistry:
     def clear(self):
         """Sets all the registry's values to defaults, thus clearing the registry."""
         self.registry = {}
-        self.spiders = None
+        self.spiders = []
         return
-
-
-scraping_registry = ScrapingRegistry()
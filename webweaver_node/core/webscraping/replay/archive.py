@@ -0,0 +1,131 @@
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from yarl import URL
+
+from webweaver_node.core.webscraping.spiders.http_cache import HOP_BY_HOP_HEADERS
+
+
+logger = logging.getLogger('scraping')
+
+
+def replay_url(url:str, params:dict=None) -> str:
+    """The URL a request is archived under, with its query params merged in."""
+    if params:
+        url = str(URL(url).update_query(params))
+    return url
+
+
+@dataclass
+class ReplayEntry:
+    """One recorded response. The body is stored once per distinct content in
+    bodies/{body}, so pages fetched by both transports are not duplicated.
+    """
+    method: str
+    url: str
+    status: int
+    headers: list[tuple[str, str]]
+    body: str  # sha256 of the body
+    transport: str  # "aiohttp" or "playwright"
+    recorded_at: float
+
+
+class ReplayArchive:
+    """Directory holding every request/response of one or more recorded spider
+    runs:
+
+        {name}/
+            index-{pid}.jsonl   one ReplayEntry per line, per recording process
+            bodies/{sha256}     the decoded response bodies
+
+    Each recording process appends to its own index file, so sharded scrapes
+    can record into the same archive. When loaded, every index file is read
+    and a URL requested several times is replayed in the order it was recorded,
+    the last response repeating once the others have been served.
+    """
+    def __init__(self, directory:str):
+        self.directory = directory
+        self.bodies_dir = os.path.join(directory, 'bodies')
+        self.entries:dict[tuple[str, str], list[ReplayEntry]] = defaultdict(list)
+        self.served:dict[tuple[str, str], int] = defaultdict(int)
+        self.recorded = 0
+
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.directory, f"index-{os.getpid()}.jsonl")
+
+
+    def _write_body(self, body:bytes) -> str:
+        digest = hashlib.sha256(body).hexdigest()
+        path = os.path.join(self.bodies_dir, digest)
+        if not os.path.exists(path):
+            fd, tmp_path = tempfile.mkstemp(dir=self.bodies_dir)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        return digest
+
+
+    def record(self, method:str, url:str, status:int, headers:dict, body:bytes, transport:str) -> ReplayEntry:
+        """Appends a response to this process's index file."""
+        os.makedirs(self.bodies_dir, exist_ok=True)
+        entry = ReplayEntry(
+            method=method.upper(),
+            url=url,
+            status=status,
+            headers=[(name, value) for name, value in headers.items() if name.lower() not in HOP_BY_HOP_HEADERS],
+            body=self._write_body(body),
+            transport=transport,
+            recorded_at=time.time(),
+        )
+        with open(self.index_path, 'a') as f:
+            f.write(json.dumps(asdict(entry)) + '\n')
+        self.entries[(entry.method, entry.url)].append(entry)
+        self.recorded += 1
+        return entry
+
+
+    def load(self) -> int:
+        """Reads every index file in the archive. Returns the number of entries."""
+        self.entries.clear()
+        self.served.clear()
+        if not os.path.isdir(self.directory):
+            logger.warning(f"Replay archive '{self.directory}' does not exist, every request will miss")
+            return 0
+        count = 0
+        for name in sorted(os.listdir(self.directory)):
+            if not (name.startswith('index-') and name.endswith('.jsonl')):
+                continue
+            with open(os.path.join(self.directory, name), 'r') as f:
+                for line in f:
+                    if line.strip():
+                        entry = ReplayEntry(**json.loads(line))
+                        self.entries[(entry.method, entry.url)].append(entry)
+                        count += 1
+        for entries in self.entries.values():
+            entries.sort(key=lambda entry: entry.recorded_at)
+        logger.info(f"Loaded {count} responses from replay archive '{self.directory}'")
+        return count
+
+
+    def lookup(self, method:str, url:str) -> ReplayEntry | None:
+        """The next recorded response for the request, or None if it was never recorded."""
+        key = (method.upper(), url)
+        entries = self.entries.get(key)
+        if not entries:
+            return None
+        index = min(self.served[key], len(entries) - 1)
+        self.served[key] += 1
+        return entries[index]
+
+
+    def read_body(self, entry:ReplayEntry) -> bytes:
+        with open(os.path.join(self.bodies_dir, entry.body), 'rb') as f:
+            return f.read()
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import os
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from playwright.async_api import BrowserContext, Page, Route
+from yarl import URL
+
+from webweaver_node.core.common.enums import ReplayMode
+from webweaver_node.core.config import REPLAY_MODE, REPLAY_ARCHIVES_DIR, REPLAY_ARCHIVE
+from webweaver_node.core.webscraping.replay.archive import ReplayArchive, replay_url
+from webweaver_node.core.webscraping.replay.replay_server import ReplayServer
+from webweaver_node.core.webscraping.spiders.http_cache import CachedResponse
+
+
+logger = logging.getLogger('scraping')
+
+
+class ReplayManager:
+    """Records every request a spider run makes, through aiohttp and Playwright,
+    into a ReplayArchive, or replays a recorded run offline through a local
+    ReplayServer. Set with the REPLAY_MODE and REPLAY_ARCHIVE env variables.
+
+    Recorded and replayed responses both reach the spider as a CachedResponse
+    carrying the original URL, so spider modules, middleware and pipelines see
+    exactly the same responses in both modes. This makes a replayed run a
+    deterministic benchmark of the SpiderLauncher -> PipelineListener path.
+
+    Every WebScrape running in the process shares the manager: the archive is
+    opened and the server started by the first one, and stopped by the last.
+    """
+    def __init__(self, mode:ReplayMode=ReplayMode(REPLAY_MODE), directory:str=None):
+        self.mode = mode
+        self.archive = ReplayArchive(directory or os.path.join(REPLAY_ARCHIVES_DIR, REPLAY_ARCHIVE))
+        self.server:ReplayServer = None
+        self.session:aiohttp.ClientSession = None
+        self.users = 0
+        self.lock = asyncio.Lock()
+
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == ReplayMode.RECORD
+
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == ReplayMode.REPLAY
+
+
+    @property
+    def active(self) -> bool:
+        return self.mode != ReplayMode.OFF
+
+
+    async def start(self):
+        if not self.active:
+            return
+        async with self.lock:
+            self.users += 1
+            if self.users > 1:
+                return
+            if self.replaying:
+                await asyncio.to_thread(self.archive.load)
+                self.server = ReplayServer(self.archive)
+                await self.server.start()
+                self.session = aiohttp.ClientSession()
+            else:
+                logger.info(f"Recording spider traffic to replay archive '{self.archive.directory}'")
+        return
+
+
+    async def stop(self):
+        if not self.active:
+            return
+        async with self.lock:
+            self.users -= 1
+            if self.users > 0:
+                return
+            if self.replaying:
+                await self.session.close()
+                await self.server.stop()
+                self.session = None
+                self.server = None
+            else:
+                logger.info(f"Recorded {self.archive.recorded} responses to '{self.archive.directory}'")
+        return
+
+
+    async def record(self, response:aiohttp.ClientResponse | CachedResponse, method:str='GET') -> CachedResponse:
+        """Archives an aiohttp response and hands back a CachedResponse with the same body."""
+        body = await response.read()
+        response.release()
+        await asyncio.to_thread(
+            self.archive.record, method, str(response.url), response.status, response.headers, body, 'aiohttp'
+        )
+        return CachedResponse(url=response.url, status=response.status, headers=response.headers, body=body, from_cache=False)
+
+
+    async def replay(self, url:str, method:str='GET', params:dict=None) -> CachedResponse:
+        """Requests the recorded response from the ReplayServer."""
+        url = replay_url(url, params)
+        async with self.session.request(method, self.server.endpoint, headers=self.server.headers_for(method, url)) as res:
+            body = await res.read()
+            headers = CIMultiDictProxy(CIMultiDict(res.headers))
+        return CachedResponse(url=URL(url), status=res.status, headers=headers, body=body, from_cache=False)
+
+
+class PlaywrightReplay:
+    """Route handler recording or replaying every request a BrowserContext makes.
+    Attached first, so it is the last handler to run: requests aborted by a
+    ResourceBlocker are neither recorded nor replayed.
+    """
+    def __init__(self, manager:ReplayManager):
+        self.manager = manager
+
+
+    async def handle(self, route:Route):
+        request = route.request
+        if self.manager.replaying:
+            server = self.manager.server
+            response = await route.fetch(
+                url=server.endpoint,
+                headers={**request.headers, **server.headers_for(request.method, request.url)},
+            )
+            await route.fulfill(response=response)
+            return
+
+        response = await route.fetch()
+        body = await response.body()
+        await asyncio.to_thread(
+            self.manager.archive.record, request.method, request.url, response.status, response.headers, body, 'playwright'
+        )
+        await route.fulfill(response=response, body=body)
+
+
+    async def attach(self, target:BrowserContext|Page):
+        await target.route("**/*", self.handle)
+        return
+
+
+replay_manager = ReplayManager()
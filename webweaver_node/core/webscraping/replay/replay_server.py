@@ -0,0 +1,73 @@
+import asyncio
+import logging
+
+from aiohttp import web
+
+from webweaver_node.core.config import REPLAY_HOST, REPLAY_PORT
+from webweaver_node.core.webscraping.replay.archive import ReplayArchive
+
+
+logger = logging.getLogger('scraping')
+
+# Request headers telling the ReplayServer which recorded request to answer.
+REPLAY_URL_HEADER = 'X-Replay-Url'
+REPLAY_METHOD_HEADER = 'X-Replay-Method'
+REPLAY_MISS_HEADER = 'X-Replay-Miss'
+
+
+class ReplayServer:
+    """Local stand-in for every site a recorded spider run visited. Both
+    transports send their requests here instead of the network, naming the
+    original request in the X-Replay-Url/X-Replay-Method headers, and get the
+    archived status, headers and body back. Requests that were never recorded
+    get a 404 with an X-Replay-Miss header.
+    """
+    def __init__(self, archive:ReplayArchive, host:str=REPLAY_HOST, port:int=REPLAY_PORT):
+        self.archive = archive
+        self.host = host
+        self.port = port
+        self.runner:web.AppRunner = None
+        self.hits = 0
+        self.misses = 0
+
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://{self.host}:{self.port}/replay"
+
+
+    def headers_for(self, method:str, url:str) -> dict[str, str]:
+        return {REPLAY_URL_HEADER: url, REPLAY_METHOD_HEADER: method.upper()}
+
+
+    async def handle(self, request:web.Request) -> web.Response:
+        url = request.headers.get(REPLAY_URL_HEADER)
+        method = request.headers.get(REPLAY_METHOD_HEADER, request.method)
+        entry = self.archive.lookup(method, url) if url else None
+        if entry is None:
+            self.misses += 1
+            logger.warning(f"ReplayServer: no recorded response for {method} {url}")
+            return web.Response(status=404, headers={REPLAY_MISS_HEADER: '1'})
+        self.hits += 1
+        body = await asyncio.to_thread(self.archive.read_body, entry)
+        return web.Response(status=entry.status, headers=entry.headers, body=body)
+
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_route('*', '/replay', self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+        self.port = self.runner.addresses[0][1]
+        logger.info(f"ReplayServer listening on {self.endpoint}")
+        return
+
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+            logger.info(f"ReplayServer stopped: {self.hits} responses replayed, {self.misses} misses")
+        return
@@ -0,0 +1,78 @@
+import aiohttp
+import logging
+
+from webweaver_node.core.config import (
+    AIOHTTP_CONNECTION_LIMIT,
+    AIOHTTP_CONNECTION_LIMIT_PER_HOST,
+    AIOHTTP_DNS_CACHE_TTL,
+    AIOHTTP_KEEPALIVE_TIMEOUT,
+)
+from webweaver_node.core.webscraping.metrics.metrics import metrics_trace_config
+
+
+logger = logging.getLogger('scraping')
+
+
+class SessionAPI:
+    """API to be passed to spiders so that each spider can borrow an 
+    aiohttp ClientSession backed by the pool's shared connector.
+    """
+    def __init__(self, session_pool:"SessionPool"):
+        self.session_pool = session_pool
+
+
+    def borrow_session(self) -> aiohttp.ClientSession:
+        """Returns a new ClientSession that shares the pool's connections."""
+        return self.session_pool.borrow_session()
+
+
+class SessionPool:
+    """Process-wide pool of HTTP connections shared by every spider in a scrape.
+
+    Each spider still gets its own ClientSession (so cookies are not shared between
+    spiders), but every session is built on the same TCPConnector. Connections are 
+    kept alive and reused across spiders, DNS lookups are cached, and the number of 
+    open connections is capped both overall and per host.
+    """
+    def __init__(self):
+        self.connector:aiohttp.TCPConnector = None
+        self.session_api = SessionAPI(self)
+
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """The connector is created lazily because it must be created 
+        inside a running event loop.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=AIOHTTP_CONNECTION_LIMIT,
+            limit_per_host=AIOHTTP_CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=AIOHTTP_DNS_CACHE_TTL,
+            use_dns_cache=True,
+            keepalive_timeout=AIOHTTP_KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True,
+        )
+        logger.debug("initialized SessionPool TCPConnector")
+        return connector
+
+
+    def borrow_session(self) -> aiohttp.ClientSession:
+        """Create a ClientSession on top of the shared connector. Closing the
+        session does not close the connector, so spiders can close their 
+        session as usual when they finish.
+        """
+        if self.connector is None or self.connector.closed:
+            self.connector = self._create_connector()
+        return aiohttp.ClientSession(
+            connector=self.connector, 
+            connector_owner=False, 
+            trace_configs=[metrics_trace_config()],
+        )
+
+
+    async def close(self):
+        """Closes the shared connector and every pooled connection."""
+        if self.connector is not None and not self.connector.closed:
+            await self.connector.close()
+            logger.debug("SessionPool closed")
+        self.connector = None
+        return
@@ -3,13 +3,39 @@ import asyncio
 import logging
 import os
 import time
-from typing import TYPE_CHECKING
+from typing import AsyncIterator, TYPE_CHECKING
+from yarl import URL
 
 from webweaver_node.core.common.enums import LogLevel
+from webweaver_node.core.config import STREAM_PARSE_CHUNK_SIZE
+from webweaver_node.core.exceptions import DownloadTooLarge, SpiderRetryBudgetExceeded
+from webweaver_node.core.webscraping.metrics.metrics import (
+    bytes_transferred,
+    http_fetch_seconds,
+    http_responses,
+    http_retries,
+    metrics_trace_config,
+)
+from webweaver_node.core.webscraping.middleware.spider_request import SpiderRequest
+from webweaver_node.core.webscraping.replay.replay_manager import replay_manager
+from webweaver_node.core.webscraping.spiders.downloads import Download, Downloader
+from webweaver_node.core.webscraping.spiders.http_cache import CachedResponse, cache_key, http_cache
+from webweaver_node.core.webscraping.spiders.lxml_soup import LxmlTag
+from webweaver_node.core.webscraping.spiders.rate_limiter import domain_rate_limiter
+from webweaver_node.core.webscraping.spiders.retry import RetryBudget, RetryPolicy
+from webweaver_node.core.webscraping.spiders.stream_parser import StreamParser
 
 logger = logging.getLogger('scrapings')
 
 
+RETRYABLE_ERRORS = (
+    aiohttp.ClientConnectionError, 
+    aiohttp.ClientHttpProxyError, 
+    aiohttp.ClientPayloadError, 
+    ConnectionResetError,
+)
+
+
 if TYPE_CHECKING:
     from webweaver_node.core.webscraping.spiders.spider_base import Spider
     from webweaver_node.core.webscraping.spiders.soup_base import SpiderTag
@@ -19,7 +45,31 @@ class AiohttpAPI:
 
     def __init__(self, spider:"Spider"):
         self.spider = spider
-        self.session = aiohttp.ClientSession()
+        self.spider_name = self.spider.spider_asset.spider_name
+        self.session = self._session()
+        self.retry_policy = RetryPolicy()
+        self.retry_budget = RetryBudget(self.spider.retry_budget)
+        self.downloader = Downloader(self)
+        self.http_cache = http_cache if http_cache.enabled and self.spider.use_cache else None
+
+
+    def _session(self) -> aiohttp.ClientSession:
+        """Borrow a session from the SessionPool so connections are reused across 
+        spiders. Spiders created without a SessionAPI (ie: test environments)
+        get a standalone session.
+        """
+        if self.spider.session_api is not None:
+            return self.spider.session_api.borrow_session()
+        return aiohttp.ClientSession(trace_configs=[metrics_trace_config()])
+
+
+    def record_streamed_bytes(self, response:aiohttp.ClientResponse | CachedResponse, size:int):
+        """Streamed bodies are not seen by the metrics trace config, so whatever 
+        streams one counts its bytes here. Bodies served from disk are not counted.
+        """
+        if isinstance(response, aiohttp.ClientResponse):
+            bytes_transferred.inc(size, spider_name=self.spider_name, transport='aiohttp')
+        return
 
 
     async def test_scrape(self, url:str, outfile_name:str=None):
@@ -46,32 +96,85 @@ class AiohttpAPI:
             logger.info('Did not save file due to non 200 status code')
 
 
+    async def stream_select(self, url:str, selector:str, use_proxy:bool=True) -> AsyncIterator[LxmlTag]:
+        """Yields each element matching the selector while the page is still 
+        downloading, using a StreamParser. Memory use stays flat on multi-MB 
+        listing pages since the full markup and tree are never held at once.
+
+            async for product in self.aio.stream_select(url, "div.product"):
+                yield {"name": product.select_one_text("h2")}
+
+        The HttpCache is bypassed, since caching the page would mean reading it 
+        into memory whole.
+
+        *NOTE This method makes an HTTP request.
+        """
+        response = await self.get(url, use_proxy=use_proxy, use_cache=False)
+        try:
+            if response.status != 200:
+                logger.warning(f"{self.spider.spider_asset.spider_name} stream_select({url}) returned status {response.status}")
+                return
+            parser = StreamParser(selector, encoding=response.charset)
+            async for chunk in response.content.iter_chunked(STREAM_PARSE_CHUNK_SIZE):
+                self.record_streamed_bytes(response, len(chunk))
+                for element in parser.feed(chunk):
+                    yield element
+            for element in parser.close():
+                yield element
+        finally:
+            response.release()
+
+
+    async def download(self, url:str, use_proxy:bool=True, max_size:int=None) -> Download | None:
+        """Stream a binary (image, PDF...) to a spooled temporary file.
+        See Downloader.download()
+
+        *NOTE This method makes an HTTP request.
+        """
+        return await self.downloader.download(url, use_proxy=use_proxy, max_size=max_size)
+
+
+    async def download_many(self, urls:list[str], use_proxy:bool=True, max_size:int=None) -> list[Download | None | BaseException]:
+        """Download many binaries concurrently. See Downloader.download_many()
+
+        *NOTE This method makes HTTP requests.
+        """
+        return await self.downloader.download_many(urls, use_proxy=use_proxy, max_size=max_size)
+
+
     async def scrape_image(self, image_element:"SpiderTag", use_proxy:bool=True, src_attribute:str='src', raise_exc:bool=True) -> bytes | None:
-        """Scrape the binary data tha represents the product image
+        """Scrape the binary data tha represents the product image.
+        Returns None if the image could not be downloaded or is too large.
         
         *NOTE This method makes an HTTP request.
         """
         image_src_url = self.spider.clean_url(image_element.get(src_attribute), raise_exc)
         if image_src_url:
-            response = await self.get(image_src_url, use_proxy=use_proxy)
-            if response.status == 200:
-                return await response.read()
+            return await self._download_bytes(image_src_url, use_proxy)
 
 
     async def scrape_image_url(self, url:str, use_proxy:bool=True, raise_exc:bool=True) -> bytes | None:
-        """Scrape the binary data tha represents the product image
+        """Scrape the binary data tha represents the product image.
+        Returns None if the image could not be downloaded or is too large.
         
         *NOTE This method makes an HTTP request.
         """
         url = self.spider.clean_url(url, raise_exc)
-        response = await self.get(url, use_proxy=use_proxy)
-        if response.status == 200:
-            image_chunks = []
-            async for chunk in response.content.iter_chunked(1024):  # Adjust chunk size as needed
-                image_chunks.append(chunk)
-            image = b''.join(image_chunks)
-            return image
-            # return await response.read()
+        return await self._download_bytes(url, use_proxy)
+
+
+    async def _download_bytes(self, url:str, use_proxy:bool) -> bytes | None:
+        try:
+            download = await self.download(url, use_proxy=use_proxy)
+        except DownloadTooLarge as e:
+            logger.warning(f"Skipping download: {e}")
+            return None
+        if download is None:
+            return None
+        try:
+            return download.read()
+        finally:
+            download.close()
 
 
     async def get_or_error(self, url:str, use_proxy:bool=True, **kwargs) -> aiohttp.ClientResponse:
@@ -81,65 +184,155 @@ class AiohttpAPI:
         return res
 
 
-    async def get(self, url:str, use_proxy:bool=True, **kwargs) -> aiohttp.ClientResponse:
+    async def get(self, url:str, use_proxy:bool=True, use_cache:bool=True, **kwargs) -> aiohttp.ClientResponse | CachedResponse:
         """Sends an HTTP request using aiohttp's session.get() method.
         The difference is this function will automatically use the proxy and
         will also automatically randomize the headers (well, the UA of the headers).
+
+        The request goes through the spider's middleware chain, the same one as
+        PlaywrightNavigation.goto(): request middlewares (ie: the HttpCacheMiddleware
+        and the RateLimitMiddleware) may answer or delay it before it is sent, and
+        response middlewares run on whatever comes back.
+
+        When the HttpCache is on, cached pages are served from disk or revalidated 
+        with a conditional GET, and the response is a CachedResponse. Callers that 
+        stream the body pass use_cache=False, so it is never read into memory whole.
+
+        When REPLAY_MODE is record, every response is archived by the ReplayManager.
+        When it is replay, nothing goes out to the network: the recorded response
+        is served by the local ReplayServer.
+        """
+        request = SpiderRequest(
+            url=url, 
+            transport='aiohttp', 
+            spider_name=self.spider_name, 
+            params=kwargs.get('params'),
+            use_cache=use_cache,
+        )
+
+        async def _send(request:SpiderRequest) -> aiohttp.ClientResponse | CachedResponse:
+            if replay_manager.replaying:
+                return await replay_manager.replay(request.url, params=request.params)
+            if self.http_cache is None or not request.use_cache:
+                res = await self._get(request.url, use_proxy, **kwargs)
+            else:
+                res = await self._get_cached(request, use_proxy, **kwargs)
+            if replay_manager.recording:
+                return await replay_manager.record(res)
+            return res
+
+        return await self.spider.spider_api.execute(request, _send)
+
+
+    async def _get_cached(self, request:SpiderRequest, use_proxy:bool=True, **kwargs) -> aiohttp.ClientResponse | CachedResponse:
+        """Serves the URL from the HttpCache if the entry is still fresh. Otherwise
+        requests it with If-None-Match/If-Modified-Since so an unchanged page comes
+        back as a 304, and stores cacheable 200 responses.
+
+        Entries already looked up by the HttpCacheMiddleware are not looked up again.
+        An entry evicted between its lookup and reading its body counts as a miss.
         """
-        if use_proxy:
-            proxy_retry_base_time = 2
-            max_wait_time = 60
-            # max_wait_time = 3
-            retry_count = 0
-            while True:
-                try:
-                    proxy = await self.spider.get_proxy(stateful=False)
+        cache = self.http_cache
+        url = request.url
+        key = cache_key(url, request.params)
+        if 'cache_entry' in request.meta:
+            entry = request.meta['cache_entry']
+        else:
+            entry = await cache.lookup(key)
+        if entry is not None and cache.should_serve(entry, self.spider.cache_ttl):
+            body = await cache.hit(entry)
+            if body is not None:
+                return CachedResponse.from_entry(entry, body)
+            entry = None  # evicted since the lookup
+
+        headers = kwargs.get('headers', {})
+        if entry is not None:
+            kwargs['headers'] = {**headers, **entry.conditional_headers()}
+        res = await self._get(url, use_proxy, **kwargs)
+        if res.status == 304 and entry is not None:
+            res.release()
+            body = await cache.revalidated(entry)
+            if body is not None:
+                return CachedResponse.from_entry(entry, body)
+            kwargs['headers'] = headers
+            res = await self._get(url, use_proxy, **kwargs)
+        cache.stats.misses += 1
+        if not cache.is_cacheable(res.status, res.headers, res.content_length):
+            return res
+        body = await res.read()
+        res.release()
+        entry = await cache.store(key, str(res.url), res.status, res.headers, body)
+        if entry is None:
+            return CachedResponse(url=res.url, status=res.status, headers=res.headers, body=body, from_cache=False)
+        return CachedResponse.from_entry(entry, body)
+
+
+    async def _get(self, url:str, use_proxy:bool=True, **kwargs) -> aiohttp.ClientResponse:
+        """Connection errors are retried with an async backoff so the event loop keeps 
+        running other spiders while this one waits. Proxy failures also count against 
+        the endpoint's circuit breaker, which pauses only the traffic to that endpoint,
+        and every response and failure is fed into the endpoint's health.
+
+        Successful responses raise the domain's rate in the DomainRateLimiter. The 
+        first attempt's token is taken by the RateLimitMiddleware before the request 
+        gets here, every retry waits for a token of its own, and throttled responses
+        are handled by the StatusCodeMiddleware.
+        """
+        domain = URL(url).host
+        kwargs.setdefault('trace_request_ctx', {'spider_name': self.spider_name})
+        attempt = 0
+        while True:
+            proxy = await self.spider.get_proxy(stateful=False) if use_proxy else None
+            try:
+                if proxy is not None:
+                    await proxy.wait_until_available()
+                if attempt > 0:
+                    await domain_rate_limiter.acquire(domain)
+                start = time.perf_counter()
+                if proxy is not None:
                     res = await self.session.get(
                         url=url,
                         proxy = proxy.full_endpoint,
-                        headers = self.spider.random_headers(),
-                        **kwargs
+                        headers = {**self.spider.random_headers(), **kwargs.get('headers', {})},
+                        **{key: value for key, value in kwargs.items() if key != 'headers'}
                     )
-                except aiohttp.ClientConnectionError as error:
-                    msg = f"{error.__class__.__name__}: '{self.spider.spider_asset.spider_name}' URL: '{url}'  RETRYING..."
-                    self.spider.log(
-                        e = error,
-                        level = LogLevel.WARNING,
-                        msg = msg
-                    )
-                    retry_count += 1
-                    exponential_backoff = proxy_retry_base_time * (2 ** retry_count)
-                    if exponential_backoff > max_wait_time:
-                        self.spider.log(e=error)
-                        raise error
-                    else:
-                        logger.info(msg)
-                        logger.info(f"Retrying in {exponential_backoff} seconds...")
-                        await asyncio.sleep(exponential_backoff) 
-                    continue
-
-                except (aiohttp.ClientHttpProxyError, aiohttp.ClientPayloadError, ConnectionResetError) as error:
-                    self.spider.log(
-                        e = error,
-                        level = LogLevel.WARNING,
-                        msg = f"{error.__class__.__name__} '{self.spider.spider_asset.spider_name}' URL: '{url} Retrying..."
-                    )
-                    retry_count += 1
-                    exponential_backoff = proxy_retry_base_time * (2 ** retry_count)
-                    if exponential_backoff > max_wait_time:
-                        self.spider.log(e=error)
-                        raise error
-                    else:
-                        time.sleep(exponential_backoff) #synchronous otherwise other connections will keep trying.
-                    continue
-
-                else: 
-                    break
+                else:
+                    res = await self.session.get(url=url, **kwargs)
 
-        else:
-            res = await self.session.get(url=url, **kwargs)
-        return res
+            except RETRYABLE_ERRORS as error:
+                if proxy is not None:
+                    proxy.record_failure()
+                attempt += 1
+                delay = self.retry_policy.delay(attempt)
+                if delay is None:
+                    self.spider.log(e=error)
+                    raise error
+                if not self.retry_budget.spend():
+                    msg = f"'{self.spider.spider_asset.spider_name}' used all {self.retry_budget.max_retries} retries. URL: '{url}'"
+                    self.spider.log(e=SpiderRetryBudgetExceeded(msg))
+                    raise SpiderRetryBudgetExceeded(msg) from error
+                msg = f"{error.__class__.__name__}: '{self.spider.spider_asset.spider_name}' URL: '{url}'  RETRYING..."
+                self.spider.log(
+                    e = error,
+                    level = LogLevel.WARNING,
+                    msg = msg
+                )
+                http_retries.inc(spider_name=self.spider_name, domain=domain)
+                logger.info(f"Retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
+                continue
+
+            latency = time.perf_counter() - start
+            http_fetch_seconds.observe(latency, spider_name=self.spider_name, domain=domain)
+            http_responses.inc(spider_name=self.spider_name, transport='aiohttp', status=res.status)
+            if res.status < 400:
+                domain_rate_limiter.record_success(domain)
+            if proxy is not None:
+                proxy.record_response(res.status, latency)
+            return res
 
 
     async def close_session(self):
-        await self.session.close()
+        """Closes the spider's session. Pooled connections stay open for other spiders."""
+        if not self.session.closed:
+            await self.session.close()
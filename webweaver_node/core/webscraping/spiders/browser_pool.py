@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from playwright.async_api._generated import (
+    Playwright as AsyncPlaywright, 
+    Browser,
+)
+
+from webweaver_node.core.config import BROWSER_POOL_SIZE
+
+
+logger = logging.getLogger('scraping')
+
+
+class BrowserPool:
+    """Keeps a fixed number of warm browsers per engine, shared by every Playwright
+    spider in a scrape. Spiders no longer launch their own browser; they borrow one
+    from the pool and isolate themselves with their own BrowserContexts.
+
+    Browsers for an engine are launched the first time a spider asks for that 
+    engine, and are torn down by the SpiderLauncher at the end of the run.
+    """
+    def __init__(self, p:AsyncPlaywright, size:int=BROWSER_POOL_SIZE):
+        self.p = p
+        self.size = size
+        self.browsers:dict[tuple[str, bool], list[Browser]] = {}
+        self.lock = asyncio.Lock()
+
+
+    async def _launch(self, engine:str, headless:bool) -> Browser:
+        match engine:
+            case 'firefox':
+                return await self.p.firefox.launch(headless=headless)
+            case 'webkit':  # requires more libraries
+                return await self.p.webkit.launch(headless=headless)
+            case _:
+                return await self.p.chromium.launch(headless=headless)
+
+
+    async def _warm(self, engine:str, headless:bool) -> list[Browser]:
+        """Launches the pool's browsers for this engine, if not already running."""
+        key = (engine, headless)
+        async with self.lock:
+            browsers = self.browsers.get(key)
+            if browsers is None:
+                browsers = list(await asyncio.gather(*[self._launch(engine, headless) for _ in range(self.size)]))
+                self.browsers[key] = browsers
+                logger.debug(f"BrowserPool launched {self.size} {engine} browsers")
+            for i, browser in enumerate(browsers):
+                if not browser.is_connected():
+                    logger.warning(f"BrowserPool {engine} browser disconnected, relaunching")
+                    browsers[i] = await self._launch(engine, headless)
+        return browsers
+
+
+    async def acquire(self, engine:str='chromium', headless:bool=True) -> Browser:
+        """Returns the pooled browser with the fewest open contexts."""
+        browsers = await self._warm(engine, headless)
+        return min(browsers, key=lambda browser: len(browser.contexts))
+
+
+    async def close(self):
+        """Closes every browser in the pool."""
+        async with self.lock:
+            for browsers in self.browsers.values():
+                for browser in browsers:
+                    if browser.is_connected():
+                        await browser.close()
+            self.browsers = {}
+        logger.debug("BrowserPool closed")
+        return
@@ -2,7 +2,7 @@ from asyncio import sleep as async_sleep
 import logging
 import math
 import random
-from playwright.async_api import Page, ElementHandle
+from playwright.async_api import BrowserContext, Page, ElementHandle
 from webweaver_node.core.common.constants import VIEWPORTS, PLUGINS
 
 
@@ -113,86 +113,102 @@ class Scroll:
 
 
 class PageConfig:
+    """Fingerprint configuration for new pages. All the init scripts are composed
+    into a single script, which is applied once per BrowserContext (and so runs in
+    every page of that context) rather than once per page.
+    """
+
+    HIDE_WEBDRIVER = """
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => false 
+        });
+    """
+    WINDOW_HISTORY_LENGTH = """
+        Object.defineProperty(window.history, 'length', {
+            get: () => Math.floor(Math.random() * 10) + 3
+        });
+    """
+    LANGUAGES = """
+        Object.defineProperty(navigator, 'languages', {
+           get: () => [ "en-US", "en" ]                         
+        });
+        Object.defineProperty(navigator, 'language', {
+           get: () => "en-US"                         
+        });
+    """
+    PLATFORM = """
+        Object.defineProperty(navigator, 'platform', {
+           get: () => 'Win32'                      
+        });
+    """
+    PLUGINS_SCRIPT = """
+        Object.defineProperty(navigator, 'plugins', {
+            get: () => (""" + f"{PLUGINS}" + """)
+        });
+    """
+    INIT_SCRIPT = HIDE_WEBDRIVER + WINDOW_HISTORY_LENGTH + LANGUAGES + PLATFORM
+
+    DIAGNOSTICS = """() => ({
+        'navigator.webdriver': navigator.webdriver,
+        'navigator.platform': navigator.platform,
+        'navigator.language': navigator.language,
+        'navigator.languages': navigator.languages,
+        'navigator.userAgent': navigator.userAgent,
+        'navigator.plugins': Array.from(navigator.plugins).map(p => p.name),
+        'navigator.hardwareConcurrency': navigator.hardwareConcurrency,
+        'window.screen.width': window.screen.width,
+        'window.screen.height': window.screen.height,
+        'window.screen.availWidth': window.screen.availWidth,
+        'window.screen.availHeight': window.screen.availHeight,
+        'window.screen.colorDepth': window.screen.colorDepth,
+        'window.outerWidth': window.outerWidth,
+        'window.outerHeight': window.outerHeight,
+        'window.devicePixelRatio': window.devicePixelRatio,
+        'document.hidden': document.hidden,
+        'window.history.length': window.history.length,
+        'document.hasFocus()': document.hasFocus(),
+        'window.chrome': !!window.chrome,
+    })"""
 
     def __init__(self, page:Page):
         self.page = page
 
-    async def get_config(self):
+    async def get_config(self) -> dict:
         """Get all DOM configuration variables that could 
-        potentially be used to detect webscraping.
+        potentially be used to detect webscraping, in a single
+        round-trip to the browser.
 
         #TODO How to fake the pluginArray?
         """
-        webdriver               = await self.page.evaluate('navigator.webdriver')
-        platform                = await self.page.evaluate('navigator.platform')
-        language                = await self.page.evaluate('navigator.language')
-        languages               = await self.page.evaluate('navigator.languages')
-        user_agent              = await self.page.evaluate('navigator.userAgent')
-        plugins                 = await self.page.evaluate('navigator.plugins')
-        hardware_concurrency    = await self.page.evaluate('navigator.hardwareConcurrency')
-        screen_width            = await self.page.evaluate('window.screen.width')
-        screen_height           = await self.page.evaluate('window.screen.height')
-        avail_screen_width      = await self.page.evaluate('window.screen.availWidth')
-        avail_screen_height     = await self.page.evaluate('window.screen.availHeight')
-        color_depth             = await self.page.evaluate('window.screen.colorDepth')
-        window_outer_width      = await self.page.evaluate('window.outerWidth')
-        window_outer_height     = await self.page.evaluate('window.outerHeight')
-        pixel_ratio             = await self.page.evaluate('window.devicePixelRatio')
-        document_hidden         = await self.page.evaluate('document.hidden')
-        window_history_length   = await self.page.evaluate('window.history.length')
-        has_focus               = await self.page.evaluate('document.hasFocus()')
-        # web_gl_rendering_context = await self.page.evaluate('window.WebGLRenderingContext')
-        chrome = await self.page.evaluate('window.chrome')
-
-        logger.debug(f'navigator.webdriver:             {webdriver}')
-        logger.debug(f'navigator.platform:              {platform}')
-        logger.debug(f'navigator.language:              {language}')
-        logger.debug(f'navigator.languages:             {languages}')
-        logger.debug(f'navigator.userAgent:             {user_agent}')
-        logger.debug(f'navigator.plugins:               {plugins}')
-        logger.debug(f'navigator.hardwareConcurrency:   {hardware_concurrency}')
-        logger.debug(f'window.screen.width:             {screen_width}')
-        logger.debug(f'window.screen.height:            {screen_height}')
-        logger.debug(f'window.screen.availWidth:        {avail_screen_width}')
-        logger.debug(f'window.screen.availHeight:       {avail_screen_height}')
-        logger.debug(f'window.screen.colorDepth:        {color_depth}')
-        logger.debug(f'window.outerWidth:               {window_outer_width}')
-        logger.debug(f'window.outerHeight:              {window_outer_height}')
-        logger.debug(f'window.devicePixelRatio:         {pixel_ratio}')
-        logger.debug(f'document.hidden:                 {document_hidden}')
-        logger.debug(f'window.history.length:           {window_history_length}')
-        logger.debug(f'document.hasFocus():             {has_focus}')
-        logger.debug(f'window.chrome:                   {chrome}')
-        # print('window.WebGLRenderingContext: ', web_gl_rendering_context)
+        config = await self.page.evaluate(self.DIAGNOSTICS)
+        for name, value in config.items():
+            logger.debug(f'{name + ":":<33}{value}')
+        return config
 
 
+    @staticmethod
+    def random_viewport() -> dict:
+        """Returns the viewport of a standard desktop computer."""
+        viewport = random.choice(VIEWPORTS)
+        return {"width": viewport[0], "height": viewport[1]}
 
-    async def set_page_config(self):
-        """Set various config settings for a new SpiderPage object."""
-        await self._set_viewport()
-        await self._hide_webdriver()
-        await self._set_window_history_length()
-        await self._set_languages()
-        await self._set_platform()
 
+    @classmethod
+    async def set_context_config(cls, context:BrowserContext):
+        """Applies the composed init script to every page in the BrowserContext.
+        The viewport is set when the context is created, see PageConfig.random_viewport()
+        """
+        await context.add_init_script(cls.INIT_SCRIPT)
         return
-    
 
-    async def _set_platform(self):
-        await self.page.add_init_script("""
-            Object.defineProperty(navigator, 'platform', {
-               get: () => 'Win32'                      
-            });
-        """)
 
-
-    async def _set_window_history_length(self):
-        """Sets the window.history.length property to something greater than 1"""
-        await self.page.add_init_script("""
-            Object.defineProperty(window.history, 'length', {
-                get: () => Math.floor(Math.random() * 10) + 3
-            });
-        """)
+    async def set_page_config(self):
+        """Set various config settings for a new SpiderPage object. Only needed
+        for pages that are not created from a configured BrowserContext.
+        """
+        await self._set_viewport()
+        await self.page.add_init_script(self.INIT_SCRIPT)
+        return
 
 
     async def _get_plugins(self) -> str:
@@ -220,35 +236,9 @@ class PageConfig:
         """Sets the navigator.plugins value. Now in headless mode plugins
         will actually show up.
         """
-        await self.page.add_init_script("""
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => (""" + f"{PLUGINS}" + """)
-            });"""
-        )
+        await self.page.add_init_script(self.PLUGINS_SCRIPT)
 
     async def _set_viewport(self):
         """Sets the page's viewport to that of a standard desktop computer."""
-        viewport = random.choice(VIEWPORTS)
-        await self.page.set_viewport_size({"width": viewport[0], "height": viewport[1]})
+        await self.page.set_viewport_size(self.random_viewport())
         return
-
-
-    async def _set_languages(self):
-        """Sets the navigator.language and navigator.languages values"""
-        await self.page.add_init_script("""
-            Object.defineProperty(navigator, 'languages', {
-               get: () => [ "en-US", "en" ]                         
-            });
-            Object.defineProperty(navigator, 'language', {
-               get: () => "en-US"                         
-            });
-        """)
-
-    async def _hide_webdriver(self):
-        """Sets the 'navigator.webdriver' property from true to false"""
-        await self.page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => false 
-            });
-        """)
-
@@ -0,0 +1,124 @@
+import asyncio
+from dataclasses import dataclass
+import hashlib
+import shutil
+from tempfile import SpooledTemporaryFile
+from typing import TYPE_CHECKING
+
+from webweaver_node.core.config import (
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_MAX_SIZE,
+    DOWNLOAD_SPOOL_SIZE,
+    DOWNLOAD_CONCURRENCY,
+)
+from webweaver_node.core.exceptions import DownloadTooLarge
+
+if TYPE_CHECKING:
+    from webweaver_node.core.webscraping.spiders.aiohttp_api import AiohttpAPI
+
+
+@dataclass
+class Download:
+    """A completed download. The body is held in a spooled temporary file: it stays
+    in memory while small and rolls over to disk once it grows past DOWNLOAD_SPOOL_SIZE.
+    """
+    url: str
+    size: int
+    sha256: str
+    content_type: str | None
+    file: SpooledTemporaryFile
+
+    def read(self) -> bytes:
+        """Returns the whole body as bytes."""
+        self.file.seek(0)
+        return self.file.read()
+
+    def save(self, path:str):
+        """Copies the body to a file without loading it all into memory."""
+        self.file.seek(0)
+        with open(path, 'wb') as f:
+            shutil.copyfileobj(self.file, f)
+        return
+
+    def close(self):
+        self.file.close()
+
+
+class Downloader:
+    """Streams images and other binaries to a spooled temporary file in
+    DOWNLOAD_CHUNK_SIZE chunks, hashing the content as it arrives and aborting 
+    once the body goes past the size cap. The number of concurrent downloads 
+    is limited per spider.
+    """
+    def __init__(
+            self,
+            aio:"AiohttpAPI",
+            max_concurrent:int=DOWNLOAD_CONCURRENCY,
+            chunk_size:int=DOWNLOAD_CHUNK_SIZE,
+            max_size:int=DOWNLOAD_MAX_SIZE,
+            spool_size:int=DOWNLOAD_SPOOL_SIZE,
+    ):
+        self.aio = aio
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.chunk_size = chunk_size
+        self.max_size = max_size
+        self.spool_size = spool_size
+
+
+    def _too_large(self, url:str, size:int, max_size:int) -> DownloadTooLarge:
+        return DownloadTooLarge(f"'{url}' is larger than {max_size} bytes ({size} bytes)")
+
+
+    async def download(self, url:str, use_proxy:bool=True, max_size:int=None) -> Download | None:
+        """Downloads the URL. Returns None if the response status is not 200 and 
+        raises DownloadTooLarge if the body is bigger than max_size.
+
+        *NOTE This method makes an HTTP request.
+        """
+        max_size = max_size or self.max_size
+        async with self.semaphore:
+            response = await self.aio.get(url, use_proxy=use_proxy, use_cache=False)  # streamed with a size cap
+            try:
+                if response.status != 200:
+                    return None
+                if response.content_length and response.content_length > max_size:
+                    raise self._too_large(url, response.content_length, max_size)
+                spool = SpooledTemporaryFile(max_size=self.spool_size)
+                digest = hashlib.sha256()
+                size = 0
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    size += len(chunk)
+                    if size > max_size:
+                        spool.close()
+                        raise self._too_large(url, size, max_size)
+                    digest.update(chunk)
+                    spool.write(chunk)
+                self.aio.record_streamed_bytes(response, size)
+                spool.seek(0)
+                return Download(
+                    url=url,
+                    size=size,
+                    sha256=digest.hexdigest(),
+                    content_type=response.content_type,
+                    file=spool,
+                )
+            finally:
+                response.release()
+
+
+    async def download_many(
+            self, 
+            urls:list[str], 
+            use_proxy:bool=True, 
+            max_size:int=None,
+    ) -> list[Download | None | BaseException]:
+        """Downloads the URLs concurrently, up to the spider's download limit. 
+        Failed downloads are returned as their exception, in the same position
+        as their URL.
+
+        *NOTE This method makes HTTP requests.
+        """
+        return await asyncio.gather(
+            *[self.download(url, use_proxy=use_proxy, max_size=max_size) for url in urls],
+            return_exceptions=True,
+        )
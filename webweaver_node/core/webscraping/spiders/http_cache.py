@@ -0,0 +1,423 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import AsyncIterator
+
+from multidict import CIMultiDict, CIMultiDictProxy
+from playwright.async_api import BrowserContext, Page, Route
+from yarl import URL
+
+from webweaver_node.core.common.enums import CacheMode
+from webweaver_node.core.config import (
+    HTTP_CACHE_DIR,
+    HTTP_CACHE_MODE,
+    HTTP_CACHE_MAX_SIZE,
+    HTTP_CACHE_MAX_ENTRY_SIZE,
+    HTTP_CACHE_TTL,
+    HTTP_CACHE_CONTENT_TYPES,
+)
+
+
+logger = logging.getLogger('scraping')
+
+# Headers describing the wire format. Cached bodies are stored decoded, so
+# these are dropped before an entry is stored and served again.
+HOP_BY_HOP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive'}
+
+
+def cache_key(url:str, params:dict=None) -> str:
+    if params:
+        url = str(URL(url).update_query(params))
+    return hashlib.sha256(f"GET {url}".encode()).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """Metadata for one cached response. The body is stored next to it in {key}.body"""
+    key: str
+    url: str
+    status: int
+    headers: list[tuple[str, str]]
+    stored_at: float
+    size: int
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self, ttl:float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that turn the next request for this URL into a conditional GET."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    stored: int = 0
+    evicted: int = 0
+    bytes_saved: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits} hits, {self.revalidated} revalidated (304), {self.misses} misses, "
+            f"{self.evicted} evicted, ~{self.bytes_saved / (1024 * 1024):.1f} MB not downloaded"
+        )
+
+
+class CachedContent:
+    """Stands in for aiohttp's StreamReader on a CachedResponse."""
+    def __init__(self, body:bytes):
+        self.body = body
+        self.position = 0
+
+    async def read(self, n:int=-1) -> bytes:
+        end = len(self.body) if n < 0 else self.position + n
+        chunk = self.body[self.position:end]
+        self.position += len(chunk)
+        return chunk
+
+    async def iter_chunked(self, n:int) -> AsyncIterator[bytes]:
+        while self.position < len(self.body):
+            yield await self.read(n)
+
+
+@dataclass
+class CachedResponse:
+    """The parts of aiohttp.ClientResponse spiders use, served from the HttpCache."""
+    url: URL
+    status: int
+    headers: CIMultiDictProxy
+    body: bytes
+    content: CachedContent = field(init=False)
+    from_cache: bool = True
+
+    def __post_init__(self):
+        self.content = CachedContent(self.body)
+
+    @classmethod
+    def from_entry(cls, entry:CacheEntry, body:bytes) -> "CachedResponse":
+        return cls(
+            url=URL(entry.url),
+            status=entry.status,
+            headers=CIMultiDictProxy(CIMultiDict(entry.headers)),
+            body=body,
+        )
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get('Content-Type', 'application/octet-stream').split(';')[0].strip()
+
+    @property
+    def charset(self) -> str | None:
+        for param in self.headers.get('Content-Type', '').split(';')[1:]:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'charset':
+                return value.strip().strip('"')
+        return None
+
+    @property
+    def content_length(self) -> int:
+        return len(self.body)
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def text(self, encoding:str=None, errors:str='strict') -> str:
+        return self.body.decode(encoding or self.charset or 'utf-8', errors=errors)
+
+    async def json(self, **kwargs):
+        return json.loads(await self.text())
+
+    def release(self):
+        return
+
+    def close(self):
+        return
+
+
+class HttpCache:
+    """On-disk HTTP cache shared by every spider in the process. Each entry is a
+    JSON metadata file plus the decoded body, keyed by a hash of the URL.
+
+    In REVALIDATE mode, an entry younger than the TTL is served as is, and an
+    older one is revalidated with If-None-Match/If-Modified-Since, so unchanged
+    pages come back as a bodiless 304. In OFFLINE mode any cached entry is served
+    without touching the network, for development runs. Cache misses always go
+    to the network. Once the cache grows past max_size the least recently used
+    entries are deleted.
+
+    File I/O runs in asyncio.to_thread() workers, several at once, so every 
+    access to the LRU index and total_size goes through index_lock.
+    """
+    def __init__(
+            self,
+            directory:str=HTTP_CACHE_DIR,
+            mode:CacheMode=CacheMode(HTTP_CACHE_MODE),
+            max_size:int=HTTP_CACHE_MAX_SIZE,
+            max_entry_size:int=HTTP_CACHE_MAX_ENTRY_SIZE,
+            ttl:float=HTTP_CACHE_TTL,
+    ):
+        self.directory = directory
+        self.mode = mode
+        self.max_size = max_size
+        self.max_entry_size = max_entry_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self.index:OrderedDict[str, int] = None  # key -> body size, least recently used first
+        self.total_size = 0
+        self.index_lock = threading.Lock()
+
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != CacheMode.OFF
+
+
+    def _path(self, key:str, suffix:str) -> str:
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+
+    def _ensure_index(self):
+        """Loads the index on first use. Must be called with index_lock held."""
+        if self.index is None:
+            self._load_index()
+        return
+
+
+    def _load_index(self):
+        """Builds the LRU index from the cache directory, oldest access first."""
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.body'):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, name[:-len('.body')], stat.st_size))
+        self.index = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self.total_size = sum(self.index.values())
+        return
+
+
+    def _touch(self, key:str):
+        """Marks the entry as most recently used."""
+        with self.index_lock:
+            self._ensure_index()
+            if key not in self.index:
+                return
+            self.index.move_to_end(key)
+            try:
+                os.utime(self._path(key, 'body'))
+            except FileNotFoundError:
+                pass
+        return
+
+
+    def _write_atomic(self, path:str, data:bytes):
+        """Writes via a temp file so a reader in another process never sees half an entry."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return
+
+
+    def _lookup(self, key:str) -> CacheEntry | None:
+        with self.index_lock:
+            self._ensure_index()
+        try:
+            with open(self._path(key, 'json'), 'r') as f:
+                entry = CacheEntry(**json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError, TypeError):
+            return None
+        if not os.path.exists(self._path(key, 'body')):
+            return None
+        return entry
+
+
+    def _read_body(self, entry:CacheEntry) -> bytes | None:
+        try:
+            with open(self._path(entry.key, 'body'), 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            return None
+        self._touch(entry.key)
+        return body
+
+
+    def _store(self, entry:CacheEntry, body:bytes):
+        with self.index_lock:
+            self._ensure_index()
+        self._write_atomic(self._path(entry.key, 'body'), body)
+        self._write_atomic(self._path(entry.key, 'json'), json.dumps(asdict(entry)).encode())
+        with self.index_lock:
+            self.total_size += entry.size - self.index.get(entry.key, 0)
+            self.index[entry.key] = entry.size
+            self.index.move_to_end(entry.key)
+            self._evict()
+        return
+
+
+    def _evict(self):
+        """Must be called with index_lock held."""
+        while self.total_size > self.max_size and self.index:
+            key, size = self.index.popitem(last=False)
+            self.total_size -= size
+            for suffix in ('body', 'json'):
+                try:
+                    os.remove(self._path(key, suffix))
+                except FileNotFoundError:
+                    pass
+            self.stats.evicted += 1
+        return
+
+
+    def _refresh(self, entry:CacheEntry):
+        """Restarts an entry's TTL after the server confirmed it is unchanged (304)."""
+        entry.stored_at = time.time()
+        self._write_atomic(self._path(entry.key, 'json'), json.dumps(asdict(entry)).encode())
+        return
+
+
+    def is_cacheable(self, status:int, headers:CIMultiDictProxy|dict, size:int=None) -> bool:
+        """size is None when the response has no Content-Length (ie: chunked or 
+        compressed), store() checks the size of the body itself.
+        """
+        if status != 200:
+            return False
+        if 'no-store' in headers.get('Cache-Control', headers.get('cache-control', '')):
+            return False
+        content_type = headers.get('Content-Type', headers.get('content-type', '')).split(';')[0].strip()
+        if content_type not in HTTP_CACHE_CONTENT_TYPES:
+            return False
+        return size is None or size <= self.max_entry_size
+
+
+    def should_serve(self, entry:CacheEntry, ttl:float=None) -> bool:
+        """True if the entry can be served without asking the server."""
+        if self.mode == CacheMode.OFFLINE:
+            return True
+        return entry.is_fresh(self.ttl if ttl is None else ttl)
+
+
+    async def lookup(self, key:str) -> CacheEntry | None:
+        return await asyncio.to_thread(self._lookup, key)
+
+
+    async def read_body(self, entry:CacheEntry) -> bytes | None:
+        """Returns None if the entry was evicted since it was looked up."""
+        return await asyncio.to_thread(self._read_body, entry)
+
+
+    async def hit(self, entry:CacheEntry) -> bytes | None:
+        """Reads the body of an entry served without a request. Returns None 
+        if it was evicted in the meantime, the caller then goes to the network.
+        """
+        body = await self.read_body(entry)
+        if body is None:
+            return None
+        self.stats.hits += 1
+        self.stats.bytes_saved += entry.size
+        return body
+
+
+    async def revalidated(self, entry:CacheEntry) -> bytes | None:
+        """Reads the body of an entry the server answered with a 304. Returns 
+        None if it was evicted in the meantime, the caller then requests it again.
+        """
+        body = await self.read_body(entry)
+        if body is None:
+            return None
+        self.stats.revalidated += 1
+        self.stats.bytes_saved += entry.size
+        await asyncio.to_thread(self._refresh, entry)
+        return body
+
+
+    async def store(self, key:str, url:str, status:int, headers:CIMultiDictProxy|dict, body:bytes) -> CacheEntry | None:
+        """Stores the response. Returns None without storing it if the body is 
+        bigger than max_entry_size.
+        """
+        if len(body) > self.max_entry_size:
+            logger.debug(f"HttpCache: not caching '{url}', {len(body)} bytes is over the {self.max_entry_size} bytes limit")
+            return None
+        header_pairs = [(name, value) for name, value in headers.items() if name.lower() not in HOP_BY_HOP_HEADERS]
+        lookup = CIMultiDict(header_pairs)
+        entry = CacheEntry(
+            key=key,
+            url=url,
+            status=status,
+            headers=header_pairs,
+            stored_at=time.time(),
+            size=len(body),
+            etag=lookup.get('ETag'),
+            last_modified=lookup.get('Last-Modified'),
+        )
+        await asyncio.to_thread(self._store, entry, body)
+        self.stats.stored += 1
+        return entry
+
+
+class PlaywrightCache:
+    """Route handler serving a BrowserContext's document requests through the
+    HttpCache: fresh entries are fulfilled straight from disk, stale ones are
+    revalidated with route.fetch() and everything else falls through.
+    """
+    def __init__(self, cache:HttpCache, ttl:float=None):
+        self.cache = cache
+        self.ttl = ttl
+
+
+    async def handle(self, route:Route):
+        request = route.request
+        if request.method != 'GET' or request.resource_type != 'document':
+            await route.fallback()
+            return
+        key = cache_key(request.url)
+        entry = await self.cache.lookup(key)
+        if entry is not None and self.cache.should_serve(entry, self.ttl):
+            body = await self.cache.hit(entry)
+            if body is not None:
+                await self._fulfill(route, entry, body)
+                return
+            entry = None  # evicted since the lookup
+
+        headers = {**request.headers, **(entry.conditional_headers() if entry else {})}
+        response = await route.fetch(headers=headers)
+        if response.status == 304 and entry is not None:
+            body = await self.cache.revalidated(entry)
+            if body is not None:
+                await self._fulfill(route, entry, body)
+                return
+            response = await route.fetch(headers=request.headers)
+        self.cache.stats.misses += 1
+        body = await response.body()
+        if self.cache.is_cacheable(response.status, response.headers, len(body)):
+            await self.cache.store(key, request.url, response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+
+    async def _fulfill(self, route:Route, entry:CacheEntry, body:bytes):
+        await route.fulfill(status=entry.status, headers=dict(entry.headers), body=body)
+        return
+
+
+    async def attach(self, target:BrowserContext|Page):
+        await target.route("**/*", self.handle)
+        return
+
+
+http_cache = HttpCache()
@@ -0,0 +1,223 @@
+import logging
+import re
+from typing import Optional
+
+from lxml import etree, html
+
+from webweaver_node.core.exceptions import BadMarkupError
+from webweaver_node.core.webscraping.spiders.selector_cache import compile_css
+from webweaver_node.core.webscraping.spiders.soup_base import SoupRegex
+
+
+logger = logging.getLogger('scraping')
+
+
+class LxmlTag:
+    """A thin wrapper around an lxml HtmlElement exposing the same helper API
+    as SpiderTag, so spider modules can switch parser backend without
+    rewriting their selectors. Selectors are matched natively by lxml's XPath
+    engine instead of soupsieve.
+    """
+    __slots__ = ('element',)
+    scoped = True  # select() only matches inside the element, like SpiderTag
+
+    def __init__(self, element:html.HtmlElement):
+        self.element = element
+
+
+    def __repr__(self) -> str:
+        return f"<LxmlTag {self.element.tag}>"
+
+
+    def __str__(self) -> str:
+        return self.flatten_html()
+
+
+    def __bool__(self) -> bool:
+        return True
+
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, LxmlTag) and self.element is other.element
+
+
+    def __hash__(self) -> int:
+        return id(self.element)
+
+
+    def __getitem__(self, attr:str) -> str:
+        value = self.element.get(attr)
+        if value is None:
+            raise KeyError(attr)
+        return value
+
+
+    @property
+    def name(self) -> str:
+        return self.element.tag
+
+
+    @property
+    def attrs(self) -> dict[str, str]:
+        return dict(self.element.attrib)
+
+
+    @property
+    def text(self) -> str:
+        return self.element.text_content()
+
+
+    def get_text(self, separator:str='', strip:bool=False) -> str:
+        strings = [s.strip() if strip else s for s in self.element.itertext()]
+        return separator.join(s for s in strings if s or not strip)
+
+
+    def get(self, attr:str, default=None) -> str | None:
+        return self.element.get(attr, default)
+
+
+    def select(self, selector:str, limit:int=None) -> list["LxmlTag"]:
+        elements = compile_css(selector, scoped=self.scoped)(self.element, scope=self.element)
+        return [LxmlTag(element) for element in elements[:limit]]
+
+
+    def select_one(self, selector:str) -> "LxmlTag | None":
+        elements = compile_css(selector, first=True, scoped=self.scoped)(self.element, scope=self.element)
+        if elements:
+            return LxmlTag(elements[0])
+
+
+    def find_all(self, tag:str, href:bool=False) -> list["LxmlTag"]:
+        """Subset of BeautifulSoup's find_all(): matches by tag name and, with
+        href=True, only elements that have an href attribute.
+        """
+        return self.select(f"{tag}[href]" if href else tag)
+
+
+    def decompose(self) -> None:
+        """Removes the element from the tree, keeping any text that follows it."""
+        if self.element.getparent() is not None:
+            self.element.drop_tree()
+
+
+    def extract(self) -> "LxmlTag":
+        """Removes the element from the tree and returns it."""
+        self.decompose()
+        return self
+
+
+    def flatten_html(self) -> str:
+        """Return a flat string of the HTML Element.
+        This is required for regex operations.
+        """
+        return html.tostring(self.element, encoding='unicode', with_tail=False)
+
+
+    def prettify(self) -> str:
+        return html.tostring(self.element, encoding='unicode', pretty_print=True, with_tail=False)
+
+
+    def get_hrefs(self, substring:str=None, regex_pattern:re.Pattern=None) -> list[str]:
+        """Retrieve all hrefs on the page. Two optional parameters allow you
+        to filter the hrefs by substrings or regex.
+        """
+        hrefs = self.element.xpath('.//a/@href')
+        if substring:
+            hrefs = [href for href in hrefs if substring in href]
+        elif regex_pattern:
+            hrefs = [href for href in hrefs if regex_pattern.search(href)]
+        return [str(href) for href in hrefs]
+
+
+    def get_href(self, substring:str=None, regex_pattern:re.Pattern=None) -> str:
+        return self.get_hrefs(substring, regex_pattern)[0]
+
+
+    def select_one_text(self, selector:str) -> str | None:
+        """Select an element and, if it exists, extract the text."""
+        element = self.select_one(selector)
+        if element:
+            text = element.text
+            return text if text != '' else None
+
+
+    def select_one_attr(self, selector:str, attr:str, strip_text:str=None) -> str | None:
+        """Select an element and, if it exists, extract the specified attribute.
+        Option to strip text out if necessary.
+        """
+        element = self.select_one(selector)
+        if element:
+            if strip_text:
+                attr = element[attr].replace(strip_text, '')
+            else:
+                attr = element[attr]
+            return attr if attr != '' else None
+
+
+    def select_one_and_extract(self, selector:str) -> "LxmlTag | None":
+        """Destructively extract element from tree, if it exists."""
+        element = self.select_one(selector)
+        if element:
+            return element.extract()
+
+
+    def select_one_and_decompose(self, selector:str) -> None:
+        """Find an element matching the CSS selector and, if found, decomposes it."""
+        element = self.select_one(selector)
+        if element:
+            element.decompose()
+
+
+    def select_and_decompose(self, selectors:str) -> None:
+        """Finds all elements matching the CSS selectors and decomposes them."""
+        for element in self.select(selectors):
+            element.decompose()
+
+
+    def spider_attribute(self, selector:str, attr:str, default=None) -> str|None:
+        """Retrieve's an HTML element's attribute, or returns default value if
+        the element does not exist.
+        """
+        try:
+            return self.select_one(selector).get(attr)
+        except AttributeError:
+            return default
+
+
+class LxmlSoup(LxmlTag):
+    """lxml-backed drop-in for SpiderSoup. Opt in per spider module with
+    parser_backend = ParserBackend.LXML on the Spider class.
+    """
+    __slots__ = ('spider_name',)
+    regex = SoupRegex
+    scoped = False  # the <html> root can be selected, as in SpiderSoup
+
+    def __init__(self, spider_name:str, markup:str|bytes, *args, **kwargs):
+        self.spider_name = spider_name
+        try:
+            root = html.document_fromstring(markup)
+        except (etree.ParserError, ValueError) as e:
+            raise BadMarkupError(spider_name, str(e))
+        super().__init__(root)
+
+
+    def flatten_html(self, element:LxmlTag=None) -> str:
+        """Return a flat string of the whole document or HTML Element"""
+        if element:
+            return element.flatten_html()
+        return super().flatten_html()
+
+
+    def find_emails(self, flattened_html:str, domain:Optional[str]=None) -> list:
+        """Returns a list of all emails found in the page. Filters by emails
+        that contain the domain, if a domain is specified.
+        """
+        emails = self.regex.email_pattern.findall(flattened_html)
+        if domain is not None:
+            emails = [email for email in emails if email.find(domain) != -1]
+        return emails
+
+
+    def get_all_hrefs(self) -> list[str]:
+        """Retrieve all hrefs on the page."""
+        return self.get_hrefs()
@@ -15,6 +15,7 @@ from webweaver_node.core.exceptions import (
     ConfigModuleNotFound,
     ConfigModelsNotFound,
 )
+from webweaver_node.core.webscraping.spiders.module_cache import module_cache
 if TYPE_CHECKING:
     from webweaver_node.core.webscraping.spiders.spider_base import Spider
     from webweaver_node.core.webscraping.pipelines.pipeline_base import Pipeline
@@ -37,6 +38,16 @@ class SpiderAsset(Model):
     @property
     def module_config(self) -> dict:
         """Returns the spider's config.toml file data as a dict."""
+        entry = module_cache.get(self)
+        if entry.config_error is not None:
+            raise ConfigModuleNotFound(entry.config_error)
+        return entry.config
+
+
+    def load_module_config(self) -> dict:
+        """Reads the spider's config.toml file from disk. Use self.module_config,
+        which is cached, unless you need a fresh read.
+        """
         config_path = self.module_dir_path() / Path("config.toml")
         try:
             return toml.load(config_path)
@@ -45,11 +56,6 @@ class SpiderAsset(Model):
             raise ConfigModuleNotFound(e)
 
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._module_config = None
-
-
     def __str__(self):
         return self.spider_name
 
@@ -79,8 +85,18 @@ class SpiderAsset(Model):
         raise ConfigModelsNotFound(self.spider_name)
         
 
-    def get_spider(self) -> "Spider" | None:
-        """Retrieve the Spider subclass, based on naming convention."""
+    def get_spider(self) -> "Spider | None":
+        """Retrieve the Spider subclass from the ModuleCache."""
+        return module_cache.get(self).SpiderClass
+
+
+    def get_pipeline(self) -> "Pipeline | None":
+        """Retrieve the Pipeline subclass from the ModuleCache."""
+        return module_cache.get(self).PipelineClass
+
+
+    def load_spider(self) -> "Spider | None":
+        """Import the Spider subclass, based on naming convention."""
         SpiderClass = None
         module_name = f"{SCRAPING_MODULES}.{self.spider_name.lower()}.spider"
         try:
@@ -96,9 +112,9 @@ class SpiderAsset(Model):
         return SpiderClass
 
 
-    def get_pipeline(self) -> "Pipeline" | None:
-        """Retrieve the Pipeline subclass, based on the same 
-        naming convention as self.get_spider()
+    def load_pipeline(self) -> "Pipeline | None":
+        """Import the Pipeline subclass, based on the same 
+        naming convention as self.load_spider()
         """
         PipelineClass = None
         module_name = f"{SCRAPING_MODULES}.{self.spider_name.lower()}.pipeline"
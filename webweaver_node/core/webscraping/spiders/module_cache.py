@@ -0,0 +1,130 @@
+from collections import Counter
+from dataclasses import dataclass
+import importlib
+import logging
+import os
+import sys
+from typing import Any, TYPE_CHECKING
+
+from webweaver_node.core.config import SCRAPING_MODULES
+from webweaver_node.core.exceptions import ConfigModuleNotFound, WebScrapingError
+
+if TYPE_CHECKING:
+    from webweaver_node.core.webscraping.spiders.models import SpiderAsset
+    from webweaver_node.core.webscraping.spiders.spider_base import Spider
+    from webweaver_node.core.webscraping.pipelines.pipeline_base import Pipeline
+
+
+logger = logging.getLogger('scraping')
+
+
+@dataclass
+class ModuleCacheEntry:
+    """Everything resolved from a spider's scraping module directory."""
+    SpiderClass: "type[Spider] | None"
+    PipelineClass: "type[Pipeline] | None"
+    config: dict[str, Any] | None
+    config_error: BaseException | None
+    schema: Any  # pydantic schema declared on the Pipeline subclass
+    mtime: float
+
+
+class ModuleCache:
+    """Process-wide cache of each scraping module's Spider class, Pipeline class,
+    config.toml and schema, keyed by spider_name. 
+
+    Entries are warmed when the ScrapingRegistry is built. Every time it is warmed
+    the module files' modification times are checked, and a module that changed on 
+    disk is reloaded so edits are picked up without restarting the node.
+    Modules that a running scrape job has acquired are not reloaded until
+    every job using them has released them.
+    """
+    MODULE_FILES = ("spider.py", "pipeline.py", "validation.py", "config.toml")
+    RELOAD_ORDER = ("validation", "pipeline", "spider")  # pipeline imports validation
+
+    def __init__(self):
+        self.entries:dict[str, ModuleCacheEntry] = {}
+        self.in_use:Counter[str] = Counter()  # spider_name -> running jobs using it
+
+
+    def _mtime(self, sa:"SpiderAsset") -> float:
+        """Latest modification time across the module's files."""
+        mtime = 0.0
+        module_dir = sa.module_dir_path()
+        for file_name in self.MODULE_FILES:
+            try:
+                mtime = max(mtime, os.stat(module_dir / file_name).st_mtime)
+            except OSError:
+                continue
+        return mtime
+
+
+    def _load(self, sa:"SpiderAsset", mtime:float) -> ModuleCacheEntry:
+        config, config_error = None, None
+        try:
+            config = sa.load_module_config()
+        except (Exception, WebScrapingError, ConfigModuleNotFound) as e:
+            config_error = e
+        PipelineClass = sa.load_pipeline()
+        return ModuleCacheEntry(
+            SpiderClass=sa.load_spider(),
+            PipelineClass=PipelineClass,
+            config=config,
+            config_error=config_error,
+            schema=getattr(PipelineClass, 'schema', None),
+            mtime=mtime,
+        )
+
+
+    def get(self, sa:"SpiderAsset") -> ModuleCacheEntry:
+        """Returns the cached entry for the spider, loading it on first use."""
+        entry = self.entries.get(sa.spider_name)
+        if entry is None:
+            entry = self._load(sa, self._mtime(sa))
+            self.entries[sa.spider_name] = entry
+        return entry
+
+
+    def invalidate(self, spider_name:str):
+        """Drops the cached entry and reloads the spider's modules if they 
+        have already been imported. Does nothing while a running job is still
+        using the modules.
+        """
+        if self.in_use[spider_name]:
+            logger.info(f"ModuleCache not reloading {spider_name}, it is in use by a running job")
+            return
+        self.entries.pop(spider_name, None)
+        for module_file in self.RELOAD_ORDER:
+            module = sys.modules.get(f"{SCRAPING_MODULES}.{spider_name.lower()}.{module_file}")
+            if module is not None:
+                importlib.reload(module)
+        logger.debug(f"ModuleCache invalidated {spider_name}")
+        return
+
+
+    def warm(self, spider_assets:list["SpiderAsset"]):
+        """Loads every spider's module ahead of the scrape, reloading any 
+        module whose files have changed since they were cached.
+        """
+        for sa in spider_assets:
+            entry = self.entries.get(sa.spider_name)
+            if entry is not None and entry.mtime != self._mtime(sa):
+                self.invalidate(sa.spider_name)
+            self.get(sa)
+        return
+
+
+    def acquire(self, spider_assets:list["SpiderAsset"]):
+        """Marks the spiders' modules as in use by a running scrape job."""
+        self.in_use.update(sa.spider_name for sa in spider_assets)
+        return
+
+
+    def release(self, spider_assets:list["SpiderAsset"]):
+        """Releases modules acquired by a scrape job once it has finished."""
+        self.in_use.subtract(sa.spider_name for sa in spider_assets)
+        self.in_use = +self.in_use  # drop names no job is using
+        return
+
+
+module_cache = ModuleCache()
@@ -0,0 +1,114 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import multiprocessing
+from typing import Any, Callable
+
+from webweaver_node.core.common.enums import ParserBackend
+from webweaver_node.core.config import PARSE_POOL_WORKERS, PARSE_POOL_MIN_SIZE
+from webweaver_node.core.webscraping.spiders.lxml_soup import LxmlSoup
+from webweaver_node.core.webscraping.spiders.parsers import make_soup
+from webweaver_node.core.webscraping.spiders.soup_base import SpiderSoup
+
+
+logger = logging.getLogger('scraping')
+
+# A field is either a CSS selector, whose text is extracted, or a
+# (selector, attribute) pair, whose attribute is extracted.
+FieldSelector = str | tuple[str, str]
+
+
+def extract(
+        spider_name:str, 
+        markup:str|bytes, 
+        extractor:Callable[[SpiderSoup | LxmlSoup], Any], 
+        backend:ParserBackend=ParserBackend.BS4,
+) -> Any:
+    """Builds the soup and runs the extractor on it. Runs inside a
+    parse worker process, so the extractor must be a module-level function
+    and its return value must be picklable.
+    """
+    soup = make_soup(spider_name, markup, backend)
+    return extractor(soup)
+
+
+def select_fields(
+        spider_name:str, 
+        markup:str|bytes, 
+        fields:dict[str, FieldSelector], 
+        backend:ParserBackend=ParserBackend.BS4,
+) -> dict[str, str | None]:
+    """Builds the soup and extracts each field's text or attribute."""
+    soup = make_soup(spider_name, markup, backend)
+    data = {}
+    for name, selector in fields.items():
+        if isinstance(selector, tuple):
+            data[name] = soup.select_one_attr(*selector)
+        else:
+            data[name] = soup.select_one_text(selector)
+    return data
+
+
+class ParsePool:
+    """Process pool that builds SpiderSoups and runs selector extraction away
+    from the event loop, so a big page being parsed does not hold up every
+    other spider's I/O.
+
+    Only picklable results come back across the process boundary: the soup
+    itself stays in the worker. Markup smaller than min_size is parsed inline,
+    where it is quicker than the round trip to a worker. The executor is
+    started the first time it is needed.
+    """
+    def __init__(self, workers:int=PARSE_POOL_WORKERS, min_size:int=PARSE_POOL_MIN_SIZE):
+        self.workers = workers
+        self.min_size = min_size
+        self.executor:ProcessPoolExecutor = None
+
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+            logger.debug(f"ParsePool started with {self.workers} workers")
+        return self.executor
+
+
+    async def run(self, markup:str|bytes, fn:Callable, *args) -> Any:
+        """Runs fn(*args) in a worker process, or inline if the markup is small."""
+        if len(markup) < self.min_size:
+            return fn(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor(), fn, *args)
+
+
+    async def extract(
+            self, 
+            spider_name:str, 
+            markup:str|bytes, 
+            extractor:Callable[[SpiderSoup | LxmlSoup], Any], 
+            backend:ParserBackend=ParserBackend.BS4,
+    ) -> Any:
+        return await self.run(markup, extract, spider_name, markup, extractor, backend)
+
+
+    async def select_fields(
+            self, 
+            spider_name:str, 
+            markup:str|bytes, 
+            fields:dict[str, FieldSelector], 
+            backend:ParserBackend=ParserBackend.BS4,
+    ) -> dict[str, str | None]:
+        return await self.run(markup, select_fields, spider_name, markup, fields, backend)
+
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+            logger.debug("ParsePool stopped")
+        return
+
+
+parse_pool = ParsePool()
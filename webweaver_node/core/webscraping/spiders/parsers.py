@@ -0,0 +1,19 @@
+from webweaver_node.core.common.enums import ParserBackend
+from webweaver_node.core.webscraping.spiders.lxml_soup import LxmlSoup
+from webweaver_node.core.webscraping.spiders.soup_base import SpiderSoup
+
+
+SOUP_BACKENDS:dict[ParserBackend, type[SpiderSoup | LxmlSoup]] = {
+    ParserBackend.BS4: SpiderSoup,
+    ParserBackend.LXML: LxmlSoup,
+}
+
+
+def make_soup(spider_name:str, markup:str|bytes, backend:ParserBackend=ParserBackend.BS4, **kwargs) -> SpiderSoup | LxmlSoup:
+    """Instantiates the soup for the spider's parser backend. Both backends
+    share the select_one_text/select_one_attr/get_hrefs/... helper API.
+    """
+    SoupClass = SOUP_BACKENDS[backend]
+    if backend == ParserBackend.BS4:
+        kwargs.setdefault('features', 'lxml')
+    return SoupClass(spider_name=spider_name, markup=markup, **kwargs)
@@ -2,24 +2,55 @@ import os
 from playwright.async_api._generated import (
     Playwright as AsyncPlaywright, 
     Browser, 
-    BrowserContext
+    BrowserContext,
+    Page,
 )
 from webweaver_node.core.config import USE_PROXY
 from webweaver_node.core.webscraping.proxy.proxy_session import ProxySession
+from webweaver_node.core.webscraping.replay.replay_manager import PlaywrightReplay, replay_manager
+from webweaver_node.core.webscraping.spiders.browser_pool import BrowserPool
+from webweaver_node.core.webscraping.spiders.dom import PageConfig
+from webweaver_node.core.webscraping.spiders.http_cache import PlaywrightCache, http_cache
+from webweaver_node.core.webscraping.spiders.resource_policy import ResourceBlocker, ResourcePolicy
 from webweaver_node.core.webscraping.spiders.spider_page import RequestContext, SpiderContext, SpiderPage
 
 
 class PlaywrightAPI:
     """This class adds playwright functionality to the spider class."""
+
+    resource_policy:ResourcePolicy|None = None  # requests to abort, ie: ResourcePolicy.default()
+    cache_navigation:bool = False  # serve page navigations through the HttpCache as well
     
     def __init__(self, spider_asset, **kwargs):
         super().__init__(spider_asset, **kwargs)
         self.p:AsyncPlaywright = kwargs.get('p', None)
+        self.browser_pool:BrowserPool = kwargs.get('browser_pool', None)
         self.browser:Browser = None
+        self.spider_contexts:list[SpiderContext] = []
+        self.pages:list[Page] = []  # pages opened without a SpiderContext
+        self.resource_blocker = ResourceBlocker(self.resource_policy) if self.resource_policy else None
+        self.playwright_cache = self._playwright_cache()
+        self.playwright_replay = PlaywrightReplay(replay_manager) if replay_manager.active else None
+
+
+    def _playwright_cache(self) -> PlaywrightCache | None:
+        """Recording and replaying bypass the navigation cache, so that every
+        request reaches the PlaywrightReplay handler.
+        """
+        if replay_manager.active:
+            return None
+        if self.cache_navigation and self.use_cache and http_cache.enabled:
+            return PlaywrightCache(http_cache, ttl=self.cache_ttl)
+        return None
 
 
     async def start(self, browser:str='chromium', headless:bool=True):
-        """Launch async webdriver and get a blank page."""
+        """Borrow a warm browser from the SpiderLauncher's BrowserPool. Spiders
+        created without a pool (ie: test environments) launch their own browser.
+        """
+        if self.browser_pool is not None:
+            self.browser = await self.browser_pool.acquire(browser, headless)
+            return
         match browser:
             case 'firefox':
                 self.browser = await self.p.firefox.launch(headless=headless)
@@ -30,27 +61,50 @@ class PlaywrightAPI:
         return
     
     
-    async def _new_browser_context(self, proxy:ProxySession=None) -> BrowserContext:
+    async def _new_browser_context(
+            self, 
+            proxy:ProxySession=None, 
+            resource_blocker:ResourceBlocker=None,
+    ) -> BrowserContext:
         """Create a new Playwright BrowserContext, either with proxy config details
-        or without proxy entirely.
+        or without proxy entirely. The PageConfig fingerprint is applied once for
+        the whole context. If a ResourceBlocker is given, its policy is
+        applied to every page in the context. Page navigations go through the 
+        HttpCache if the spider has cache_navigation turned on, and every request
+        through the PlaywrightReplay handler when REPLAY_MODE is on.
         """
+        viewport = PageConfig.random_viewport()
         if proxy:
-            browser_context = await self.browser.new_context(proxy={
+            browser_context = await self.browser.new_context(viewport=viewport, proxy={
                 'server': proxy.endpoint,
                 'username': os.getenv("PROXY_USER"),
                 'password': os.getenv("PROXY_PASS"),
             })
         else:
-            browser_context = await self.browser.new_context()
+            browser_context = await self.browser.new_context(viewport=viewport)
+        await PageConfig.set_context_config(browser_context)
+        if self.playwright_replay:
+            await self.playwright_replay.attach(browser_context)  # routed first so it runs last
+        if self.playwright_cache:
+            await self.playwright_cache.attach(browser_context)  # runs after the blocker, which is routed last
+        if resource_blocker:
+            await resource_blocker.attach(browser_context)
         return browser_context
 
 
-    async def new_context(self, stateful:bool=False, proxy:bool=True) -> SpiderContext:
+    async def new_context(
+            self, 
+            stateful:bool=False, 
+            proxy:bool=True, 
+            resource_policy:ResourcePolicy=None,
+    ) -> SpiderContext:
         """Factory method for creating new SpiderContext objects:
             -creates RequestContext if request is stateful,
             -creates ProxySession object if request is proxied, 
             -creates the underlying Playwright BrowserContext object,
         then passes it all into SpiderContext along with its self.
+
+        resource_policy overrides the spider's own resource_policy for this context.
         """
         if USE_PROXY and proxy:
             if stateful:
@@ -62,24 +116,60 @@ class PlaywrightAPI:
         else:
             proxy = None
             request_context = RequestContext()
-        browser_context = await self._new_browser_context(proxy=proxy)
-        return SpiderContext.create(
+        resource_blocker = ResourceBlocker(resource_policy) if resource_policy else self.resource_blocker
+        browser_context = await self._new_browser_context(proxy=proxy, resource_blocker=resource_blocker)
+        spider_context = SpiderContext.create(
             self, 
             context=browser_context, 
             request_context=request_context,
             proxy=proxy, 
+            context_factory=lambda: self._new_browser_context(proxy=proxy, resource_blocker=resource_blocker),
+            resource_blocker=resource_blocker,
         )
+        self.spider_contexts.append(spider_context)
+        return spider_context
+
+
+    async def close_contexts(self):
+        """Closes every SpiderContext and standalone page this spider opened. 
+        The pooled browser itself stays open for other spiders.
+        """
+        spider_name = self.spider_asset.spider_name
+        for page in self.pages:
+            if not page.is_closed():
+                await page.close()
+        self.pages = []
+        for spider_context in self.spider_contexts:
+            if spider_context.resource_blocker and spider_context.resource_blocker is not self.resource_blocker:
+                spider_context.resource_blocker.log_savings(spider_name)
+            await spider_context.close()
+        self.spider_contexts = []
+        if self.resource_blocker:
+            self.resource_blocker.log_savings(spider_name)
+        return
 
 
     async def new_page(self, spider_context:SpiderContext=None) -> SpiderPage:
         """Factory method which calls SpiderPage's factory method for creating a 
         new SpiderPage. This enables us to create new SpiderPage objects without
         having to import SpiderPage on every new webscraping module we make.
+
+        Pages created without a SpiderContext get the same route handlers, in the
+        same order, as the BrowserContexts made by _new_browser_context(), so 
+        they are recorded/replayed and cached like every other page. They are
+        closed by close_contexts(), so they do not outlive the spider on a 
+        pooled browser.
         """
         if spider_context:
-            new_page = await spider_context.context.new_page()
-        else:
-            new_page = await self.browser.new_page()
+            return await spider_context.new_spider_page()
+        new_page = await self.browser.new_page()
+        self.pages.append(new_page)
+        if self.playwright_replay:
+            await self.playwright_replay.attach(new_page)
+        if self.playwright_cache:
+            await self.playwright_cache.attach(new_page)
+        if self.resource_blocker:
+            await self.resource_blocker.attach(new_page)
         return await SpiderPage.create(self, new_page, spider_context)
 
 
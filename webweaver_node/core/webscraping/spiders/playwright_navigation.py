@@ -1,5 +1,7 @@
 from asyncio import sleep as async_sleep
 import logging
+import time
+from typing import TYPE_CHECKING
 from playwright.async_api import Page, ElementHandle
 from playwright.async_api import (
     TimeoutError as PlaywrightTimeoutError, 
@@ -7,8 +9,14 @@ from playwright.async_api import (
     Response as ResponsePlaywright
 )
 from webweaver_node.core.webscraping.spiders.spider_api import SpiderAPI
-from webweaver_node.core.webscraping.middleware.decorators import response_middleware
+from webweaver_node.core.webscraping.middleware.spider_request import SpiderRequest
 from webweaver_node.core.exceptions import ClickLinkError, SpiderHttpError
+from webweaver_node.core.webscraping.metrics.metrics import bytes_transferred, http_responses, playwright_goto_seconds
+from webweaver_node.core.webscraping.spiders.rate_limiter import domain_rate_limiter
+
+if TYPE_CHECKING:
+    from webweaver_node.core.webscraping.proxy.proxy_session import ProxySession
+    from webweaver_node.core.webscraping.spiders.spider_page import RequestContextInterface
 
 
 logger = logging.getLogger("scraping")
@@ -16,9 +24,10 @@ logger = logging.getLogger("scraping")
 
 class PlaywrightNavigation:
 
-    def __init__(self, spider_api:"SpiderAPI", page:Page):
+    def __init__(self, spider_api:"SpiderAPI", page:Page, proxy:"ProxySession"=None):
         self.spider_api = spider_api
         self.page = page
+        self.proxy = proxy
 
 
     async def click(self, element:ElementHandle, max_retries:int=5, verbose:bool=True, **kwargs):
@@ -50,15 +59,54 @@ class PlaywrightNavigation:
             return None
 
 
-    @response_middleware
-    async def goto(self, url:str, timeout:float=100000, **kwargs) -> ResponsePlaywright:
+    async def goto(
+            self, 
+            url:str, 
+            timeout:float=100000, 
+            request_interface:"RequestContextInterface"=None, 
+            **kwargs
+    ) -> ResponsePlaywright:
         """Wrapper function for playwright's page.goto() method to
         includes error handling and logging.
 
+        The navigation goes through the spider's middleware chain: request 
+        middlewares (ie: the RateLimitMiddleware) run before page.goto(), 
+        and response middlewares on its response. Navigations through a proxy
+        are fed into the ProxySession's endpoint health.
+
         *timeout is in milliseconds.
         """
+        spider_name = self.spider_api.spider.spider_asset.spider_name
+        request = SpiderRequest(url=url, transport='playwright', spider_name=spider_name)
+
+        async def _goto(request:SpiderRequest) -> ResponsePlaywright:
+            start = time.perf_counter()
+            try:
+                response = await self.page.goto(request.url, timeout=timeout, **kwargs)
+            except (PlaywrightError, PlaywrightTimeoutError) as e:
+                if self.proxy is not None:
+                    self.proxy.record_failure()
+                logger.error(e, exc_info=True)
+                raise SpiderHttpError(f"{self.__class__.__name__}.goto() failed. url: `{request.url}`") from e
+            finally:
+                latency = time.perf_counter() - start
+                playwright_goto_seconds.observe(latency, spider_name=spider_name)
+            if response is not None:
+                if self.proxy is not None:
+                    self.proxy.record_response(response.status, latency)
+                if response.status < 400:
+                    domain_rate_limiter.record_success(request.domain)
+                await self._record_response(spider_name, response)
+            return response
+
+        return await self.spider_api.execute(request, _goto, request_interface)
+
+
+    async def _record_response(self, spider_name:str, response:ResponsePlaywright):
+        http_responses.inc(spider_name=spider_name, transport='playwright', status=response.status)
         try:
-            return await self.page.goto(url, timeout=timeout, **kwargs)
-        except (PlaywrightError, PlaywrightTimeoutError) as e:
-            logger.error(e, exc_info=True)
-            raise SpiderHttpError(f"{self.__class__.__name__}.goto() failed. url: `{url}`") from e 
+            sizes = await response.request.sizes()
+        except PlaywrightError:
+            return
+        bytes_transferred.inc(sizes['responseBodySize'], spider_name=spider_name, transport='playwright')
+        return 
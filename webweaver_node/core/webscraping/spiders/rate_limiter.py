@@ -0,0 +1,186 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import email.utils
+import logging
+import math
+import time
+
+from yarl import URL
+
+from webweaver_node.core.config import (
+    RATE_LIMIT_ENABLED,
+    RATE_LIMIT_INITIAL_RATE,
+    RATE_LIMIT_MIN_RATE,
+    RATE_LIMIT_MAX_RATE,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_INCREASE,
+    RATE_LIMIT_DECREASE,
+    RATE_LIMIT_DECREASE_COOLDOWN,
+    REQUEST_WAIT_MAX,
+)
+
+
+logger = logging.getLogger('scraping')
+
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(retry_header:str) -> int:
+    """Retry-After headers will typically either be:
+    1.  an int value indicating the number of seconds to wait before making a new request
+    2.  a HTTP-date indicating when to make the new request
+
+    Either way, returns the number of seconds to wait. Raises ValueError if
+    the header is neither.
+    """
+    retry_header = retry_header.strip()
+    if retry_header.isdigit():
+        return int(retry_header)
+    try:
+        retry_time = email.utils.parsedate_to_datetime(retry_header)
+        if retry_time.tzinfo is None or retry_time.tzinfo.utcoffset(retry_time) is None:
+            retry_time = retry_time.replace(tzinfo=timezone.utc)
+        current_time = datetime.now(tz=timezone.utc)
+        delay = math.ceil((retry_time - current_time).total_seconds())
+        return max(delay, 0)
+    except (TypeError, ValueError, OverflowError) as e:
+        raise ValueError(f"Invalid Retry-After header format: {retry_header}") from e
+
+
+def retry_after_seconds(headers) -> int | None:
+    """Seconds asked for by the response's Retry-After header, if it has a valid one."""
+    retry_header = headers.get('Retry-After', headers.get('retry-after'))
+    if retry_header is None:
+        return None
+    try:
+        return parse_retry_after(retry_header)
+    except ValueError:
+        return None
+
+
+def domain_of(url:str) -> str:
+    return URL(url).host or url
+
+
+@dataclass
+class DomainBucket:
+    """Token bucket for one domain. rate is in requests per second."""
+    rate: float
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    last_decrease: float = float('-inf')
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class DomainRateLimiter:
+    """Process-wide token bucket per domain, shared by every spider, so one
+    throttled response slows down all the traffic to that domain instead of
+    only the request that received it.
+
+    The rate adapts AIMD-style: each successful response adds increase
+    requests/second, up to max_rate, and each 429/503 multiplies it by decrease,
+    down to min_rate. A Retry-After header also blocks the domain until the
+    time it asks for. Rate cuts are at most one per decrease_cooldown seconds,
+    so a burst of 429s from requests already in flight only counts once.
+    """
+    def __init__(
+            self,
+            initial_rate:float=RATE_LIMIT_INITIAL_RATE,
+            min_rate:float=RATE_LIMIT_MIN_RATE,
+            max_rate:float=RATE_LIMIT_MAX_RATE,
+            burst:int=RATE_LIMIT_BURST,
+            increase:float=RATE_LIMIT_INCREASE,
+            decrease:float=RATE_LIMIT_DECREASE,
+            decrease_cooldown:float=RATE_LIMIT_DECREASE_COOLDOWN,
+            enabled:bool=RATE_LIMIT_ENABLED,
+    ):
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.decrease_cooldown = decrease_cooldown
+        self.enabled = enabled
+        self.buckets:dict[str, DomainBucket] = {}
+
+
+    def _bucket(self, domain:str) -> DomainBucket:
+        bucket = self.buckets.get(domain)
+        if bucket is None:
+            bucket = self.buckets[domain] = DomainBucket(
+                rate=self.initial_rate,
+                tokens=self.burst,
+                updated=time.monotonic(),
+            )
+        return bucket
+
+
+    def _refill(self, bucket:DomainBucket, now:float):
+        bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+        bucket.updated = now
+        return
+
+
+    def rate(self, domain:str) -> float:
+        return self._bucket(domain).rate
+
+
+    async def acquire(self, domain:str):
+        """Waits until the domain has a token for one more request. Requests
+        to the same domain get their tokens in the order they asked for them.
+        """
+        if not self.enabled:
+            return
+        bucket = self._bucket(domain)
+        async with bucket.lock:
+            while True:
+                now = time.monotonic()
+                if bucket.blocked_until > now:
+                    await asyncio.sleep(bucket.blocked_until - now)
+                    continue
+                self._refill(bucket, now)
+                if bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return
+                await asyncio.sleep((1 - bucket.tokens) / bucket.rate)
+
+
+    def record_success(self, domain:str):
+        """Additive increase."""
+        bucket = self._bucket(domain)
+        bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+        return
+
+
+    def penalize(self, domain:str, retry_after:float=None):
+        """Multiplicative decrease, plus a block on the domain for retry_after seconds."""
+        bucket = self._bucket(domain)
+        now = time.monotonic()
+        if retry_after:
+            bucket.blocked_until = max(bucket.blocked_until, now + min(retry_after, REQUEST_WAIT_MAX))
+        if now - bucket.last_decrease < self.decrease_cooldown:
+            return
+        bucket.last_decrease = now
+        self._refill(bucket, now)
+        bucket.tokens = min(bucket.tokens, 0)
+        bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+        logger.info(
+            f"DomainRateLimiter: {domain} throttled, rate cut to {bucket.rate:.2f} requests/s"
+            + (f", blocked for {retry_after}s" if retry_after else "")
+        )
+        return
+
+
+    def record_status(self, domain:str, status:int, retry_after:float=None):
+        """Feeds a response status into the domain's rate."""
+        if status in THROTTLE_STATUS_CODES:
+            self.penalize(domain, retry_after)
+        elif status < 400:
+            self.record_success(domain)
+        return
+
+
+domain_rate_limiter = DomainRateLimiter()
@@ -0,0 +1,99 @@
+from collections import Counter
+from dataclasses import dataclass, field
+import logging
+import re
+from playwright.async_api import BrowserContext, Page, Route
+
+from webweaver_node.core.config import (
+    BLOCKED_RESOURCE_TYPES, 
+    BLOCKED_URL_PATTERNS, 
+    RESOURCE_SIZE_ESTIMATES_KB,
+)
+
+
+logger = logging.getLogger('scraping')
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """Declares which requests a Playwright spider should never make. Requests are
+    matched on Playwright's resource type (image, font, media, stylesheet...) or on 
+    a regex against the URL, ie: analytics and tracking beacons.
+
+    Set it per spider with the `resource_policy` class attribute, or per context 
+    with PlaywrightAPI.new_context(resource_policy=...).
+    """
+    blocked_resource_types: frozenset[str] = frozenset()
+    blocked_url_patterns: tuple[str, ...] = ()
+    _compiled_patterns: tuple[re.Pattern, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        compiled = tuple(re.compile(pattern) for pattern in self.blocked_url_patterns)
+        object.__setattr__(self, '_compiled_patterns', compiled)
+
+
+    @classmethod
+    def default(cls) -> "ResourcePolicy":
+        """Blocks the resource types and tracker URLs listed in config.py"""
+        return cls(
+            blocked_resource_types=frozenset(BLOCKED_RESOURCE_TYPES),
+            blocked_url_patterns=tuple(BLOCKED_URL_PATTERNS),
+        )
+
+
+    def is_blocked(self, resource_type:str, url:str) -> bool:
+        if resource_type in self.blocked_resource_types:
+            return True
+        return any(pattern.search(url) for pattern in self._compiled_patterns)
+
+
+@dataclass
+class ResourceStats:
+    """Counts of requests aborted by a ResourceBlocker. Aborted requests never
+    reach the network so their real size is unknown; estimated_bytes uses the
+    per-type averages in RESOURCE_SIZE_ESTIMATES_KB.
+    """
+    blocked_requests: Counter = field(default_factory=Counter)
+    estimated_bytes: int = 0
+
+    @property
+    def total_blocked(self) -> int:
+        return sum(self.blocked_requests.values())
+
+    def record(self, resource_type:str):
+        self.blocked_requests[resource_type] += 1
+        estimate_kb = RESOURCE_SIZE_ESTIMATES_KB.get(resource_type, RESOURCE_SIZE_ESTIMATES_KB['other'])
+        self.estimated_bytes += estimate_kb * 1024
+
+
+class ResourceBlocker:
+    """Applies a ResourcePolicy to a BrowserContext or Page with route interception."""
+    def __init__(self, policy:ResourcePolicy):
+        self.policy = policy
+        self.stats = ResourceStats()
+
+
+    async def handle(self, route:Route):
+        """Aborts blocked requests. Everything else falls through to any other
+        route handlers before going out to the network.
+        """
+        request = route.request
+        if self.policy.is_blocked(request.resource_type, request.url):
+            self.stats.record(request.resource_type)
+            await route.abort("blockedbyclient")
+        else:
+            await route.fallback()
+
+
+    async def attach(self, target:BrowserContext|Page):
+        await target.route("**/*", self.handle)
+        return
+
+
+    def log_savings(self, spider_name:str):
+        if self.stats.total_blocked:
+            logger.info(
+                f"{spider_name}: blocked {self.stats.total_blocked} requests "
+                f"(~{self.stats.estimated_bytes / (1024 * 1024):.1f} MB) {dict(self.stats.blocked_requests)}"
+            )
+        return
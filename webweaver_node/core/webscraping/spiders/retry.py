@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+import random
+
+from webweaver_node.core.config import AIOHTTP_RETRY_BASE, AIOHTTP_RETRY_MAX_WAIT
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with jitter. The uncapped backoff for attempt n is
+    base * 2**n. Once it grows past max_wait the request is given up on.
+
+    Half of the backoff is fixed and the other half is random, so spiders that 
+    failed together do not all retry at the same moment.
+    """
+    base: float = AIOHTTP_RETRY_BASE
+    max_wait: float = AIOHTTP_RETRY_MAX_WAIT
+
+    def backoff(self, attempt:int) -> float:
+        return self.base * (2 ** attempt)
+
+    def delay(self, attempt:int) -> float | None:
+        """Returns how long to wait before retry number `attempt`, 
+        or None if we should stop retrying.
+        """
+        backoff = self.backoff(attempt)
+        if backoff > self.max_wait:
+            return None
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+
+class RetryBudget:
+    """Caps the total number of retries a spider can make in a single run,
+    so one misbehaving site can not keep a spider retrying forever.
+    """
+    def __init__(self, max_retries:int):
+        self.max_retries = max_retries
+        self.spent = 0
+
+    @property
+    def remaining(self) -> int:
+        return max(self.max_retries - self.spent, 0)
+
+    def spend(self) -> bool:
+        """Uses up one retry. Returns False if the budget is already exhausted."""
+        if self.remaining == 0:
+            return False
+        self.spent += 1
+        return True
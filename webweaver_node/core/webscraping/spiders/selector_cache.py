@@ -0,0 +1,117 @@
+from functools import lru_cache
+import logging
+
+from cssselect import HTMLTranslator, SelectorError, parse
+from cssselect.parser import CombinedSelector, Function, Pseudo, Relation
+from lxml import etree
+import soupsieve
+
+from webweaver_node.core.common.enums import ParserBackend
+from webweaver_node.core.config import SELECTOR_CACHE_SIZE
+from webweaver_node.core.exceptions import InvalidSelectorError
+
+
+logger = logging.getLogger('scraping')
+translator = HTMLTranslator()
+POSITIONAL_PSEUDO_CLASSES = frozenset({
+    'first-child', 'last-child', 'only-child', 'nth-child', 'nth-last-child',
+    'first-of-type', 'last-of-type', 'only-of-type', 'nth-of-type', 'nth-last-of-type',
+})
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def compile_selector(selector:str) -> soupsieve.SoupSieve:
+    """Compiles a CSS selector with soupsieve, once per process. Used by every
+    SpiderSoup/SpiderTag select() and select_one() call.
+    """
+    try:
+        return soupsieve.compile(selector)
+    except soupsieve.SelectorSyntaxError as e:
+        raise InvalidSelectorError(selector, str(e))
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def compile_css(selector:str, first:bool=False, scoped:bool=False) -> etree.XPath:
+    """Translates a CSS selector to a compiled XPath expression for LxmlSoup,
+    once per process.
+
+    Unscoped expressions can match the context element itself, like selecting
+    from a whole BeautifulSoup document. Scoped ones only match inside the
+    element passed as $scope, like selecting from a bs4 Tag: the rest of the
+    selector may still match the scope element and its ancestors, so 'div > p'
+    run from a div finds its p children.
+
+    cssselect spells the descendant combinator as /descendant-or-self::*/, 
+    which libxml2 has to de-duplicate; /descendant:: selects the same elements 
+    much faster. With first=True only the first match is returned.
+    """
+    try:
+        prefix = 'descendant-or-self::'
+        combined = any(isinstance(parsed.parsed_tree, CombinedSelector) for parsed in parse(selector))
+        if scoped:
+            prefix = '/descendant-or-self::' if combined else 'descendant::'
+        xpath = translator.css_to_xpath(selector, prefix=prefix).replace('/descendant-or-self::*/', '/descendant::')
+    except SelectorError as e:
+        raise InvalidSelectorError(selector, str(e))
+    if scoped and combined:
+        xpath = f"({xpath})[count(ancestor::* | $scope) = count(ancestor::*)]"  # below $scope
+    if first:
+        xpath = f"({xpath})[1]"
+    return etree.XPath(xpath)
+
+
+def _not_streamable(tree) -> str | None:
+    """Why a parsed selector can not be matched against a streamed element,
+    or None if it can. Checks inside :not() and :is() too.
+    """
+    if isinstance(tree, (CombinedSelector, Relation)):
+        return "combinators are not supported when streaming"
+    if isinstance(tree, Pseudo) and tree.ident.lower() in POSITIONAL_PSEUDO_CLASSES:
+        return f":{tree.ident} is not supported when streaming"
+    if isinstance(tree, Function) and tree.name.lower() in POSITIONAL_PSEUDO_CLASSES:
+        return f":{tree.name}() is not supported when streaming"
+    children = [getattr(tree, 'selector', None), getattr(tree, 'subselector', None), *getattr(tree, 'selector_list', [])]
+    for child in children:
+        if child is not None and (reason := _not_streamable(child)):
+            return reason
+    return None
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def compile_match(selector:str) -> etree.XPath:
+    """Compiles a CSS selector into an XPath test of the element itself, for
+    StreamParser. Only compound selectors are supported (ie: 'div.product', 
+    'li[data-sku], tr.row'), since the streamed tree has no reliable ancestors
+    or preceding siblings. That rules out combinators (' ', '>', '+', '~') and
+    positional pseudo-classes such as :nth-child() and :first-child.
+    """
+    try:
+        for parsed in parse(selector):
+            if reason := _not_streamable(parsed.parsed_tree):
+                raise InvalidSelectorError(selector, reason)
+        return etree.XPath(translator.css_to_xpath(selector, prefix='self::'))
+    except SelectorError as e:
+        raise InvalidSelectorError(selector, str(e))
+
+
+def selector_strings(selectors:type) -> dict[str, str]:
+    """The CSS selector strings declared on a spider's Selectors class."""
+    return {
+        name: value for name, value in vars(selectors).items()
+        if not name.startswith('_') and isinstance(value, str)
+    }
+
+
+def compile_selectors(selectors:type, backend:ParserBackend=ParserBackend.BS4) -> int:
+    """Validates and compiles every selector on a spider's Selectors class for
+    its parser backend, so a typo fails when the spider module is imported
+    rather than halfway through a scrape. Returns the number compiled.
+    """
+    compile = compile_css if backend == ParserBackend.LXML else compile_selector
+    strings = selector_strings(selectors)
+    for name, selector in strings.items():
+        try:
+            compile(selector)
+        except InvalidSelectorError as e:
+            raise InvalidSelectorError(selector, f"{selectors.__name__}.{name}: {e.error_details}")
+    return len(strings)
@@ -1,10 +1,12 @@
 from bs4 import BeautifulSoup, Tag
 from bs4 import FeatureNotFound, ParserRejectedMarkup
+from bs4.element import ResultSet
 import logging
 import re
 from typing import Optional
 
 from webweaver_node.core.exceptions import BadMarkupError
+from webweaver_node.core.webscraping.spiders.selector_cache import compile_selector
 
 
 logger = logging.getLogger('scraping')
@@ -15,7 +17,26 @@ class SoupRegex:
     email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
 
 
-class SpiderTag(Tag):
+class CompiledSelect:
+    """Routes select() and select_one() through the per-process compiled
+    selector cache instead of having soupsieve re-parse the selector string 
+    on every call. Namespaced selectors and extra soupsieve options fall back 
+    to BeautifulSoup's own implementation.
+    """
+
+    def select(self, selector:str, namespaces:dict=None, limit:int=None, **kwargs):
+        if namespaces is None and not kwargs and '|' not in selector:
+            return ResultSet(None, compile_selector(selector).select(self, limit or 0))
+        return super().select(selector, namespaces, limit, **kwargs)
+
+
+    def select_one(self, selector:str, namespaces:dict=None, **kwargs):
+        if namespaces is None and not kwargs and '|' not in selector:
+            return compile_selector(selector).select_one(self)
+        return super().select_one(selector, namespaces, **kwargs)
+
+
+class SpiderTag(CompiledSelect, Tag):
 
     def flatten_html(self) -> str:
         """Return a flat string of the BeautifulSoup object or HTML Element
@@ -95,7 +116,7 @@ class SpiderTag(Tag):
             return default
 
 
-class SpiderSoup(BeautifulSoup):
+class SpiderSoup(CompiledSelect, BeautifulSoup):
 
     regex = SoupRegex
 
@@ -1,10 +1,11 @@
-from typing import Any, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, TYPE_CHECKING
 
 from webweaver_node.core.exceptions import WebScrapingError
 from webweaver_node.core.common.enums import LogLevel
-from webweaver_node.core.webscraping.spiders.spider_page import RequestContextInterface
+from webweaver_node.core.webscraping.middleware.spider_request import SpiderRequest
 
 if TYPE_CHECKING:
+    from webweaver_node.core.webscraping.spiders.spider_page import RequestContextInterface
     from webweaver_node.core.webscraping.spiders.spider_base import Spider
 
 
@@ -19,10 +20,22 @@ class SpiderAPI:
     def log(self, e:WebScrapingError=None, level:LogLevel=LogLevel.ERROR):
         return self.spider.module_logger.log(e, level)
 
-    async def call_middleware(self, response:Any, request_interface:RequestContextInterface=None):
-        await self.spider.middleware_api.handle_response(
-            response=response, 
+
+
+    async def execute(
+            self,
+            request:SpiderRequest,
+            send:Callable[[SpiderRequest], Awaitable[Any]],
+            request_interface:"RequestContextInterface"=None,
+    ) -> Any:
+        """Sends the request through the request and response middleware chains.
+        Spiders built without a MiddlewareAPI just send it.
+        """
+        if self.spider.middleware_api is None:
+            return await send(request)
+        return await self.spider.middleware_api.execute(
+            request=request,
+            send=send,
             spider_api=self,
-            request_interface=request_interface
+            request_interface=request_interface,
         )
-
@@ -3,7 +3,7 @@ import asyncio
 import logging
 
 import random
-from typing import TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 import ua_generator
 import validators
 
@@ -11,20 +11,27 @@ from playwright.async_api._generated import Playwright as AsyncPlaywright
 from typing import Optional
 
 from webweaver_node.core.exceptions import BadMarkupError
-from webweaver_node.core.config import SENTINEL
-from webweaver_node.core.common.enums import SpiderState
+from webweaver_node.core.config import SENTINEL, SPIDER_RETRY_BUDGET
+from webweaver_node.core.common.enums import SpiderState, ParserBackend
 from webweaver_node.core.webscraping.spiders.aiohttp_api import AiohttpAPI
 from webweaver_node.core.webscraping.fuzzy_matching.fuzzy_handler import FuzzyHandler
+from webweaver_node.core.webscraping.metrics.metrics import parse_seconds
 from webweaver_node.core.webscraping.spiders.playwright_api import PlaywrightAPI
 from webweaver_node.core.webscraping.spiders.spider_api import SpiderAPI
 from webweaver_node.core.webscraping.spiders.spider_error import SpiderError
 from webweaver_node.core.webscraping.spiders.module_logger import SpiderModuleLog
 from webweaver_node.core.webscraping.spiders.spider_regex import SpiderRegex
 from webweaver_node.core.webscraping.spiders.soup_base import SpiderSoup
+from webweaver_node.core.webscraping.spiders.lxml_soup import LxmlSoup
+from webweaver_node.core.webscraping.spiders.parsers import make_soup
+from webweaver_node.core.webscraping.spiders.selector_cache import compile_selectors
+from webweaver_node.core.webscraping.spiders.parse_pool import parse_pool, FieldSelector
 from webweaver_node.core.webscraping.middleware.middleware_manager import MiddlewareAPI
 from webweaver_node.core.webscraping.proxy.proxy_session import ProxySession
 from webweaver_node.core.webscraping.proxy.proxy_manager import ProxyAPI
-from webweaver_node.core.webscraping.registry.scraping_registry import scraping_registry, SpiderState
+from webweaver_node.core.webscraping.registry.scraping_registry import ScrapingRegistry
+from webweaver_node.core.webscraping.session.session_pool import SessionAPI
+from webweaver_node.core.webscraping.spiders.browser_pool import BrowserPool
 
 
 if TYPE_CHECKING:
@@ -38,14 +45,33 @@ class Spider:
     """Base class for all webscraping spiders"""
     session = None
     url = None
+    selectors = None  # the module's {Name}Selectors class, compiled when the spider class is created
+    priority = 0  # SpiderScheduler launches lower values first
+    retry_budget = SPIDER_RETRY_BUDGET  # max HTTP retries per run
+    parser_backend = ParserBackend.BS4  # ParserBackend.LXML for the faster lxml/cssselect engine
+    use_cache = True  # serve this spider's requests through the HttpCache when HTTP_CACHE_MODE is on
+    cache_ttl = None  # seconds cached pages are served without revalidating, None uses HTTP_CACHE_TTL
+
+    def __init_subclass__(cls, **kwargs):
+        """Validates and compiles the spider's Selectors class as soon as the 
+        spider module is imported. Raises InvalidSelectorError on a bad selector.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls.selectors is not None:
+            count = compile_selectors(cls.selectors, cls.parser_backend)
+            logger.debug(f"{cls.__name__}: compiled {count} selectors")
+
 
     def __init__(
             self,
-            spider_asset:SpiderAsset,
+            spider_asset:"SpiderAsset",
             middleware_api:MiddlewareAPI,
             proxy_api:ProxyAPI,
             p:Optional[AsyncPlaywright]=None,
             test_env:bool = False,
+            browser_pool:Optional[BrowserPool]=None,
+            session_api:Optional[SessionAPI]=None,
+            scraping_registry:Optional[ScrapingRegistry]=None,
     ):
         self.ua:str = ua_generator.generate(device="desktop").text
         self.headers:dict = self.create_headers()
@@ -58,9 +84,12 @@ class Spider:
         self.module_logger = SpiderModuleLog(spider_asset.module_dir_path(), spider_asset.spider_name)
         self.middleware_api = middleware_api
         self.proxy_api = proxy_api
+        self.scraping_registry = scraping_registry
         self.spider_api = SpiderAPI(self)
         self.fuzzy_handler = FuzzyHandler
         self.p = p
+        self.session_api = session_api
+        self.browser_pool = browser_pool
         self.aio = AiohttpAPI(self) 
         self.playwright = PlaywrightAPI(self)
 
@@ -116,7 +145,7 @@ class Spider:
             "Accept-Encoding": "gzip, deflate, br",
             "Accept-Language": "en-US,en;q=0.9",
             "DNT": "1",  # Do Not Track Request Header
-            "Connection": "close",
+            "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",   
         }
         return headers
@@ -131,7 +160,7 @@ class Spider:
 
     def get_params(self) -> dict[str, str]:
         """Retrieves the spider's params from the registry."""
-        return scraping_registry.registry[self.spider_id].params
+        return self.scraping_registry.registry[self.spider_id].params
 
 
     def soup_check(self, soup:SpiderSoup):
@@ -140,8 +169,13 @@ class Spider:
             f.write(soup.prettify())
 
 
-    def get_soup(self, markup:str|bytes, **kwargs) -> SpiderSoup|None:
-        """Instantiates the SpiderSoup object.
+    def _time_parse(self):
+        return parse_seconds.time(spider_name=self.spider_asset.spider_name, backend=self.parser_backend.value)
+
+
+    def get_soup(self, markup:str|bytes, **kwargs) -> SpiderSoup|LxmlSoup|None:
+        """Instantiates the SpiderSoup object, or the LxmlSoup object if 
+        the spider's parser_backend is ParserBackend.LXML
 
         Logs error if SpiderSoup fails
         to instantiate.
@@ -149,15 +183,48 @@ class Spider:
         soup = None
         spider_name = self.__class__.__name__
         try:
-            soup = SpiderSoup(spider_name=spider_name, markup=markup, features='lxml', **kwargs)
+            with self._time_parse():
+                soup = make_soup(spider_name, markup, self.parser_backend, **kwargs)
         except BadMarkupError as e:
             self.log(f"{e.__class__.__name__}({e.spider_name}): {e.error_details}")
         return soup
 
 
+    async def extract_soup(self, markup:str|bytes, extractor:Callable[[SpiderSoup | LxmlSoup], Any]) -> Any:
+        """Builds the SpiderSoup and runs extractor(soup) in the ParsePool, 
+        keeping large pages from blocking the event loop. The extractor must be
+        a module-level function that returns picklable data (dicts, lists, strings).
+
+        Logs error and returns None if SpiderSoup fails to instantiate.
+        """
+        try:
+            with self._time_parse():
+                return await parse_pool.extract(self.__class__.__name__, markup, extractor, self.parser_backend)
+        except BadMarkupError as e:
+            self.log(f"{e.__class__.__name__}({e.spider_name}): {e.error_details}")
+
+
+    async def select_fields(self, markup:str|bytes, fields:dict[str, FieldSelector]) -> dict[str, str | None] | None:
+        """Extracts a dict of fields from the markup in the ParsePool. Each field 
+        is a CSS selector (element text) or a (selector, attribute) pair:
+
+            await self.select_fields(html, {
+                "name": "h1.product-title",
+                "image": ("img.product-image", "src"),
+            })
+
+        Logs error and returns None if SpiderSoup fails to instantiate.
+        """
+        try:
+            with self._time_parse():
+                return await parse_pool.select_fields(self.__class__.__name__, markup, fields, self.parser_backend)
+        except BadMarkupError as e:
+            self.log(f"{e.__class__.__name__}({e.spider_name}): {e.error_details}")
+
+
     def get_state(self) -> SpiderState:
         """Gets the current state of the spider in the spider registry."""
-        return scraping_registry.get_spider_state(self.spider_id)
+        return self.scraping_registry.get_spider_state(self.spider_id)
 
 
     def shuffle(self, list_to_shuffle:list) -> None:
@@ -172,7 +239,7 @@ class Spider:
         """Checks the spider's state and returns False if it is
         any other state besides 'RUNNING'.
         """
-        if self.spider_state() == SpiderState.RUNNING:
+        if self.get_state() == SpiderState.RUNNING:
             return True
         return False
 
@@ -188,7 +255,7 @@ class Spider:
             "Accept-Encoding": "gzip, deflate, br",
             "Accept-Language": "en-US,en;q=0.9",
             "DNT": "1",  # Do Not Track Request Header
-            "Connection": "close",
+            "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",   
         }
         return headers
@@ -1,5 +1,6 @@
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import time
 from typing import Any
 
 
@@ -11,3 +12,4 @@ class SpiderData:
     """
     data: dict[str, Any]
     spider_id: int
+    enqueued_at: float = field(default_factory=time.monotonic)  # for measuring time spent in the queues
@@ -1,16 +1,23 @@
 import asyncio
+from collections import Counter
 import logging
 from datetime import datetime, timezone
 from playwright.async_api import async_playwright
 
+from webweaver_node.core.common.enums import SpiderEngine
 from webweaver_node.core.config import SENTINEL, ACCEPTABLE_SPIDER_DURATION
-from webweaver_node.core.webscraping.spiders.models import SpiderAsset, SpiderError
+from webweaver_node.core.webscraping.spiders.models import SpiderAsset, SpiderFailure
 from webweaver_node.core.exceptions import BrokenSpidersError, WebScrapingError
 from webweaver_node.core.webscraping.middleware.middleware_manager import MiddlewareAPI
 from webweaver_node.core.webscraping.proxy.proxy_manager import ProxyAPI
+from webweaver_node.core.webscraping.registry.scraping_registry import ScrapingRegistry
+from webweaver_node.core.webscraping.session.session_pool import SessionAPI
 from webweaver_node.core.webscraping.spiders.spider_base import Spider
+from webweaver_node.core.webscraping.spiders.browser_pool import BrowserPool
+from webweaver_node.core.webscraping.spiders.http_cache import http_cache
 from webweaver_node.core.webscraping.spiders.playwright_api import PlaywrightAPI
 from webweaver_node.core.webscraping.spiders.spider_data import SpiderData
+from webweaver_node.core.webscraping.spiders.spider_scheduler import SpiderScheduler
 
 
 logger = logging.getLogger("scraping")
@@ -31,18 +38,24 @@ class SpiderLauncher:
     def __init__(
             self, 
             queue:asyncio.Queue, 
-            spiders:list[SpiderAsset],
+            scraping_registry:ScrapingRegistry,
             middleware_api:MiddlewareAPI,
             proxy_api:ProxyAPI,
+            session_api:SessionAPI=None,
             ):
-        self.spiders = spiders
+        self.scraping_registry = scraping_registry
+        self.spiders = scraping_registry.spiders
         self.spider_count = len(self.spiders)
         self.broken_spiders:list[BrokenSpider] = []
         self.middleware_api = middleware_api
         self.proxy_api = proxy_api
+        self.session_api = session_api
         self.p = None  # AyncPlaywright
+        self.browser_pool:BrowserPool = None
         self.queue = queue
         self.sentinel = SENTINEL
+        self.scheduler = SpiderScheduler()
+        self.items_scraped:Counter[int] = Counter()
 
 
     def spider_broke(self, spider_asset_id:int, error:WebScrapingError):
@@ -62,6 +75,7 @@ class SpiderLauncher:
         if bool(data):
             sd = SpiderData(data=data, spider_id=spider_id)
             await self.queue.put(sd)
+            self.items_scraped[spider_id] += 1
         return
 
 
@@ -72,11 +86,12 @@ class SpiderLauncher:
 
 
     async def start_playwright(self):
-        """Launches Async Playwright and returns its instance. Each 
-        spider will create its own browser/context/pages, but the 
-        SpiderLauncher will start/stop Playwright. 
+        """Launches Async Playwright and the BrowserPool. Each spider borrows
+        a pooled browser and creates its own contexts/pages, but the 
+        SpiderLauncher will start/stop Playwright and the browsers. 
         """
         self.p = await async_playwright().start()
+        self.browser_pool = BrowserPool(self.p)
         logger.debug("Playwright starting...")
         return
 
@@ -96,26 +111,41 @@ class SpiderLauncher:
         return
 
 
+    def schedule_spiders(self):
+        """Submits every spider to the SpiderScheduler, along with its engine 
+        and priority. Spiders whose module can not be found are skipped, 
+        SpiderAsset.get_spider() has already logged the error.
+        """
+        for sa in self.spiders:
+            SpiderClass = sa.get_spider()
+            if SpiderClass is None:
+                continue
+            engine = SpiderEngine.PLAYWRIGHT if self.is_playwright_spider(SpiderClass) else SpiderEngine.AIOHTTP
+            self.scheduler.submit(sa, engine=engine, priority=SpiderClass.priority)
+        return
+
+
     async def launch(self): 
-        """Iterates through all the spiders and calls launch_spider()"""
-        tasks = []
+        """Schedules all the spiders and calls launch_spider() on each of 
+        them as the SpiderScheduler's concurrency limits allow.
+        """
         await self.start_playwright()
-        start_time = datetime.now()
-        logger.info(f"{start_time.strftime('%H:%M:%S.%f')} Launching {len(self.spiders)} spiders...")
-        for spider in self.spiders:
-            task = asyncio.create_task(self.launch_spider(spider))
-            logger.debug(f">>>> {spider.spider_name}Spider launched")
-            tasks.append(task)
-        # await asyncio.gather(*tasks, return_exceptions=RETURN_EXCEPTIONS)
-        await asyncio.gather(*tasks, return_exceptions=False)
-        await self.close_queue()
-        self.record_timing(start_time)
-        if len(self.broken_spiders) > 0:
-            self.log_errors()
-            await self.record_errors()
-        else:
-            logger.info(f"Broken spiders: 0")
-        await self.stop_playwright()
+        try:
+            start_time = datetime.now()
+            logger.info(f"{start_time.strftime('%H:%M:%S.%f')} Launching {len(self.spiders)} spiders...")
+            self.schedule_spiders()
+            await self.scheduler.run(self.launch_spider)
+            await self.close_queue()
+            self.record_timing(start_time)
+            if http_cache.enabled:
+                logger.info(f"HttpCache: {http_cache.stats}")
+            if len(self.broken_spiders) > 0:
+                self.log_errors()
+                await self.record_errors()
+            else:
+                logger.info(f"Broken spiders: 0")
+        finally:
+            await self.stop_playwright()
         return
 
 
@@ -126,23 +156,30 @@ class SpiderLauncher:
         """
         SpiderClass = sa.get_spider()
         if SpiderClass is not None:
-            p = self.p if self.is_playwright_spider(SpiderClass) else None
+            is_playwright = self.is_playwright_spider(SpiderClass)
             spider:Spider = SpiderClass(
                 spider_asset = sa,
                 middleware_api = self.middleware_api,
                 proxy_api = self.proxy_api,
-                p=p
+                scraping_registry = self.scraping_registry,
+                session_api = self.session_api,
+                p = self.p if is_playwright else None,
+                browser_pool = self.browser_pool if is_playwright else None,
             )
-            async for scraped_data in spider.run():
-                if spider.check_state():
-                    await self.send_to_queue(
-                        spider_id=sa.id, 
-                        data=scraped_data
-                    )
-                else:
-                    logger.warning(f"{sa.spider_name} SpiderState: {spider.get_state().value}")
-                    await spider.aio.close_session()                    
-                    return spider.sentinel
+            try:
+                async for scraped_data in spider.run():
+                    if spider.check_state():
+                        await self.send_to_queue(
+                            spider_id=sa.id, 
+                            data=scraped_data
+                        )
+                    else:
+                        logger.warning(f"{sa.spider_name} SpiderState: {spider.get_state().value}")
+                        return spider.sentinel
+            finally:
+                await spider.aio.close_session()
+                if is_playwright:
+                    await spider.close_contexts()
         return
 
 
@@ -153,6 +190,8 @@ class SpiderLauncher:
 
     async def stop_playwright(self):
         """Shuts down playwright and the webdriver"""
+        if self.browser_pool is not None:
+            await self.browser_pool.close()
         if self.p is not None:
             logger.debug("Playwright stopped")
             await self.p.stop()
@@ -167,11 +206,11 @@ class SpiderLauncher:
 
 
     async def record_errors(self):
-        """Creates a SpiderError object in the DB for each of 
+        """Creates a SpiderFailure object in the DB for each of 
         the spiders in self.broken_spiders
         """
-        spider_errors = [SpiderError(spider_id_id=bs.spider_asset_id, error=bs.error, date_logged=bs.time) for bs in self.broken_spiders]
-        await SpiderError.bulk_create(spider_errors)
+        spider_failures = [SpiderFailure(spider_id_id=bs.spider_asset_id, error_type=bs.error, date_logged=bs.time) for bs in self.broken_spiders]
+        await SpiderFailure.bulk_create(spider_failures)
         return
 
 
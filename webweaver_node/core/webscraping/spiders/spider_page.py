@@ -1,14 +1,21 @@
 import logging
 import random
-from typing import TYPE_CHECKING
+from typing import Awaitable, Callable, TYPE_CHECKING
 
 from playwright._impl._errors import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import (
     Page, 
     BrowserContext,
+    CDPSession,
     ElementHandle, 
+    Error as PlaywrightError,
     Response as ResponsePlaywright
 )
+from webweaver_node.core.config import (
+    BROWSER_CONTEXT_MAX_PAGES, 
+    BROWSER_CONTEXT_MAX_MEMORY_MB, 
+    BROWSER_CONTEXT_MEMORY_CHECK_INTERVAL,
+)
 from webweaver_node.core.exceptions import SpiderHttpError
 from webweaver_node.core.webscraping.spiders.playwright_navigation import PlaywrightNavigation
 from webweaver_node.core.webscraping.spiders.dom import (
@@ -16,7 +23,9 @@ from webweaver_node.core.webscraping.spiders.dom import (
     Cursor,
     Scroll
 )
-from webweaver_node.core.webscraping.middleware.decorators import response_middleware
+
+
+from webweaver_node.core.webscraping.spiders.resource_policy import ResourceBlocker, ResourcePolicy
 
 
 if TYPE_CHECKING:
@@ -58,18 +67,33 @@ class SpiderContext():
     When using a proxy in Playwright, the proxy is passed into the BrowserContext object
     upon instantiation. The SpiderContext object will keep the ProxySession object for
     as long as the session is needed.
+
+    If a context_factory is given, the underlying BrowserContext is recycled after
+    BROWSER_CONTEXT_MAX_PAGES pages or once its pages use more than 
+    BROWSER_CONTEXT_MAX_MEMORY_MB of JS heap. New pages go to a fresh BrowserContext
+    and the old one is closed as soon as its pages are. The JS heap is only 
+    measured every BROWSER_CONTEXT_MEMORY_CHECK_INTERVAL pages, through one 
+    CDP session per page that is kept open for the next checks.
     """
     def __init__(
             self, 
             spider: "Spider",
             context:BrowserContext,
             request_context:RequestContext|None=None,
-            proxy:"ProxySession"|None=None,
+            proxy:"ProxySession | None"=None,
+            context_factory:Callable[[], Awaitable[BrowserContext]]|None=None,
+            resource_blocker:ResourceBlocker|None=None,
         ):
         self.spider = spider
         self.context = context
         self.proxy = proxy
         self.request_context = request_context
+        self.context_factory = context_factory
+        self.resource_blocker = resource_blocker
+        self.pages_opened = 0
+        self.memory_checked_at = 0  # pages_opened at the last JS heap check
+        self.cdp_sessions:dict[Page, CDPSession] = {}
+        self.retired_contexts:list[BrowserContext] = []
         if self.request_context:
             self.request_interface = RequestContextInterface(request_context)
         else:
@@ -79,9 +103,104 @@ class SpiderContext():
     def is_stateful(self) -> bool:
         return self.request_context is not None
 
+
+    async def memory_mb(self) -> float:
+        """JS heap used by the context's open pages, in MB. Only Chromium 
+        exposes this (via CDP), other engines always return 0.
+        """
+        browser = self.context.browser
+        if browser is None or browser.browser_type.name != "chromium":
+            return 0.0
+        for page in [page for page in self.cdp_sessions if page.is_closed()]:
+            del self.cdp_sessions[page]
+        used = 0
+        for page in self.context.pages:
+            try:
+                cdp = await self._cdp_session(page)
+                metrics = await cdp.send("Performance.getMetrics")
+            except PlaywrightError:  # the page closed in the meantime
+                self.cdp_sessions.pop(page, None)
+                continue
+            used += next((m['value'] for m in metrics['metrics'] if m['name'] == 'JSHeapUsedSize'), 0)
+        return used / (1024 * 1024)
+
+
+    async def _cdp_session(self, page:Page) -> CDPSession:
+        """The page's CDP session with the Performance domain enabled, opened once per page."""
+        cdp = self.cdp_sessions.get(page)
+        if cdp is None:
+            cdp = await self.context.new_cdp_session(page)
+            await cdp.send("Performance.enable")
+            self.cdp_sessions[page] = cdp
+        return cdp
+
+
+    async def _detach_cdp_sessions(self):
+        for cdp in self.cdp_sessions.values():
+            try:
+                await cdp.detach()
+            except PlaywrightError:
+                pass
+        self.cdp_sessions = {}
+        return
+
+
+    async def should_recycle(self) -> bool:
+        if self.context_factory is None:
+            return False
+        if self.pages_opened >= BROWSER_CONTEXT_MAX_PAGES:
+            return True
+        if self.pages_opened - self.memory_checked_at < BROWSER_CONTEXT_MEMORY_CHECK_INTERVAL:
+            return False
+        self.memory_checked_at = self.pages_opened
+        return await self.memory_mb() >= BROWSER_CONTEXT_MAX_MEMORY_MB
+
+
+    async def recycle(self):
+        """Swap in a fresh BrowserContext for new pages."""
+        logger.debug(f"Recycling BrowserContext after {self.pages_opened} pages")
+        await self._detach_cdp_sessions()
+        self.retired_contexts.append(self.context)
+        self.context = await self.context_factory()
+        self.pages_opened = 0
+        self.memory_checked_at = 0
+        await self._close_idle_retired()
+        return
+
+
+    async def _close_idle_retired(self):
+        """Closes retired BrowserContexts that no longer have any open pages."""
+        still_open = []
+        for context in self.retired_contexts:
+            if context.pages:
+                still_open.append(context)
+            else:
+                await context.close()
+        self.retired_contexts = still_open
+        return
+
+
+    async def close(self):
+        """Closes the BrowserContext and any retired ones still open, and 
+        hands its sticky proxy endpoint back to the ProxyManager.
+        """
+        self.cdp_sessions = {}  # closed along with their pages
+        for context in [*self.retired_contexts, self.context]:
+            await context.close()
+        self.retired_contexts = []
+        if self.proxy is not None:
+            await self.proxy.release()
+        return
+
+
     async def new_spider_page(self) -> "SpiderPage":
         """Create a new SpiderPage object, controlled by this SpiderContext."""
+        if await self.should_recycle():
+            await self.recycle()
+        else:
+            await self._close_idle_retired()
         page = await self.context.new_page()
+        self.pages_opened += 1
         return await SpiderPage.create(
             spider = self.spider, 
             page = page, 
@@ -95,13 +214,17 @@ class SpiderContext():
             context:BrowserContext, 
             request_context:RequestContext=None,
             proxy:"ProxySession"=None, 
+            context_factory:Callable[[], Awaitable[BrowserContext]]=None,
+            resource_blocker:ResourceBlocker=None,
         ) -> "SpiderContext":
         """Factory method for creating new SpiderContext objects."""
         spider_context = SpiderContext(
             spider=spider, 
             context=context, 
             request_context=request_context,
-            proxy=proxy
+            proxy=proxy,
+            context_factory=context_factory,
+            resource_blocker=resource_blocker,
         )
         return spider_context
 
@@ -115,19 +238,36 @@ class SpiderPage():
         self.config = PageConfig(self.page)
         self.cursor = Cursor(self.page)
         self.scroll = Scroll(self.page)
-        self.navigation = PlaywrightNavigation(self.spider.spider_api, self.page)
+        self.navigation = PlaywrightNavigation(
+            self.spider.spider_api, 
+            self.page, 
+            proxy=spider_context.proxy if spider_context else None,
+        )
+        self.resource_blocker:ResourceBlocker = None
 
 
     @staticmethod
     async def create(spider:"Spider", page:Page, spider_context:SpiderContext) ->"SpiderPage":
         """Factory method for creating new SpiderPage objects 
-        while avoiding having to make the init function async
+        while avoiding having to make the init function async.
+        Pages created from a SpiderContext are already configured
+        by their BrowserContext.
         """
         spider_page = SpiderPage(spider, page, spider_context)
-        await spider_page.config.set_page_config()
+        if spider_context is None:
+            await spider_page.config.set_page_config()
         return spider_page
 
 
+    async def block_resources(self, policy:ResourcePolicy) -> ResourceBlocker:
+        """Applies a ResourcePolicy to this page only. Page routes run before the
+        context's routes, so this takes precedence over the SpiderContext's policy.
+        """
+        self.resource_blocker = ResourceBlocker(policy)
+        await self.resource_blocker.attach(self.page)
+        return self.resource_blocker
+
+
     async def check_element(self, element:ElementHandle, timeout:float=100000, **kwargs) -> ElementHandle|None:
         """Check if an element exists. If it does, return the element. 
         Otherwise, return None.
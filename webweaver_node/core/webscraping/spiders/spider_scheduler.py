@@ -0,0 +1,165 @@
+import asyncio
+import bisect
+from collections import Counter
+from dataclasses import dataclass, field
+import itertools
+import logging
+from typing import Awaitable, Callable, TYPE_CHECKING
+
+from webweaver_node.core.common.enums import SpiderEngine
+from webweaver_node.core.config import SEMAPHORE_COUNT, PLAYWRIGHT_COUNT, AIOHTTP_COUNT, DOMAIN_COUNT
+
+if TYPE_CHECKING:
+    from webweaver_node.core.webscraping.spiders.models import SpiderAsset
+
+
+logger = logging.getLogger("scraping")
+
+
+@dataclass(order=True)
+class ScheduledSpider:
+    """Entry in the SpiderScheduler's pending queue. Ordered by priority,
+    then by submission order so equal priorities launch first-in first-out.
+    """
+    priority: int
+    sequence: int
+    spider_asset: "SpiderAsset" = field(compare=False)
+    engine: SpiderEngine = field(compare=False)
+
+    @property
+    def domain(self) -> str:
+        return self.spider_asset.domain
+
+
+@dataclass
+class SchedulerMetrics:
+    """Point-in-time snapshot of the SpiderScheduler's queue."""
+    pending: int
+    running: int
+    completed: int
+    running_by_engine: dict[str, int]
+    running_by_domain: dict[str, int]
+
+
+class SpiderScheduler:
+    """Launches spiders from a priority queue while enforcing a global limit,
+    a per-engine limit (aiohttp vs Playwright) and a per-domain limit on the
+    number of spiders running at once.
+
+    A spider is only dispatched once all three limits have room for it, so a
+    spider waiting on a busy domain never holds a slot that another domain
+    could use.
+    """
+    def __init__(
+            self,
+            max_running:int=SEMAPHORE_COUNT,
+            engine_limits:dict[SpiderEngine, int]=None,
+            domain_limit:int=DOMAIN_COUNT,
+    ):
+        self.max_running = max_running
+        self.engine_limits = engine_limits or {
+            SpiderEngine.AIOHTTP: AIOHTTP_COUNT,
+            SpiderEngine.PLAYWRIGHT: PLAYWRIGHT_COUNT,
+        }
+        self.domain_limit = domain_limit
+        self.pending:list[ScheduledSpider] = []
+        self.running = 0
+        self.completed = 0
+        self.running_by_engine:Counter[SpiderEngine] = Counter()
+        self.running_by_domain:Counter[str] = Counter()
+        self.condition = asyncio.Condition()
+        self._sequence = itertools.count()
+
+
+    def submit(self, spider_asset:"SpiderAsset", engine:SpiderEngine, priority:int=0) -> ScheduledSpider:
+        """Add a spider to the pending queue. Lower priority values launch first."""
+        scheduled = ScheduledSpider(
+            priority=priority,
+            sequence=next(self._sequence),
+            spider_asset=spider_asset,
+            engine=engine,
+        )
+        bisect.insort(self.pending, scheduled)
+        return scheduled
+
+
+    def metrics(self) -> SchedulerMetrics:
+        """Returns the current queue depth and running counts."""
+        return SchedulerMetrics(
+            pending=len(self.pending),
+            running=self.running,
+            completed=self.completed,
+            running_by_engine={engine.value: count for engine, count in self.running_by_engine.items() if count},
+            running_by_domain={domain: count for domain, count in self.running_by_domain.items() if count},
+        )
+
+
+    def _has_capacity(self, scheduled:ScheduledSpider) -> bool:
+        """Checks the global, engine and domain limits for this spider."""
+        if self.running >= self.max_running:
+            return False
+        if self.running_by_engine[scheduled.engine] >= self.engine_limits.get(scheduled.engine, self.max_running):
+            return False
+        return self.running_by_domain[scheduled.domain] < self.domain_limit
+
+
+    def _next_runnable(self) -> ScheduledSpider | None:
+        """Pops the highest priority pending spider that fits within the limits."""
+        for i, scheduled in enumerate(self.pending):
+            if self._has_capacity(scheduled):
+                return self.pending.pop(i)
+        return None
+
+
+    def _acquire(self, scheduled:ScheduledSpider):
+        self.running += 1
+        self.running_by_engine[scheduled.engine] += 1
+        self.running_by_domain[scheduled.domain] += 1
+
+
+    def _release(self, scheduled:ScheduledSpider):
+        self.running -= 1
+        self.completed += 1
+        self.running_by_engine[scheduled.engine] -= 1
+        self.running_by_domain[scheduled.domain] -= 1
+
+
+    async def _run_scheduled(
+            self, 
+            scheduled:ScheduledSpider, 
+            launch:Callable[["SpiderAsset"], Awaitable],
+    ):
+        """Runs one spider and frees its slots once it finishes, whether it 
+        completed or raised.
+        """
+        try:
+            return await launch(scheduled.spider_asset)
+        finally:
+            async with self.condition:
+                self._release(scheduled)
+                self.condition.notify_all()
+
+
+    async def run(self, launch:Callable[["SpiderAsset"], Awaitable]):
+        """Dispatches pending spiders as slots free up, then waits for 
+        every launched spider to finish. If a spider raises, or the run is
+        cancelled, the spiders still running are cancelled before returning.
+        """
+        tasks = []
+        try:
+            async with self.condition:
+                while self.pending:
+                    scheduled = self._next_runnable()
+                    if scheduled is None:
+                        await self.condition.wait()
+                        continue
+                    self._acquire(scheduled)
+                    task = asyncio.create_task(self._run_scheduled(scheduled, launch))
+                    tasks.append(task)
+                    logger.debug(f">>>> {scheduled.spider_asset.spider_name}Spider launched {self.metrics()}")
+            await asyncio.gather(*tasks, return_exceptions=False)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -0,0 +1,80 @@
+import logging
+
+from lxml import etree, html
+
+from webweaver_node.core.webscraping.spiders.lxml_soup import LxmlTag
+from webweaver_node.core.webscraping.spiders.selector_cache import compile_match
+
+
+logger = logging.getLogger('scraping')
+
+
+class StreamParser:
+    """Incremental HTML parser for very large listing pages. Chunks of the
+    response body are fed in as they arrive, and every element matching the
+    selector is returned as an LxmlTag as soon as its end tag has been parsed.
+
+    Matched elements are detached from the tree, and any finished element 
+    outside of a match is cleared along with its preceding siblings, so memory 
+    stays flat no matter how long the page is. Nested matches are returned as 
+    part of their outermost match.
+
+    The selector must be a compound selector, see compile_match().
+    """
+    def __init__(self, selector:str, encoding:str=None):
+        self.selector = selector
+        self.matches = compile_match(selector)
+        self.parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+        self.parser.set_element_class_lookup(html.HtmlElementClassLookup())
+        self.open_matches:list[etree._Element] = []
+        self.matched = 0
+
+
+    def feed(self, chunk:bytes|str) -> list[LxmlTag]:
+        """Parses the chunk and returns the elements completed by it."""
+        self.parser.feed(chunk)
+        return self._read_events()
+
+
+    def close(self) -> list[LxmlTag]:
+        """Finishes parsing and returns any elements left open by the markup."""
+        try:
+            self.parser.close()
+        except etree.XMLSyntaxError as e:
+            logger.warning(f"StreamParser({self.selector}): {e}")
+        return self._read_events()
+
+
+    def _read_events(self) -> list[LxmlTag]:
+        completed = []
+        for event, element in self.parser.read_events():
+            if event == 'start':
+                if self.matches(element):
+                    self.open_matches.append(element)
+                continue
+            if self.open_matches and self.open_matches[-1] is element:
+                self.open_matches.pop()
+                if not self.open_matches:
+                    completed.append(LxmlTag(self._detach(element)))
+            elif not self.open_matches:
+                self._discard(element)
+        self.matched += len(completed)
+        return completed
+
+
+    def _detach(self, element:etree._Element) -> etree._Element:
+        parent = element.getparent()
+        if parent is not None:
+            parent.remove(element)
+        return element
+
+
+    def _discard(self, element:etree._Element):
+        """Frees a finished element that is not part of a match."""
+        parent = element.getparent()
+        if parent is None:
+            return
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del parent[0]
+        return
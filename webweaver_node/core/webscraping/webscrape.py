@@ -1,29 +1,91 @@
 import asyncio
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 import logging
+import multiprocessing
+from tortoise import Tortoise
 
+from webweaver_node.core.common.enums import SpiderState
+from webweaver_node.core.config import SCRAPE_QUEUE_MAXSIZE, SCRAPE_PROCESS_COUNT, PARSE_POOL_WORKERS, TORTOISE_ORM
+from webweaver_node.core.exceptions import ScrapeProcessError
+
+from webweaver_node.core.webscraping.metrics.metrics import metrics
 from webweaver_node.core.webscraping.middleware.middleware_manager import MiddlewareManager
 from webweaver_node.core.webscraping.pipelines.pipeline_listener import PipelineListener
 from webweaver_node.core.webscraping.proxy.proxy_manager import ProxyManager
 from webweaver_node.core.schema.pydantic_schemas import LaunchSpiderSchema
 from webweaver_node.core.webscraping.registry.builders import RegistryBuilder
-from webweaver_node.core.webscraping.registry.scraping_registry import scraping_registry
-from webweaver_node.core.webscraping.spiders.spider_launcher import SpiderLauncher
+from webweaver_node.core.webscraping.registry.scraping_registry import ScrapingRegistry
+from webweaver_node.core.webscraping.replay.replay_manager import replay_manager
+from webweaver_node.core.webscraping.session.session_pool import SessionPool
+from webweaver_node.core.webscraping.spiders.module_cache import module_cache
+from webweaver_node.core.webscraping.spiders.parse_pool import parse_pool
+from webweaver_node.core.webscraping.spiders.spider_launcher import SpiderLauncher, BrokenSpider
 
 
 logger = logging.getLogger('scraping')
 
 
+@dataclass
+class SpiderProgress:
+    """How far along one spider of a scrape is."""
+    spider_id: int
+    spider_name: str
+    state: str
+    items_scraped: int
+    items_saved: int
+
+
+@dataclass
+class ShardResult:
+    """What a scrape worker process sends back to the parent once its shard
+    of spiders has finished. Everything in here must be picklable.
+    """
+    shard_id: int
+    states: dict[int, str]
+    items_scraped: dict[int, int]
+    items_saved: dict[int, int]
+    broken_spiders: list[BrokenSpider] = field(default_factory=list)
+    metrics: dict[str, dict] = field(default_factory=dict)  # MetricsRegistry.snapshot() of the worker
+
+
 class WebScrape:
     """Class for any scraping-related views/routes. Mainly created to keep
     route files clean and standardize the logic between launching spiders
     and launching campaigns.
+
+    When process_count is greater than 1 and there is more than one spider to 
+    run, the spiders are sharded across that many worker processes. Each one runs
+    its own event loop, proxy manager, Playwright instance and PipelineListener, 
+    so parsing, validation and fuzzy matching use every core instead of one.
+    Multi-spider launches (the /launch_spiders route) pass a list of 
+    LaunchSpiderSchema. The PARSE_POOL_WORKERS are split between the worker 
+    processes, rather than each one starting a full ParsePool of its own.
     """
-    def __init__(self, launch_data:LaunchSpiderSchema, use_proxy:bool):
+    def __init__(
+            self, 
+            launch_data:LaunchSpiderSchema | list[LaunchSpiderSchema], 
+            use_proxy:bool, 
+            process_count:int=SCRAPE_PROCESS_COUNT,
+            builder:RegistryBuilder=None,
+    ):
         self.launch_data = launch_data
         self.use_proxy = use_proxy
+        self.process_count = process_count
+        self.builder = builder
         self.middleware_manager = self._middleware_manager()
         self.proxy_manager = self._proxy_manager(self.use_proxy)
+        self.session_pool = self._session_pool()
         self.async_queue = self._async_queue()
+        self.scraping_registry = ScrapingRegistry()
+        self.spiders:list = []
+        self.spider_launcher:SpiderLauncher = None
+        self.pipeline_listener:PipelineListener = None
+        self.final_states:dict[int, str] = {}
+        self.items_scraped:Counter[int] = Counter()
+        self.items_saved:Counter[int] = Counter()
+        self.broken_spiders:list[BrokenSpider] = []
 
     def _proxy_manager(self, is_proxy:bool) -> ProxyManager | None:
         if is_proxy:
@@ -31,39 +93,226 @@ class WebScrape:
             logger.debug("initialized ProxyManager")
             return proxy_manager
 
+    def _session_pool(self) -> SessionPool:
+        session_pool = SessionPool()
+        logger.debug("initialized SessionPool")
+        return session_pool
+
     def _middleware_manager(self) -> MiddlewareManager:
         middleware_manager = MiddlewareManager()
         logger.debug("initialized MiddlewareManager")
         return middleware_manager
 
-    async def _build_scraping_registry(self):
+    async def _registry_builder(self) -> RegistryBuilder:
+        if self.builder is not None:
+            return self.builder
+        if isinstance(self.launch_data, list):
+            builder = RegistryBuilder()
+            await builder.initialize_multi_scrape(self.launch_data)
+            return builder
         builder = RegistryBuilder(self.launch_data)
         await builder.initialize_solo_scrape()
-        await scraping_registry.build(solospider_builder=builder)
+        return builder
+
+    async def _build_scraping_registry(self, builder:RegistryBuilder):
+        await self.scraping_registry.build(builder=builder)
         logger.debug('Scraping registry built')
 
     def _async_queue(self):
-        queue = asyncio.Queue()
+        queue = asyncio.Queue(maxsize=SCRAPE_QUEUE_MAXSIZE)
         logger.debug('initialized async queue')
         return queue
 
-    async def scrape(self):
+    def spider_state(self, spider_id:int) -> str:
+        """The spider's state in the registry, or the last state it had
+        once the registry has been cleared.
+        """
+        if spider_id in self.final_states:
+            return self.final_states[spider_id]
+        sri = self.scraping_registry.registry.get(spider_id)
+        return sri.state.value if sri else "PENDING"
+
+    def progress(self) -> list[SpiderProgress]:
+        """Returns the state and item counts of every spider in this scrape."""
+        items_scraped = self.spider_launcher.items_scraped if self.spider_launcher else self.items_scraped
+        items_saved = self.pipeline_listener.items_saved if self.pipeline_listener else self.items_saved
+        return [SpiderProgress(
+            spider_id=sa.id,
+            spider_name=sa.spider_name,
+            state=self.spider_state(sa.id),
+            items_scraped=items_scraped.get(sa.id, 0),
+            items_saved=items_saved.get(sa.id, 0),
+        ) for sa in self.spiders]
+
+    def _snapshot_states(self):
+        """Keeps the spiders' final states before the registry is cleared."""
+        self.final_states = {
+            spider_id: sri.state.value for spider_id, sri in self.scraping_registry.registry.items()
+        }
+
+    def shard_result(self, shard_id:int) -> ShardResult:
+        """Summary of this scrape, sent back to the parent by a worker process."""
+        return ShardResult(
+            shard_id=shard_id,
+            states=dict(self.final_states),
+            items_scraped=dict(self.spider_launcher.items_scraped),
+            items_saved=dict(self.pipeline_listener.items_saved),
+            broken_spiders=self.spider_launcher.broken_spiders,
+            metrics=metrics.snapshot(),
+        )
 
-        await self._build_scraping_registry()
+    def use_multiprocess(self) -> bool:
+        return self.process_count > 1 and len(self.spiders) > 1
 
+    def shard(self, spider_details:list[dict]) -> list[list[tuple[int, dict[str, str]]]]:
+        """Splits the spiders round-robin into one (spider_id, params) list per
+        worker process. SpiderAssets are not sent across, each worker fetches its own.
+        """
+        shard_count = min(self.process_count, len(spider_details))
+        pairs = [(detail['spider'].id, detail['params']) for detail in spider_details]
+        return [pairs[i::shard_count] for i in range(shard_count)]
+
+    async def scrape_in_process(self):
         sl = SpiderLauncher(
             self.async_queue, 
-            spiders=scraping_registry.spiders,
+            scraping_registry=self.scraping_registry,
             middleware_api=self.middleware_manager.middleware_api,
-            proxy_api=self.proxy_manager.proxy_api
+            proxy_api=self.proxy_manager.proxy_api if self.proxy_manager else None,
+            session_api=self.session_pool.session_api,
         )
         logger.debug('Initialized SpiderLauncher')
-        pl = PipelineListener(self.async_queue)
+        pl = PipelineListener(self.async_queue, self.scraping_registry)
         logger.debug('Initialized PipelineListener')
+        self.spider_launcher = sl
+        self.pipeline_listener = pl
+
+        await replay_manager.start()
+        try:
+            await self._run_until_first_error(sl.launch(), pl.listen())
+        finally:
+            await replay_manager.stop()
+            if self.proxy_manager:
+                await self.proxy_manager.close()
 
-        await asyncio.gather(sl.launch(), pl.listen())
+    async def _run_until_first_error(self, *coros):
+        """Runs the coroutines as tasks until they all finish or one raises.
+        The others are then cancelled, so a SpiderLauncher that fails before
+        sending the sentinel does not leave the PipelineListener waiting on
+        the queue forever.
+        """
+        tasks = [asyncio.create_task(coro) for coro in coros]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            task.result()  # re-raises the first error
+        return
 
-        await scraping_registry.finish()
+    async def scrape_multiprocess(self, spider_details:list[dict]):
+        """Runs each shard of spiders in its own worker process and waits for 
+        all of them. Worker processes are spawned rather than forked so they 
+        do not inherit this process's event loop or DB connections.
+        """
+        shards = self.shard(spider_details)
+        parse_workers = max(PARSE_POOL_WORKERS // len(shards), 1)
+        logger.info(
+            f"Sharding {len(spider_details)} spiders across {len(shards)} processes, "
+            f"with {parse_workers} parse workers each"
+        )
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(
+            max_workers=len(shards), 
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+        try:
+            results = await asyncio.gather(
+                *[loop.run_in_executor(executor, run_shard, shard_id, shard, self.use_proxy, parse_workers) 
+                  for shard_id, shard in enumerate(shards)],
+                return_exceptions=True,
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        await self.aggregate(shards, results)
 
+    async def aggregate(self, shards:list[list[tuple]], results:list[ShardResult | BaseException]):
+        """Merges the worker processes' states, item counts, broken spiders and metrics.
+        Spiders from a worker process that crashed are marked as ERROR.
+        """
+        failed = 0
+        for shard, result in zip(shards, results):
+            if isinstance(result, BaseException):
+                failed += 1
+                logger.error(f"Scrape process crashed: {result.__class__.__name__}: {result}")
+                for spider_id, _ in shard:
+                    await self.scraping_registry.set_spider_state(spider_id, SpiderState.ERROR)
+                continue
+            for spider_id, state in result.states.items():
+                await self.scraping_registry.set_spider_state(spider_id, SpiderState(state))
+            self.items_scraped.update(result.items_scraped)
+            self.items_saved.update(result.items_saved)
+            self.broken_spiders.extend(result.broken_spiders)
+            metrics.merge(result.metrics)
+
+        logger.info(f"Broken spiders across {len(shards)} processes: {len(self.broken_spiders)}")
+        if failed:
+            raise ScrapeProcessError(f"{failed} of {len(shards)} scrape processes crashed")
+        return
+
+    async def scrape(self):
+
+        builder = await self._registry_builder()
+        await self._build_scraping_registry(builder)
+        self.spiders = self.scraping_registry.spiders
+        module_cache.acquire(self.spiders)  # other jobs must not reload these modules mid-scrape
+
+        try:
+            if self.use_multiprocess():
+                await self.scrape_multiprocess(builder.spider_details)
+            else:
+                await self.scrape_in_process()
+        except asyncio.CancelledError:
+            self._snapshot_states()
+            self.scraping_registry.clear()
+            raise
+        finally:
+            module_cache.release(self.spiders)
+            await self.session_pool.close()
+
+        self._snapshot_states()
+        await self.scraping_registry.finish()
+
+
+def run_shard(
+        shard_id:int, 
+        shard:list[tuple[int, dict[str, str]]], 
+        use_proxy:bool, 
+        parse_workers:int=PARSE_POOL_WORKERS,
+) -> ShardResult:
+    """Entry point of a scrape worker process. Runs its shard of spiders
+    in a new event loop with its own DB connections, and a ParsePool of
+    parse_workers processes.
+    """
+    return asyncio.run(_run_shard(shard_id, shard, use_proxy, parse_workers))
 
 
+async def _run_shard(
+        shard_id:int, 
+        shard:list[tuple[int, dict[str, str]]], 
+        use_proxy:bool, 
+        parse_workers:int,
+) -> ShardResult:
+    parse_pool.workers = parse_workers  # the executor is only started on first use
+    await Tortoise.init(config=TORTOISE_ORM)
+    metrics.clear()  # a worker process can be reused for another shard
+    try:
+        builder = RegistryBuilder()
+        await builder.initialize_shard(shard)
+        webscrape = WebScrape(launch_data=None, use_proxy=use_proxy, process_count=1, builder=builder)
+        await webscrape.scrape()
+        return webscrape.shard_result(shard_id)
+    finally:
+        parse_pool.close()
+        await Tortoise.close_connections()
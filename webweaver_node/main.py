@@ -1,10 +1,13 @@
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from tortoise.contrib.fastapi import register_tortoise
 
 from webweaver_node.core.routes.launch_routes.routes import router as router_scrape
 from webweaver_node.core.routes.auth_routes.routes_auth import router as router_auth
-from webweaver_node.core.config import POSTGRES_DB, all_models, scraping_logger, STATIC_DIR
+from webweaver_node.core.config import TORTOISE_ORM, scraping_logger, STATIC_DIR
+from webweaver_node.core.webscraping.metrics.metrics import metrics
+from webweaver_node.core.webscraping.spiders.parse_pool import parse_pool
 
 
 # Initialize FastAPI & Routes
@@ -14,6 +17,19 @@ app.include_router(router_scrape, prefix="/scrape", tags=["webscraping"])
 app.include_router(router_auth, prefix="/auth", tags=["authentication"])
 
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics_endpoint():
+    """Scraping latencies and counters in the Prometheus text format. Async so 
+    it renders on the event loop thread, which is the only one updating metrics.
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.on_event("shutdown")
+def shutdown_parse_pool():
+    parse_pool.close()
+
+
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static") 
 # NOTE: first param on app.mount() corresponds to the href on HTML <link> elements!
 # ie: <link rel="stylesheet" href="/webweaver/css/base.css">
@@ -23,20 +39,6 @@ app.mount("/media", StaticFiles(directory="media"), name="media")
 
 # Initialize Database
 # =================================================
-TORTOISE_ORM = {
-    'connections': {
-        # 'default': config.POSTGRES_DB
-        'default': POSTGRES_DB
-    },
-    'apps': {
-        'models': {
-            # 'models': config.all_models,
-            'models': all_models,
-            'default_connection': 'default',
-        },
-    },
-}
-
 register_tortoise(
     app,
     config=TORTOISE_ORM,
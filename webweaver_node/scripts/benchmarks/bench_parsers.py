@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Compares the SpiderSoup (BeautifulSoup/soupsieve) and LxmlSoup (lxml/cssselect)
+parser backends on recorded pages.
+
+    python -m webweaver_node.scripts.benchmarks.bench_parsers pages/*.html \\
+        --selector "div.product h2" --attr "img.product-image" src --rounds 20
+
+With no pages, a synthetic product listing page is used. Results are printed
+as a table, or as JSON with --json.
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Callable
+
+from webweaver_node.core.common.enums import ParserBackend
+from webweaver_node.core.webscraping.spiders.parsers import make_soup
+
+
+DEFAULT_TEXT_SELECTORS = ["div.product h2.title", "div.product span.price", "nav.breadcrumbs a"]
+DEFAULT_ATTR_SELECTORS = [("div.product img.product-image", "src")]
+
+
+def synthetic_page(products:int=500) -> str:
+    items = "".join(
+        f'<div class="product" data-id="{i}">'
+        f'<a href="/products/{i}"><img class="product-image" src="/img/{i}.jpg"></a>'
+        f'<h2 class="title">Product {i}</h2><span class="price">${i}.99</span>'
+        f'<script>track({i})</script></div>'
+        for i in range(products)
+    )
+    return (
+        f'<html><head><title>Catalogue</title></head><body>'
+        f'<nav class="breadcrumbs"><a href="/">Home</a><a href="/shop">Shop</a></nav>'
+        f'<main>{items}</main></body></html>'
+    )
+
+
+def time_it(fn:Callable, rounds:int) -> dict[str, float]:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+    }
+
+
+def bench_backend(backend:ParserBackend, pages:list[str], text_selectors:list[str], attr_selectors:list[tuple[str, str]], rounds:int) -> dict:
+    soups = [make_soup("Benchmark", page, backend) for page in pages]
+    bodies = [soup.select_one("body") for soup in soups]  # SpiderTag/LxmlTag-only helpers
+
+    def parse():
+        for page in pages:
+            make_soup("Benchmark", page, backend)
+
+    def select_text():
+        for soup in soups:
+            for selector in text_selectors:
+                soup.select_one_text(selector)
+                [tag.text for tag in soup.select(selector)]
+
+    def select_attr():
+        for soup in soups:
+            for selector, attr in attr_selectors:
+                soup.select_one_attr(selector, attr)
+        for body in bodies:
+            for selector, attr in attr_selectors:
+                body.spider_attribute(selector, attr)
+
+    def get_hrefs():
+        for body in bodies:
+            body.get_hrefs()
+
+    def decompose():
+        for page in pages:
+            make_soup("Benchmark", page, backend).select_and_decompose("script, style")
+
+    return {
+        "parse": time_it(parse, rounds),
+        "select_text": time_it(select_text, rounds),
+        "select_attr": time_it(select_attr, rounds),
+        "get_hrefs": time_it(get_hrefs, rounds),
+        "parse_and_decompose": time_it(decompose, rounds),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SpiderSoup parser backends")
+    parser.add_argument("pages", nargs="*", help="recorded HTML pages")
+    parser.add_argument("--selector", action="append", help="CSS selector to extract text from (repeatable)")
+    parser.add_argument("--attr", nargs=2, action="append", metavar=("SELECTOR", "ATTR"), help="selector/attribute pair (repeatable)")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    pages = []
+    for path in args.pages:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            pages.append(f.read())
+    pages = pages or [synthetic_page()]
+    text_selectors = args.selector or DEFAULT_TEXT_SELECTORS
+    attr_selectors = [tuple(pair) for pair in args.attr] if args.attr else DEFAULT_ATTR_SELECTORS
+
+    results = {
+        backend.value: bench_backend(backend, pages, text_selectors, attr_selectors, args.rounds)
+        for backend in ParserBackend
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{len(pages)} page(s), {args.rounds} rounds, median (min) in ms\n")
+    print(f"{'operation':<22}" + "".join(f"{backend.value:>22}" for backend in ParserBackend))
+    for operation in results[ParserBackend.BS4.value]:
+        row = "".join(
+            f"{results[backend.value][operation]['median_ms']:>12} ({results[backend.value][operation]['min_ms']:>7})"
+            for backend in ParserBackend
+        )
+        print(f"{operation:<22}{row}")
+
+
+if __name__ == "__main__":
+    main()
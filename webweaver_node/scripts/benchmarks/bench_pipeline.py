@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""End-to-end throughput benchmark of the scrape pipeline. Synthetic spiders
+scrape product listing pages from a local fixture server and their items go
+through the real SpiderLauncher -> PipelineListener path into a SQLite database.
+
+    python -m webweaver_node.scripts.benchmarks.bench_pipeline \\
+        --spiders 8 --pages 20 --concurrency 1 4 8 --batch-sizes 1 50 \\
+        --output results/pipeline.json
+
+Every combination of --concurrency and --batch-sizes is run against a fresh
+database. For each run the fetch, parse, queue, validate and save stages are
+timed separately, next to pages/s and items/s. With --output the results are
+written as JSON, along with the git commit, so builds can be compared.
+"""
+import argparse
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import time
+
+from aiohttp import web
+from pydantic import BaseModel
+from tortoise import Tortoise, fields
+from tortoise.models import Model
+
+from webweaver_node.core.common.enums import SpiderEngine
+from webweaver_node.core.config import SCRAPE_QUEUE_MAXSIZE, PIPELINE_WORKER_COUNT
+from webweaver_node.core.webscraping.middleware.middleware_manager import MiddlewareManager
+from webweaver_node.core.webscraping.pipelines.pipeline_base import Pipeline
+from webweaver_node.core.webscraping.pipelines.pipeline_listener import PipelineListener
+from webweaver_node.core.webscraping.registry.builders import RegistryBuilder
+from webweaver_node.core.webscraping.registry.scraping_registry import ScrapingRegistry
+from webweaver_node.core.webscraping.session.session_pool import SessionPool
+from webweaver_node.core.webscraping.spiders.models import SpiderAsset
+from webweaver_node.core.webscraping.spiders.module_cache import ModuleCacheEntry, module_cache
+from webweaver_node.core.webscraping.spiders.parse_pool import parse_pool
+from webweaver_node.core.webscraping.spiders.spider_base import Spider
+from webweaver_node.core.webscraping.spiders.spider_launcher import SpiderLauncher
+from webweaver_node.core.webscraping.spiders.spider_scheduler import SpiderScheduler
+from webweaver_node.scripts.benchmarks.bench_parsers import synthetic_page
+
+
+STAGES = ("fetch", "parse", "queue", "validate", "save")
+
+
+class StageTimer:
+    """Collects the duration of every call to each pipeline stage. A call
+    can cover several items, ie: a batch being validated.
+    """
+    def __init__(self):
+        self.reset()
+
+
+    def reset(self):
+        self.samples:dict[str, list[float]] = defaultdict(list)
+        self.items:dict[str, int] = defaultdict(int)
+        self.pages = 0
+
+
+    def add(self, stage:str, seconds:float, items:int=1):
+        self.samples[stage].append(seconds)
+        self.items[stage] += items
+
+
+    @contextmanager
+    def time(self, stage:str, items:int=1):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start, items)
+
+
+    def summary(self) -> dict[str, dict]:
+        results = {}
+        for stage in STAGES:
+            samples = sorted(self.samples.get(stage, []))
+            if not samples:
+                continue
+            total = sum(samples)
+            results[stage] = {
+                "calls": len(samples),
+                "items": self.items[stage],
+                "total_s": round(total, 4),
+                "per_item_ms": round(total / self.items[stage] * 1000, 4),
+                "p50_ms": round(statistics.median(samples) * 1000, 4),
+                "p95_ms": round(samples[math.ceil(len(samples) * 0.95) - 1] * 1000, 4),
+                "max_ms": round(samples[-1] * 1000, 4),
+            }
+        return results
+
+
+timer = StageTimer()
+
+
+# Synthetic scraping module
+# =================================================
+class BenchProduct(Model):
+    spider_id = fields.IntField()
+    name = fields.CharField(max_length=255)
+    price = fields.FloatField()
+    url = fields.CharField(max_length=255)
+
+
+class BenchProductSchema(BaseModel):
+    name: str
+    price: float
+    url: str
+
+
+def extract_products(soup) -> list[dict]:
+    """Runs in the ParsePool, so it has to be a module-level function."""
+    return [{
+        "name": product.select_one_text("h2.title"),
+        "price": product.select_one_text("span.price").lstrip("$"),
+        "url": product.select_one_attr("a", "href"),
+    } for product in soup.select("div.product")]
+
+
+class BenchSpider(Spider):
+    use_cache = False
+
+    async def run(self):
+        base_url = self.params["base_url"]
+        for page in range(int(self.params["pages"])):
+            with timer.time("fetch"):
+                res = await self.aio.get(f"{base_url}/listing/{self.spider_id}/{page}", use_proxy=False)
+                markup = await res.text()
+                res.release()
+            with timer.time("parse"):
+                products = await self.extract_soup(markup, extract_products)
+            timer.pages += 1
+            for product in products or []:
+                yield product
+
+
+class BenchPipeline(Pipeline):
+    schema = BenchProductSchema
+
+    async def validate_data(self):
+        timer.add("queue", time.monotonic() - self.spider_data.enqueued_at)
+        with timer.time("validate"):
+            await super().validate_data()
+
+
+    async def validate_batch(self, batch):
+        now = time.monotonic()
+        for spider_data in batch:
+            timer.add("queue", now - spider_data.enqueued_at)
+        with timer.time("validate", items=len(batch)):
+            await super().validate_batch(batch)
+
+
+    async def save_data(self):
+        with timer.time("save"):
+            await BenchProduct.create(spider_id=self.spider_asset.id, **self.data_to_save.model_dump())
+
+
+    async def save_batch(self):
+        products = [BenchProduct(spider_id=self.spider_asset.id, **item.model_dump()) for item in self.batch_to_save]
+        with timer.time("save", items=len(products)):
+            await BenchProduct.bulk_create(products)
+
+
+# Fixture server
+# =================================================
+class FixtureServer:
+    """Serves the same synthetic listing page at /listing/{spider_id}/{page},
+    after an optional delay standing in for network latency.
+    """
+    def __init__(self, products:int, latency:float=0):
+        self.page = synthetic_page(products)
+        self.latency = latency
+        self.runner:web.AppRunner = None
+        self.base_url:str = None
+
+
+    async def handle(self, request:web.Request) -> web.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return web.Response(text=self.page, content_type="text/html")
+
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/listing/{spider_id}/{page}", self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", 0).start()
+        host, port = self.runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+# Benchmark
+# =================================================
+def tortoise_config(db_url:str) -> dict:
+    return {
+        "connections": {"default": db_url},
+        "apps": {
+            "models": {
+                "models": ["webweaver_node.core.webscraping.spiders.models", __name__],
+                "default_connection": "default",
+            },
+        },
+    }
+
+
+def register_module(spider_asset:SpiderAsset):
+    """Puts the synthetic Spider and Pipeline in the ModuleCache, in place
+    of a scraping module directory.
+    """
+    os.makedirs(spider_asset.module_dir_path(), exist_ok=True)  # for the spider's SpiderModuleLog
+    module_cache.entries[spider_asset.spider_name] = ModuleCacheEntry(
+        SpiderClass=BenchSpider,
+        PipelineClass=BenchPipeline,
+        config={},
+        config_error=None,
+        schema=BenchPipeline.schema,
+        mtime=module_cache._mtime(spider_asset),
+    )
+
+
+async def run_once(
+        base_url:str,
+        db_url:str,
+        spiders:int,
+        pages:int,
+        concurrency:int,
+        batch_size:int,
+        workers:int,
+) -> dict:
+    await Tortoise.init(config=tortoise_config(db_url))
+    await Tortoise.generate_schemas()
+    spider_assets = []
+    try:
+        builder = RegistryBuilder()
+        for i in range(spiders):
+            spider_asset = await SpiderAsset.create(
+                spider_name=f"Benchmark{i}",
+                domain=f"benchmark{i}.test",
+                description="bench_pipeline synthetic spider",
+            )
+            spider_assets.append(spider_asset)
+            register_module(spider_asset)
+            builder.spider_asset = spider_asset
+            builder.params = {"base_url": base_url, "pages": str(pages)}
+            builder.build_spider_details()
+        scraping_registry = ScrapingRegistry()
+        await scraping_registry.build(builder=builder)
+
+        queue = asyncio.Queue(maxsize=SCRAPE_QUEUE_MAXSIZE)
+        session_pool = SessionPool()
+        sl = SpiderLauncher(
+            queue,
+            scraping_registry=scraping_registry,
+            middleware_api=MiddlewareManager().middleware_api,
+            proxy_api=None,
+            session_api=session_pool.session_api,
+        )
+        sl.scheduler = SpiderScheduler(
+            max_running=concurrency,
+            engine_limits={engine: concurrency for engine in SpiderEngine},
+            domain_limit=concurrency,
+        )
+        pl = PipelineListener(queue, scraping_registry, batch_size=batch_size, worker_count=workers)
+
+        timer.reset()
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(sl.launch(), pl.listen())
+        finally:
+            await session_pool.close()
+        elapsed = time.perf_counter() - start
+
+        items_scraped = sum(sl.items_scraped.values())
+        return {
+            "config": {"spiders": spiders, "pages": pages, "concurrency": concurrency, "batch_size": batch_size, "workers": workers},
+            "elapsed_s": round(elapsed, 4),
+            "pages": timer.pages,
+            "items_scraped": items_scraped,
+            "items_saved": await BenchProduct.all().count(),
+            "pages_per_s": round(timer.pages / elapsed, 2),
+            "items_per_s": round(items_scraped / elapsed, 2),
+            "stages": timer.summary(),
+        }
+    finally:
+        for spider_asset in spider_assets:
+            module_cache.entries.pop(spider_asset.spider_name, None)
+            shutil.rmtree(spider_asset.module_dir_path(), ignore_errors=True)
+        await Tortoise.close_connections()
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_sweep(args:argparse.Namespace) -> list[dict]:
+    server = FixtureServer(args.products, latency=args.latency_ms / 1000)
+    await server.start()
+    results = []
+    try:
+        for concurrency in args.concurrency:
+            for batch_size in args.batch_sizes:
+                result = await run_once(
+                    server.base_url, args.db, args.spiders, args.pages, concurrency, batch_size, args.workers,
+                )
+                results.append(result)
+                print_result(result)
+    finally:
+        await server.stop()
+        parse_pool.close()
+    return results
+
+
+def print_result(result:dict):
+    config = result["config"]
+    stages = "  ".join(
+        f"{stage} {result['stages'][stage]['per_item_ms']:.3f}" for stage in STAGES if stage in result["stages"]
+    )
+    print(
+        f"concurrency={config['concurrency']:<3} batch={config['batch_size']:<4} "
+        f"{result['pages_per_s']:>9.1f} pages/s {result['items_per_s']:>10.1f} items/s  "
+        f"ms/item: {stages}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SpiderLauncher -> PipelineListener path")
+    parser.add_argument("--spiders", type=int, default=4, help="synthetic spiders per run")
+    parser.add_argument("--pages", type=int, default=10, help="listing pages per spider")
+    parser.add_argument("--products", type=int, default=100, help="products per listing page")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4], help="spiders running at once (swept)")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 50], help="PipelineListener batch sizes (swept)")
+    parser.add_argument("--workers", type=int, default=PIPELINE_WORKER_COUNT, help="PipelineWorker count")
+    parser.add_argument("--latency-ms", type=float, default=0, help="fixture server delay per page")
+    parser.add_argument("--db", default="sqlite://:memory:", help="Tortoise database URL")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="keep the scraping logs")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        for name in ("scraping", "scrapings"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+    results = asyncio.run(run_sweep(args))
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "created_at": datetime.now(tz=timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "params": {"spiders": args.spiders, "pages": args.pages, "products": args.products, "latency_ms": args.latency_ms},
+            "results": results,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()